@@ -0,0 +1,66 @@
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+ALBUM_ITEM_SELECTOR = "ul.article-album-view > li.item"
+
+# 앨범형 게시판(li.item)에서 모든 필드를 한 번의 스크립트 호출로 추출
+ALBUM_ITEMS_SCRIPT = """
+var items = document.querySelectorAll(arguments[0]);
+function text(item, selector) {
+    var el = item.querySelector(selector);
+    return el ? el.innerText : null;
+}
+return Array.prototype.map.call(items, function (item) {
+    var svg = item.querySelector("svg[aria-label]");
+    var link = item.querySelector("dl > dt.tit_area > a.tit");
+    return {
+        title: text(item, "dl > dt.tit_area > a.tit > span.tit_txt"),
+        price: text(item, "dl > dd.price > em"),
+        nickname: text(item, "dl > dd.nick_area span.nickname"),
+        date: text(item, "dl > dd.date_num > span.date"),
+        status: svg ? svg.getAttribute("aria-label") : null,
+        url: link ? link.href : null
+    };
+});
+"""
+
+
+def extract_article_id(url):
+    match = re.search(r'articles/(\d+)', url)
+    return int(match.group(1)) if match else None
+
+
+def menu_key(category_url):
+    """카테고리 URL에서 메뉴 단위 식별자 추출 (예: menu:339)"""
+    match = re.search(r'menus/(\d+)', category_url) or re.search(r'menuid=(\d+)', category_url)
+    return f"menu:{match.group(1)}" if match else category_url
+
+
+def build_album_page_url(category_url, page, size=20):
+    """카테고리 URL에 앨범형 페이지 파라미터(page, viewType=I, size)를 붙임"""
+    parts = urlsplit(category_url)
+    params = [(k, v) for k, v in parse_qsl(parts.query) if k not in ("page", "viewType", "size")]
+    params = [("page", page), ("viewType", "I"), ("size", size)] + params
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
+
+def make_album_row(raw, category_name):
+    """스크립트가 돌려준 원시 값을 기존 행 형식(빈 문자열 기본값)으로 변환"""
+    url = raw.get("url") or ""
+    return {
+        "category": category_name,
+        "status": raw.get("status") or "",
+        "title": (raw.get("title") or "").strip(),
+        "price": (raw.get("price") or "").strip(),
+        "nickname": (raw.get("nickname") or "").strip(),
+        "date": (raw.get("date") or "").strip(),
+        "url": url,
+        "article_id": extract_article_id(url)
+    }
+
+
+def extract_album_items(driver, category_name):
+    """execute_script 한 번으로 페이지의 모든 li.item 데이터를 추출"""
+    raw_items = driver.execute_script(ALBUM_ITEMS_SCRIPT, ALBUM_ITEM_SELECTOR) or []
+    print(f"상품 li 개수: {len(raw_items)}")  # 디버깅용
+    return [make_album_row(raw, category_name) for raw in raw_items]
@@ -0,0 +1,206 @@
+import os
+import re
+import json
+import time
+import argparse
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+from http_fetcher import AlbumHttpFetcher
+
+# 카페 프론트엔드(f-e)가 게시판 목록을 불러오는 JSON API (JOONGGO_API_BASE로 로컬 스텁 주소 지정 가능)
+DEFAULT_API_BASE = "https://apis.naver.com/cafe-web/cafe-boardlist-api/v1"
+API_BASE_ENV = "JOONGGO_API_BASE"
+# 앨범형 목록 한 페이지(size=20)와 같은 크기 (다르면 end_page와 체크포인트의 페이지 번호가 다른 범위를 가리킴)
+DEFAULT_PAGE_SIZE = 20
+ARTICLE_URL = "https://cafe.naver.com/f-e/cafes/{cafe_id}/articles/{article_id}?menuid={menu_id}"
+API_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": "https://cafe.naver.com/",
+}
+# productSale.saleStatus → 목록 화면의 aria-label과 같은 문구 (normalize의 상태 코드 규칙을 그대로 사용)
+SALE_STATUS_TEXT = {
+    "ON_SALE": "판매중",
+    "SELLING": "판매중",
+    "RESERVED": "예약중",
+    "RESERVATION": "예약중",
+    "SOLD_OUT": "판매완료",
+    "COMPLETED": "판매완료",
+}
+
+
+def parse_menu_url(category_url):
+    """카테고리 URL(.../cafes/<카페>/menus/<메뉴>)에서 (cafe_id, menu_id) 추출"""
+    match = re.search(r"cafes/(\d+)/menus/(\d+)", category_url)
+    if not match:
+        raise ValueError(f"카페/메뉴 ID를 찾을 수 없는 URL입니다: {category_url}")
+    return match.group(1), match.group(2)
+
+
+def recorded_name(menu_id, page):
+    return f"menu_{menu_id}_page_{page}.json"
+
+
+def _list_date(timestamp_ms, now):
+    """목록 화면과 같은 날짜 문구 (오늘 글은 "14:14", 그 외는 "2025.05.31.")"""
+    posted = datetime.fromtimestamp(timestamp_ms / 1000)
+    if posted.date() == now.date():
+        return posted.strftime("%H:%M")
+    return posted.strftime("%Y.%m.%d.")
+
+
+def map_article(entry, category_name, cafe_id, menu_id, now=None):
+    """API의 게시글 하나를 기존 행 형식(category, status, title, price, nickname, date, url, article_id)으로"""
+    item = entry.get("item", entry)
+    article_id = item.get("articleId")
+    if article_id is None:
+        # 광고/공지 배너 등 게시글이 아닌 항목
+        return None
+    sale = item.get("productSale") or {}
+    writer = item.get("writerInfo") or {}
+    cost = sale.get("cost")
+    timestamp = item.get("writeDateTimestamp")
+    return {
+        "category": category_name,
+        "status": SALE_STATUS_TEXT.get(sale.get("saleStatus"), sale.get("saleStatus") or ""),
+        "title": (item.get("subject") or "").strip(),
+        "price": f"{int(cost):,}원" if cost is not None else "",
+        "nickname": (writer.get("nickName") or item.get("writerNickname") or "").strip(),
+        "date": _list_date(timestamp, now or datetime.now()) if timestamp else "",
+        "url": ARTICLE_URL.format(cafe_id=cafe_id, article_id=article_id, menu_id=menu_id),
+        "article_id": int(article_id),
+    }
+
+
+def parse_article_list(data, category_name, cafe_id, menu_id, now=None):
+    """API 응답 JSON → 행 목록 (빈 목록이면 게시판 끝)"""
+    message = data.get("message")
+    # 오류 응답은 message가 문자열 (예: {"message": "Unauthorized"})
+    result = data.get("result") or (message.get("result") if isinstance(message, dict) else None) or {}
+    rows = []
+    for entry in result.get("articleList") or []:
+        row = map_article(entry, category_name, cafe_id, menu_id, now)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+class ArticleApiClient:
+    """
+    렌더링 없이 게시판 목록 JSON API를 메뉴 ID/페이지 단위로 받아 행으로 변환하는 백엔드
+    (AlbumHttpFetcher와 같은 fetch_page/close 형태라 http 백엔드 자리에 그대로 사용)
+    """
+
+    def __init__(self, base_url=None, page_size=DEFAULT_PAGE_SIZE, pool_size=10, timeout=10, record_dir=None):
+        self.base_url = (base_url or os.environ.get(API_BASE_ENV) or DEFAULT_API_BASE).rstrip("/")
+        self.page_size = page_size
+        self.record_dir = record_dir
+        self.http = AlbumHttpFetcher(pool_size=pool_size, timeout=timeout, headers=API_HEADERS)
+        self.session = self.http.session
+        self.timeout = timeout
+        if record_dir:
+            os.makedirs(record_dir, exist_ok=True)
+
+    def fetch_json(self, cafe_id, menu_id, page):
+        response = self.session.get(
+            f"{self.base_url}/cafes/{cafe_id}/menus/{menu_id}/articles",
+            params={"page": page, "pageSize": self.page_size, "sortBy": "TIME", "viewType": "I"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        if self.record_dir:
+            # 로컬 스텁(serve_recorded)에서 다시 재생할 수 있게 원본 응답 저장
+            with open(os.path.join(self.record_dir, recorded_name(menu_id, page)), "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        return data
+
+    def fetch_page(self, category_url, page, category_name):
+        """한 페이지를 받아 행 목록으로 반환"""
+        start_time = time.time()
+        cafe_id, menu_id = parse_menu_url(category_url)
+        rows = parse_article_list(self.fetch_json(cafe_id, menu_id, page), category_name, cafe_id, menu_id)
+        print(f"[API] 페이지 {page}: {len(rows)}건 (소요시간: {time.time() - start_time:.2f}초)")
+        return rows
+
+    def close(self):
+        self.http.close()
+
+
+def serve_recorded(directory, port=8765):
+    """
+    저장해 둔 응답(menu_<메뉴>_page_<페이지>.json)을 같은 경로로 돌려주는 로컬 스텁 서버.
+    없는 페이지는 빈 목록(게시판 끝)으로 응답. --api-base http://127.0.0.1:<port>로 사용.
+    """
+    empty = json.dumps({"result": {"articleList": []}}).encode("utf-8")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            match = re.search(r"/cafes/\d+/menus/(\d+)/articles$", parts.path)
+            if not match:
+                self.send_error(404)
+                return
+            page = dict(parse_qsl(parts.query)).get("page", "1")
+            path = os.path.join(directory, recorded_name(match.group(1), page))
+            body = empty
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    print(f"스텁 서버 시작: http://127.0.0.1:{server.server_address[1]} ({directory})")
+    return server
+
+
+if __name__ == "__main__":
+    from sinks import CsvSink, ROW_FIELDS
+
+    parser = argparse.ArgumentParser(description="게시판 목록 JSON API로 카테고리 수집 (또는 저장한 응답으로 스텁 서버 실행)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fetch = sub.add_parser("fetch", help="카테고리 목록을 API로 수집해 CSV로 저장")
+    fetch.add_argument("url", help="카테고리 URL (예: https://cafe.naver.com/f-e/cafes/10050146/menus/364)")
+    fetch.add_argument("--name", required=True, help="카테고리 이름")
+    fetch.add_argument("--pages", type=int, default=10)
+    fetch.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    fetch.add_argument("--api-base", default=None, help=f"API 주소 (기본: {API_BASE_ENV} 또는 {DEFAULT_API_BASE})")
+    fetch.add_argument("--record", default=None, help="받은 응답을 저장할 디렉터리 (스텁 서버용)")
+    fetch.add_argument("--output", required=True)
+    serve = sub.add_parser("serve", help="저장한 응답을 돌려주는 로컬 스텁 서버")
+    serve.add_argument("directory")
+    serve.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        server = serve_recorded(args.directory, args.port)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
+    else:
+        client = ArticleApiClient(args.api_base, page_size=args.page_size, record_dir=args.record)
+        sink = CsvSink(args.output, ROW_FIELDS)
+        start_time = time.time()
+        pages = 0
+        try:
+            for page in range(1, args.pages + 1):
+                rows = client.fetch_page(args.url, page, args.name)
+                if not rows:
+                    break
+                sink.write_rows(rows)
+                pages += 1
+        finally:
+            sink.close()
+            client.close()
+        elapsed = time.time() - start_time
+        print(f"✅ 저장 완료: {args.output} ({sink.rows_written}건, {pages}페이지, 초당 {pages / max(elapsed, 1e-9):.1f}페이지)")
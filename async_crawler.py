@@ -0,0 +1,129 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """초당 rate개 요청을 허용하는 토큰 버킷 (최대 burst개까지 몰아서 허용)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncPageCrawler:
+    """여러 카테고리의 목록 페이지를 동시에 요청하고, 결과는 카테고리별 페이지 순서대로 전달"""
+
+    def __init__(self, fetch_page, concurrency=8, per_host=None, rate=5.0, burst=None, retries=2):
+        # fetch_page(category_url, page, category_name) -> 행 목록 (동기 함수, 스레드에서 실행)
+        self.fetch_page = fetch_page
+        self.concurrency = concurrency
+        # 호스트당 동시 요청 수 (기본: concurrency, 모든 카테고리가 같은 호스트라 더 작으면 전체 동시성이 그만큼으로 제한됨)
+        self.per_host = per_host or concurrency
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+
+    def run(self, jobs, on_page):
+        """동기 코드에서 호출하는 진입점"""
+        return asyncio.run(self.crawl(jobs, on_page))
+
+    async def crawl(self, jobs, on_page):
+        """
+        jobs: [{"url", "name", "start_page", "end_page", "label"(행의 category 값, 없으면 name)}, ...]
+        on_page(job, page, rows): 페이지 순서대로 호출, False를 반환하면 해당 카테고리 중단
+        재시도까지 실패한 페이지가 있으면 그 앞 페이지까지만 전달하고 카테고리를 중단, 반환하는 state의 "failed_page"에 기록
+        """
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        bucket = TokenBucket(self.rate, self.burst)
+        host_limits = {}
+        states = [{
+            "next_page": job["start_page"],
+            "buffer": {},
+            "stopped": False,
+            "failed_page": None,
+        } for job in jobs]
+
+        # 카테고리 간 라운드로빈으로 작업 큐 구성
+        queue = asyncio.Queue()
+        page_lists = [list(range(job["start_page"], job["end_page"] + 1)) for job in jobs]
+        for i in range(max((len(pages) for pages in page_lists), default=0)):
+            for job_index, pages in enumerate(page_lists):
+                if i < len(pages):
+                    queue.put_nowait((job_index, pages[i]))
+
+        def deliver(job_index):
+            state = states[job_index]
+            while not state["stopped"] and state["next_page"] in state["buffer"]:
+                if state["failed_page"] is not None and state["next_page"] >= state["failed_page"]:
+                    # 실패한 페이지를 건너뛰고 뒤 페이지를 저장하면 체크포인트가 그 페이지를 지나가 버림
+                    state["stopped"] = True
+                    state["buffer"].clear()
+                    return
+                page = state["next_page"]
+                rows = state["buffer"].pop(page)
+                state["next_page"] += 1
+                if on_page(jobs[job_index], page, rows) is False:
+                    state["stopped"] = True
+                    state["buffer"].clear()
+
+        async def fetch(job, page):
+            host = urlsplit(job["url"]).netloc
+            limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+            for attempt in range(self.retries + 1):
+                async with limit:
+                    await bucket.acquire()
+                    try:
+                        return await loop.run_in_executor(
+                            executor, self.fetch_page, job["url"], page, job.get("label", job["name"])
+                        )
+                    except Exception as e:
+                        print(f"[{job['name']}] 페이지 {page} 요청 실패 ({attempt + 1}회): {e}")
+                if attempt < self.retries:
+                    await asyncio.sleep(2 ** attempt)
+            return None
+
+        async def worker():
+            while True:
+                try:
+                    job_index, page = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                state = states[job_index]
+                if state["stopped"] or (state["failed_page"] is not None and page > state["failed_page"]):
+                    continue
+                rows = await fetch(jobs[job_index], page)
+                if state["stopped"]:
+                    continue
+                if rows is None:
+                    print(f"[{jobs[job_index]['name']}] 페이지 {page} 수집 실패: 이 페이지 앞까지만 저장")
+                    state["failed_page"] = page if state["failed_page"] is None else min(state["failed_page"], page)
+                state["buffer"][page] = rows
+                deliver(job_index)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        finally:
+            executor.shutdown(wait=False)
+        total_pages = sum(state["next_page"] - job["start_page"] for job, state in zip(jobs, states))
+        print(f"비동기 크롤링 완료: {total_pages}페이지 (동시 요청: {self.concurrency}, 소요시간: {time.time() - start_time:.2f}초)")
+        return states
@@ -0,0 +1,98 @@
+import os
+import json
+import time
+import tempfile
+
+
+def output_offset(output_path):
+    """CSV는 파일 크기, Parquet 파티션 디렉터리는 그때까지 있던 part 파일 목록, SQLite는 없음(None)"""
+    if output_path.endswith(".db"):
+        # 트랜잭션으로 반영되고 재수집 시 upsert되므로 잘라낼 필요 없음
+        return None
+    if os.path.isdir(output_path):
+        return sorted(name for name in os.listdir(output_path) if name.endswith(".parquet"))
+    return os.path.getsize(output_path) if os.path.exists(output_path) else 0
+
+
+class CrawlCheckpoint:
+    """페이지 저장 직후 진행 상황을 원자적으로 기록하고, 중단된 실행을 이어갈 때 복원"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {"categories": {}, "updated": None}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.data = json.load(f)
+        return True
+
+    def get(self, key):
+        return self.data["categories"].get(key)
+
+    def _write(self):
+        self.data["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # 임시 파일에 쓰고 fsync 후 교체 → 중간에 죽어도 이전 체크포인트가 그대로 남음
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint_", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def record_page(self, key, page, output_path, article_ids, max_id=None):
+        """
+        flush된 행이 파일에 저장된 뒤 호출: 마지막 완료 페이지, 파일 크기(오프셋), 이번에 저장한 ID 기록.
+        이전 ID들은 체크포인트 다음에 인덱스에 들어가므로 인덱스에 아직 없을 수 있는 이번 묶음만 남김
+        """
+        entry = self.data["categories"].setdefault(key, {})
+        entry.update({
+            "last_page": page,
+            "output_path": output_path,
+            "offset": output_offset(output_path),
+            "pending_ids": sorted(set(article_ids)),
+            "rows": entry.get("rows", 0) + len(article_ids),
+            "max_id": max_id,
+            "done": False,
+        })
+        self._write()
+
+    def pending_ids(self, key):
+        """인덱스에 다시 넣어야 할 마지막 묶음의 ID (이전 형식의 seen_ids도 읽음)"""
+        entry = self.get(key) or {}
+        return entry.get("pending_ids", entry.get("seen_ids", []))
+
+    def mark_done(self, key):
+        entry = self.data["categories"].setdefault(key, {})
+        entry["done"] = True
+        self._write()
+
+    def restore_output(self, key):
+        """체크포인트 이후에 쓰인 부분(부분 저장된 행 포함)을 잘라내고 이어쓸 파일 경로 반환"""
+        entry = self.get(key)
+        if not entry or "output_path" not in entry:
+            return None
+        path = entry["output_path"]
+        if entry["offset"] is None:
+            return path
+        if os.path.isdir(path):
+            # Parquet 파티션: 기록된 part 파일 이후에 생긴 파일 삭제
+            for name in os.listdir(path):
+                if name not in entry["offset"]:
+                    os.remove(os.path.join(path, name))
+        elif os.path.exists(path) and os.path.getsize(path) > entry["offset"]:
+            os.truncate(path, entry["offset"])
+        return path
+
+    def clear(self):
+        self.data = {"categories": {}, "updated": None}
+        if os.path.exists(self.path):
+            os.remove(self.path)
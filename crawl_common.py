@@ -0,0 +1,466 @@
+# main.py / main_mobile.py / main_luxury.py가 함께 쓰는 앨범형 게시판 수집 루프 (스크립트별로는 설정만 다름)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+import time
+import os
+from driver_factory import create_chrome
+import argparse
+from datetime import datetime, timedelta
+from album import extract_article_id, extract_album_items, build_album_page_url, menu_key, ALBUM_ITEM_SELECTOR
+from waits import wait_for_selector, wait_stats
+from id_index import ArticleIdIndex
+from checkpoint import CrawlCheckpoint
+from listing_store import DEFAULT_STORE_PATH
+from normalize import normalize_rows, parse_stop_date
+from status_tracker import StatusTracker, append_events
+from lean_profile import LeanProfile
+from session_store import SessionStore, SessionError, login_with_session, DEFAULT_SESSION_PATH
+from sinks import open_sink, partition_dir, ROW_FIELDS, OUTPUT_FORMATS, PARQUET_ROOT
+
+STOP_DATE = "2025.05.31"
+DEFAULT_END_PAGE = 300
+
+def setup_driver(lean=None):
+    options = Options()
+    # options.add_argument('--headless')  # 창 안 띄우려면
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920x1080')
+    options.add_argument('user-agent=Mozilla/5.0')
+    if lean is not None:
+        # 차단 목록은 로그인 후 카테고리별로 적용 (로그인 화면은 그대로)
+        lean.configure_options(options)
+    # 드라이버 경로는 한 번 확인한 값을 재사용 (분할 수집 워커마다 버전 확인을 반복하지 않음)
+    driver = create_chrome(options)
+    return driver
+
+def load_existing_article_ids(pattern):
+    """article_id 인덱스를 열고, 새로 생기거나 바뀐 CSV 파일(pattern)의 ID만 인덱스에 반영"""
+    index = ArticleIdIndex()
+    index.import_csv_files(pattern)
+    print(f"총 {len(index)}개의 고유 ID 로드 완료")
+    return index
+
+def extract_album_list_data(driver, category_name, batch=True):
+    if batch:
+        # 한 번의 execute_script 호출로 전체 항목 추출 (실패 시 요소별 추출로 대체)
+        try:
+            return extract_album_items(driver, category_name)
+        except Exception as e:
+            print(f"스크립트 일괄 추출 실패, 요소별 추출로 전환: {e}")
+    items = driver.find_elements(By.CSS_SELECTOR, ALBUM_ITEM_SELECTOR)
+    print(f"상품 li 개수: {len(items)}")  # 디버깅용
+    results = []
+    for item in items:
+        try:
+            title = item.find_element(By.CSS_SELECTOR, "dl > dt.tit_area > a.tit > span.tit_txt").text.strip()
+        except:
+            title = ""
+        try:
+            price = item.find_element(By.CSS_SELECTOR, "dl > dd.price > em").text.strip()
+        except:
+            price = ""
+        try:
+            nickname = item.find_element(By.CSS_SELECTOR, "dl > dd.nick_area span.nickname").text.strip()
+        except:
+            nickname = ""
+        try:
+            date = item.find_element(By.CSS_SELECTOR, "dl > dd.date_num > span.date").text.strip()
+        except:
+            date = ""
+        try:
+            status = item.find_element(By.CSS_SELECTOR, "svg[aria-label]").get_attribute("aria-label")
+        except:
+            status = ""
+        try:
+            url = item.find_element(By.CSS_SELECTOR, "dl > dt.tit_area > a.tit").get_attribute("href")
+            article_id = extract_article_id(url)
+        except:
+            url = ""
+            article_id = None
+        results.append({
+            "category": category_name,
+            "status": status,
+            "title": title,
+            "price": price,
+            "nickname": nickname,
+            "date": date,
+            "url": url,
+            "article_id": article_id
+        })
+    return results
+
+def new_crawl_state(stop_date=STOP_DATE, high_water=None, checkpoint=None, key=None, flush_rows=200, fsync="close", output_format="csv", row_filter=None, tracker=None,
+                    output_columns=ROW_FIELDS, stop_inclusive=True):
+    return {
+        "all_results": [],
+        "header_written": False,  # True면 기존 파일에 이어쓰기
+        "stop": False,
+        "stop_date": stop_date,
+        "stop_at": parse_stop_date(stop_date),
+        # True면 중단 기준 날짜 당일 글부터 저장하지 않음, False면 당일 글까지 저장하고 그 이전에서 중단
+        "stop_inclusive": stop_inclusive,
+        "high_water": high_water,  # 증분 모드: 이전 실행에서 본 가장 큰 article_id
+        "max_id": None,
+        "checkpoint": checkpoint,
+        "key": key,
+        "sink": None,
+        "flush_rows": flush_rows,
+        "fsync": fsync,
+        "output_format": output_format,
+        "output_columns": output_columns,  # CSV에 쓰는 컬럼
+        "row_filter": row_filter,  # 크롤링 중에 적용할 KeywordFilter
+        "tracker": tracker,  # 판매 상태 전환을 기록할 StatusTracker
+        "unsynced": [],  # 파일에는 썼지만 아직 체크포인트/인덱스에 반영하지 않은 행
+        "last_page": None,
+    }
+
+def process_page_results(results, page, filename, state, existing_ids):
+    """한 페이지 결과를 걸러서 저장하고, 중단 기준을 만나면 state["stop"]을 설정"""
+    stop_date = state["stop_date"]
+    stop_at = state["stop_at"]
+    high_water = state["high_water"]
+    # 가격/날짜/상태를 정수 원, 절대 시각, 상태 코드로 (시각만 있는 날짜는 지금 기준 오늘)
+    normalize_rows(results, datetime.now())
+    if state["tracker"] is not None:
+        # 이미 수집한 글도 포함해 페이지 전체의 상태를 반영
+        events = state["tracker"].observe(results)
+        append_events(events)
+        if events:
+            print(f"페이지 {page}: 판매 상태 전환 {len(events)}건")
+    page_ids = {row.get("article_id") for row in results if row.get("article_id") is not None}
+    if page_ids:
+        state["max_id"] = max(page_ids | {state["max_id"] or 0})
+    # 아직 인덱스에 반영 전인(flush 대기 중인) 행도 이미 수집한 것으로 취급
+    known = existing_ids.known(page_ids) | (page_ids & {row["article_id"] for row in state["unsynced"]})
+    if page_ids and len(known) == len(page_ids):
+        state["stop"] = True
+        print(f"페이지 {page}의 게시글이 모두 이미 수집된 게시글입니다. 카테고리 조기 종료")
+    new_results = []
+    refreshed = []
+    for row in results:
+        article_id = row.get("article_id")
+        if article_id is None:
+            continue
+        if high_water is not None and article_id <= high_water:
+            state["stop"] = True
+            print(f"이전 실행의 기준 article_id({high_water})에 도달 (page {page})")
+            break
+        if article_id in known:
+            refreshed.append(row)
+            continue
+        posted_at = row.get("posted_at")
+        # 오늘 글("14:14")도 절대 시각으로 비교
+        if stop_at and posted_at and posted_at < (stop_at + timedelta(days=1) if state["stop_inclusive"] else stop_at):
+            state["stop"] = True
+            print(f"중단 기준 날짜({stop_date}) 도달: {row.get('date', '')} (page {page})")
+            break
+        new_results.append(row)
+    dropped = []
+    if state["row_filter"] is not None:
+        new_results, dropped = state["row_filter"].filter_rows(new_results)
+    state["all_results"].extend(new_results)
+    print(f"페이지 {page} 수집 완료: {len(results)}건 (저장: {len(new_results)}건, 중복 제외: {len(results) - len(new_results) - len(dropped)}건, 규칙 제외: {len(dropped)}건)")
+    if state["sink"] is None:
+        state["sink"] = open_sink(
+            state["output_format"], f"results/{filename}", state["output_columns"], append=state["header_written"],
+            flush_rows=state["flush_rows"], fsync=state["fsync"],
+        )
+        state["header_written"] = True
+    # 규칙으로 제외한 글도 인덱스에 넣어 다음 실행에서 다시 거르지 않도록 함
+    state["unsynced"].extend(new_results + dropped)
+    state["last_page"] = page
+    # SQLite 저장소는 이미 수집한 글도 넘겨서 DB에 있는 글만 상태/가격/last_seen 갱신
+    # (필터/중단 날짜로 저장하지 않은 글은 DB에 없으므로 갱신으로 새로 들어가지 않음)
+    if getattr(state["sink"], "upsert", False):
+        state["sink"].refresh_rows(refreshed)
+    if state["sink"].write_rows(new_results):
+        commit_saved_rows(state, existing_ids)
+    print(f"✅ 저장 완료: {state['sink'].path} (+{len(new_results)}건, 누적 {state['sink'].rows_written}건)")
+    return not state["stop"]
+
+def commit_saved_rows(state, existing_ids):
+    """flush된 행까지 체크포인트와 인덱스에 반영 (파일 → 체크포인트 → 인덱스 순서라 어디서 죽어도 재개 시 행이 빠지거나 중복되지 않음)"""
+    if state["checkpoint"] is not None:
+        state["checkpoint"].record_page(
+            state["key"], state["last_page"], state["sink"].path,
+            [row["article_id"] for row in state["unsynced"]], state["max_id"],
+        )
+    existing_ids.add_rows(state["unsynced"])
+    state["unsynced"] = []
+
+def finish_category(state, existing_ids):
+    """카테고리 수집이 끝나면 남은 행을 flush하고 파일을 닫음"""
+    if state["sink"] is None:
+        return
+    state["sink"].flush()
+    commit_saved_rows(state, existing_ids)
+    state["sink"].close()
+
+def crawl_category_album(driver, category_url, start_page, end_page, category_name, existing_ids, filename, fetcher=None, wait_timeout=10, state=None, lean=None):
+    state = state if state is not None else new_crawl_state()
+    if lean is not None and driver is not None:
+        lean.attach(driver, category_name)
+    for page in range(start_page, end_page + 1):
+        if state["stop"]:
+            break
+        if fetcher is not None:
+            # 브라우저 없이 HTTP로 목록 페이지 수집
+            results = fetcher.fetch_page(category_url, page, category_name)
+        else:
+            url = build_album_page_url(category_url, page)
+            driver.get(url)
+            # 고정 2초 대기 대신 목록 항목이 나타나는 즉시 추출
+            wait_for_selector(driver, ALBUM_ITEM_SELECTOR, wait_timeout, baseline=2)
+            results = extract_album_list_data(driver, category_name)
+            if lean is not None:
+                stats = lean.record_page(driver)
+                print(f"페이지 {page} 네트워크: 요청 {stats['loaded_requests']}건 ({stats['loaded_bytes'] / 1024:.0f}KB), "
+                      f"차단 {stats['blocked_requests']}건 (약 {stats['saved_bytes'] / 1024:.0f}KB 절약)")
+        process_page_results(results, page, filename, state, existing_ids)
+    finish_category(state, existing_ids)
+    print(f"이번 크롤링에서 {len(state['all_results'])}개의 게시글을 수집했습니다.")
+    if lean is not None and driver is not None:
+        print(f"네트워크 절약(누적): {lean.report()}")
+    return state["all_results"]
+
+def crawl_categories_async(fetcher, jobs, existing_ids, concurrency, rate, per_host=None):
+    """
+    HTTP 백엔드로 여러 카테고리 페이지를 동시에 요청 (저장은 카테고리별 페이지 순서대로).
+    재시도까지 실패한 페이지가 있는 카테고리의 key 목록 반환 (그 앞 페이지까지만 저장, --resume으로 이어서 수집)
+    """
+    from async_crawler import AsyncPageCrawler
+    for job in jobs:
+        job.setdefault("state", new_crawl_state())
+    page_crawler = AsyncPageCrawler(fetcher.fetch_page, concurrency=concurrency, per_host=per_host, rate=rate)
+    page_states = page_crawler.run(
+        jobs,
+        lambda job, page, rows: process_page_results(rows, page, job["filename"], job["state"], existing_ids),
+    )
+    failed = []
+    for job, page_state in zip(jobs, page_states):
+        finish_category(job["state"], existing_ids)
+        print(f"=== {job['name']} 카테고리: {len(job['state']['all_results'])}개 수집 ===")
+        if page_state["failed_page"] is not None:
+            failed.append(job["key"])
+            print(f"[{job['name']}] 페이지 {page_state['failed_page']} 수집 실패 (--resume으로 다시 실행하면 이 페이지부터 수집)")
+    return failed
+
+def crawl_category_sharded(job, args, cookies, existing_ids, lean_allowlist=None):
+    """
+    한 카테고리의 페이지 범위를 여러 프로세스로 나눠 수집하고, 구간 파일을 페이지 순서대로 process_page_results에 넘김
+    (중복/날짜/증분/필터/상태 추적 기준은 순차 수집과 같음). 수집하지 못한 구간이 있으면 False
+    """
+    from sharded_crawl import crawl_sharded
+    state = job['state']
+    complete = crawl_sharded(
+        job['url'], job['label'], job['start_page'], job['end_page'],
+        lambda page, rows: process_page_results(rows, page, job['filename'], state, existing_ids),
+        shards=args.shards, chunk_size=args.chunk_size, backend=args.backend,
+        cookies=cookies, wait_timeout=args.wait_timeout, resume=args.resume,
+        lean=args.lean, api_base=args.api_base, page_size=args.page_size, lean_allowlist=lean_allowlist,
+    )
+    finish_category(state, existing_ids)
+    print(f"=== {job['name']} 카테고리: {len(state['all_results'])}개 수집 ===")
+    return complete
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="중고나라 앨범형 게시판 크롤러")
+    parser.add_argument("--backend", choices=["browser", "http", "hybrid", "api"], default="browser",
+                        help="목록 페이지 수집 방식 (browser: Chrome, http: requests + lxml, "
+                             "hybrid: 브라우저로 로그인한 뒤 HTTP로 수집하고 파싱하지 못한 페이지만 브라우저로, "
+                             "api: 렌더링 없이 게시판 목록 JSON API)")
+    parser.add_argument("--api-base", default=None,
+                        help="api 백엔드의 API 주소 (기본: JOONGGO_API_BASE 환경 변수 또는 네이버 API, "
+                             "로컬 스텁: python article_api.py serve <응답 디렉터리>)")
+    parser.add_argument("--page-size", type=int, default=20,
+                        help="api 백엔드에서 한 번에 받을 게시글 수 (20이 아니면 end_page와 --resume의 페이지 번호가 "
+                             "앨범형 목록과 다른 범위를 가리킴)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="http/hybrid/api 백엔드에서 동시에 요청할 페이지 수 (1이면 순차 수집)")
+    parser.add_argument("--rate", type=float, default=5.0,
+                        help="초당 최대 요청 수 (동시 수집 시)")
+    parser.add_argument("--per-host", type=int, default=None,
+                        help="호스트당 최대 동시 요청 수 (기본: --concurrency와 같음)")
+    parser.add_argument("--wait-timeout", type=float, default=10,
+                        help="브라우저에서 목록 항목이 나타나길 기다리는 최대 시간(초)")
+    parser.add_argument("--delta", action="store_true",
+                        help="증분 수집: 카테고리별로 지난 실행의 가장 큰 article_id까지만 새 글 수집")
+    parser.add_argument("--stop-date", default=STOP_DATE,
+                        help="이 날짜(YYYY.MM.DD) 기준으로 수집 중단 (빈 문자열이면 사용 안 함)")
+    parser.add_argument("--resume", action="store_true",
+                        help="체크포인트에서 중단된 카테고리/페이지부터 이어서 수집")
+    parser.add_argument("--shards", type=int, default=1,
+                        help="한 카테고리의 페이지 범위를 나눠 수집할 프로세스 수 (각자 브라우저 사용, "
+                             "중단 날짜/증분/필터 기준은 전체 범위를 받은 뒤 페이지 순서대로 적용)")
+    parser.add_argument("--chunk-size", type=int, default=10,
+                        help="분할 수집 시 워커가 한 번에 가져가는 페이지 수")
+    parser.add_argument("--flush-rows", type=int, default=200,
+                        help="이 행 수마다 파일을 flush하고 체크포인트 기록")
+    parser.add_argument("--fsync", choices=["never", "flush", "close"], default="close",
+                        help="fsync 시점 (flush: 매 flush마다, close: 파일을 닫을 때만)")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="csv",
+                        help="저장 형식 (parquet: results/parquet 아래 카테고리/수집일 파티션, pyarrow 필요, "
+                             "sqlite: results/listings.db에 article_id 기준 upsert)")
+    parser.add_argument("--filter-rules", default=None,
+                        help="크롤링 중에 적용할 포함/제외 규칙 파일 (예: filter_rules.json)")
+    parser.add_argument("--track-status", action="store_true",
+                        help="글별 판매 상태를 추적해 전환 이벤트를 results/status_events.csv에 기록")
+    parser.add_argument("--lean", action="store_true",
+                        help="이미지/미디어/폰트/광고·통계 요청을 차단하는 가벼운 브라우저 프로필 사용")
+    parser.add_argument("--session", nargs="?", const=DEFAULT_SESSION_PATH, default=None,
+                        help="암호화해 저장한 로그인 세션 사용 (기본 경로: %(const)s, "
+                             "없거나 만료됐으면 수동 로그인 후 다시 저장, 무인 실행이면 종료)")
+    return parser.parse_args()
+
+def run(categories, index_pattern, checkpoint_path, output_columns=ROW_FIELDS, stop_inclusive=True, replace_slash=False,
+        lean_allowlist=None, end_page=DEFAULT_END_PAGE):
+    """
+    카테고리 목록을 명령행 옵션대로 수집. 스크립트별 설정:
+    index_pattern(기존 결과 CSV), checkpoint_path, output_columns(CSV 컬럼), stop_inclusive(중단 날짜 당일 제외 여부),
+    replace_slash(행의 category에서 '/'를 '_'로), lean_allowlist(--lean 카테고리별 허용 목록), end_page(카테고리에 없을 때)
+    """
+    args = parse_args()
+    driver = None
+    fetcher = None
+    lean = LeanProfile(allowlist=lean_allowlist) if args.lean else None
+    login_cookies = None
+    if args.backend in ("http", "api"):
+        if args.backend == "api":
+            from article_api import ArticleApiClient
+            fetcher = ArticleApiClient(args.api_base, page_size=args.page_size, pool_size=max(10, args.concurrency))
+        else:
+            from http_fetcher import AlbumHttpFetcher
+            fetcher = AlbumHttpFetcher(pool_size=max(10, args.concurrency))
+        if args.session:
+            try:
+                store = SessionStore(args.session)
+                store.restore_session(fetcher.session)
+                login_cookies = store.cookies()
+            except SessionError as e:
+                raise SystemExit(f"❌ {e}")
+    else:
+        driver = setup_driver(lean)
+        if args.session:
+            login_with_session(driver, SessionStore(args.session))
+        else:
+            driver.get("https://nid.naver.com/nidlogin.login")
+            input("네이버 로그인을 완료하고 엔터를 누르세요...")
+        if args.backend == "hybrid":
+            # 브라우저는 로그인에만 쓰고 닫음 (HTTP로 파싱하지 못한 페이지가 나오면 그때 하나만 다시 띄움)
+            from hybrid_fetcher import HybridFetcher
+            fetcher = HybridFetcher.from_driver(driver, pool_size=max(10, args.concurrency),
+                                                wait_timeout=args.wait_timeout, lean=args.lean, lean_allowlist=lean_allowlist)
+            login_cookies = fetcher.cookies
+            driver.quit()
+            driver = None
+
+    
+    # 기존 article_id 로드
+    existing_ids = load_existing_article_ids(index_pattern)
+    print(f"기존 article_id 수: {len(existing_ids)}")
+    
+    # 체크포인트 (--resume이 아니면 새로 시작)
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    if args.resume:
+        if checkpoint.load():
+            print(f"체크포인트 로드: {checkpoint_path} (마지막 기록: {checkpoint.data['updated']})")
+        else:
+            print("체크포인트가 없어 처음부터 수집합니다.")
+    else:
+        checkpoint.clear()
+    
+    row_filter = None
+    if args.filter_rules:
+        from filtering_postprocessing import KeywordFilter
+        row_filter = KeywordFilter.load(args.filter_rules)
+        print(f"필터 규칙 로드: {args.filter_rules}")
+    
+    tracker = StatusTracker() if args.track_status else None
+    
+    # 각 카테고리별 수집 범위와 저장 파일 준비
+    jobs = []
+    for category in categories:
+        key = menu_key(category['url'])
+        high_water = existing_ids.get_high_water(key) if args.delta else None
+        start_page = 1
+        category_end_page = category.get('end_page', end_page)
+        # 슬래시를 밑줄로 변환
+        safe_name = category['name'].replace('/', '_')
+        state = new_crawl_state(args.stop_date, high_water, checkpoint, key, args.flush_rows, args.fsync, args.output_format, row_filter, tracker,
+                                output_columns, stop_inclusive)
+        entry = checkpoint.get(key)
+        if entry and entry.get("done"):
+            print(f"[{category['name']}] 이전 실행에서 완료된 카테고리라 건너뜁니다.")
+            continue
+        if entry and entry.get("output_path"):
+            # 마지막으로 저장을 마친 페이지 다음부터 같은 파일에 이어쓰기
+            path = checkpoint.restore_output(key)
+            filename = os.path.relpath(path, "results")
+            start_page = entry["last_page"] + 1
+            # 앞서 저장한 ID는 인덱스에 있고, 체크포인트 직후 죽었으면 마지막 묶음만 빠져 있을 수 있음
+            existing_ids.add_many(checkpoint.pending_ids(key), category=category['name'])
+            state["header_written"] = os.path.isfile(path) and os.path.getsize(path) > 0
+            state["max_id"] = entry.get("max_id")
+            print(f"[{category['name']}] {start_page}페이지부터 이어서 수집 (기존 {entry.get('rows', len(checkpoint.pending_ids(key)))}건)")
+        elif args.output_format == "sqlite":
+            # 모든 카테고리를 한 DB에 저장 (article_id 기준 upsert라 기존 데이터는 그대로 둠)
+            filename = os.path.basename(DEFAULT_STORE_PATH)
+        elif args.output_format == "parquet":
+            # 카테고리/수집일 파티션에 part 파일을 추가 (이미 수집한 글은 인덱스로 걸러지므로 기존 파일은 그대로 둠)
+            filename = os.path.relpath(partition_dir(PARQUET_ROOT, category['name']), "results")
+        else:
+            if args.delta:
+                filename = f"{safe_name}_delta_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+            else:
+                filename = f"{safe_name}_{start_page}-{category_end_page}.csv"
+            path = f"results/{filename}"
+            # 이전 실행의 결과 파일은 지우지 않고 이어씀 (그 글들은 인덱스에 있어 다시 수집되지 않으므로 지우면 데이터가 사라짐)
+            state["header_written"] = os.path.isfile(path) and os.path.getsize(path) > 0
+        jobs.append({
+            "url": category['url'],
+            "name": category['name'],
+            # 행의 category 값
+            "label": safe_name if replace_slash else category['name'],
+            "start_page": start_page,
+            "end_page": category_end_page,
+            "filename": filename,
+            "key": key,
+            "state": state,
+        })
+        if high_water is not None:
+            print(f"[{category['name']}] 증분 수집 기준 article_id: {high_water}")
+
+    # 끝까지 수집한 카테고리 (실패한 페이지가 있으면 그 뒤의 글을 아직 못 봤으므로 증분 기준을 올리지 않음)
+    completed = []
+    if fetcher is not None and args.concurrency > 1:
+        failed = crawl_categories_async(fetcher, jobs, existing_ids, args.concurrency, args.rate, args.per_host)
+        for job in jobs:
+            if job['key'] not in failed:
+                checkpoint.mark_done(job['key'])
+                completed.append(job)
+    else:
+        # 각 카테고리별로 크롤링
+        for job in jobs:
+            print(f"\n=== {job['name']} 카테고리 크롤링 시작 ===")
+            if args.shards > 1:
+                if not crawl_category_sharded(job, args, driver.get_cookies() if driver is not None else login_cookies, existing_ids,
+                                              lean_allowlist):
+                    # 완료로 표시하지 않아 --resume 시 저장한 마지막 페이지 다음부터 수집
+                    continue
+            else:
+                crawl_category_album(driver, job['url'], job['start_page'], job['end_page'], job['label'], existing_ids, job['filename'], fetcher=fetcher, wait_timeout=args.wait_timeout, state=job['state'], lean=lean)
+            checkpoint.mark_done(job['key'])
+            completed.append(job)
+            print(f"=== {job['name']} 카테고리 크롤링 완료 ===\n")
+    
+    # 다음 증분 실행을 위해 카테고리별 기준 article_id 갱신
+    for job in completed:
+        existing_ids.set_high_water(job['key'], job['state']['max_id'])
+    existing_ids.close()
+    if tracker is not None:
+        tracker.close()
+    if driver is not None:
+        print(f"대기 통계: {wait_stats.report()}")
+        driver.quit()
+    if fetcher is not None:
+        fetcher.close()
@@ -1,28 +1,47 @@
 import time
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from tqdm import tqdm
-import tempfile
-import os
 import logging
 from datetime import datetime
 import concurrent.futures
 from queue import Queue
 import threading
+from driver_pool import DriverPool
+from driver_factory import create_chrome
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from waits import WaitStats, wait_for_selector
+from sinks import CsvSink
+
+ARTICLE_SELECTOR = "tr:not(.board-notice) a.article"
+POST_COLUMNS = ['category', 'title', 'price', 'status', 'date', 'nickname', 'url']
+
+def build_list_page_url(category_url, page):
+    """게시판 목록 URL에 페이지 번호를 지정 (ArticleList.nhn은 search.page, 그 외는 page)"""
+    parts = urlsplit(category_url)
+    page_param = "search.page" if "ArticleList" in parts.path else "page"
+    params = [(k, v) for k, v in parse_qsl(parts.query) if k != page_param]
+    params.append((page_param, page))
+    return urlunsplit(parts._replace(query=urlencode(params)))
 
 class JoonggoCrawler:
-    def __init__(self, headless=False, max_workers=4):
+    def __init__(self, headless=False, max_workers=4, pool_size=None, wait_timeout=10, lean=None):
         self.setup_logger()
+        self.headless = headless
+        self.wait_timeout = wait_timeout
+        self.lean = lean  # LeanProfile (이미지/폰트/광고 요청 차단)
+        self.wait_stats = WaitStats()
         self.setup_driver(headless)
         self.max_workers = max_workers
+        # 상세 페이지용 드라이버 풀 (워커마다 독립 세션)
+        self.driver_pool = DriverPool(
+            lambda: self.create_driver(headless),
+            size=pool_size or max_workers,
+            logger=self.logger,
+            warm_url="https://cafe.naver.com/",
+        )
         self.data_queue = Queue()
-        self.save_lock = threading.Lock()
         self.batch_size = 10  # 데이터 저장 배치 크기
         
     def setup_logger(self):
@@ -49,6 +68,10 @@ class JoonggoCrawler:
         self.logger.addHandler(console_handler)
 
     def setup_driver(self, headless):
+        self.driver = self.create_driver(headless)
+        self.wait = WebDriverWait(self.driver, self.wait_timeout)
+
+    def create_driver(self, headless):
         start_time = time.time()
         self.logger.info("WebDriver 설정 시작")
         
@@ -62,138 +85,150 @@ class JoonggoCrawler:
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-popup-blocking')
         
-        # 임시 프로필 디렉토리 사용
-        temp_dir = os.path.join(tempfile.gettempdir(), 'chrome_profile')
-        os.makedirs(temp_dir, exist_ok=True)
-        chrome_options.add_argument(f'--user-data-dir={temp_dir}')
         chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        if self.lean is not None:
+            self.lean.configure_options(chrome_options)
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 10)
+        # 드라이버 경로는 한 번만 확인하고, 인스턴스별 임시 프로필 사용 (여러 브라우저 동시 실행 시 충돌 방지)
+        driver = create_chrome(chrome_options)
+        if self.lean is not None:
+            self.lean.attach(driver)
         
         self.logger.info(f"WebDriver 설정 완료 (소요시간: {time.time() - start_time:.2f}초)")
+        return driver
 
-    def switch_to_iframe(self):
+    def switch_to_iframe(self, driver=None, baseline=None):
         start_time = time.time()
+        driver = driver or self.driver
         try:
-            iframe = self.wait.until(
-                EC.presence_of_element_located((By.ID, "cafe_main"))
+            iframe = wait_for_selector(
+                driver, "cafe_main", self.wait_timeout, by=By.ID, baseline=baseline, stats=self.wait_stats
             )
-            self.driver.switch_to.frame(iframe)
+            if iframe is None:
+                raise TimeoutError(f"{self.wait_timeout}초 안에 iframe이 나타나지 않음")
+            driver.switch_to.frame(iframe)
             self.logger.info(f"iframe 전환 성공 (소요시간: {time.time() - start_time:.2f}초)")
             return True
         except Exception as e:
             self.logger.error(f"iframe 전환 실패: {e} (소요시간: {time.time() - start_time:.2f}초)")
             return False
 
-    def get_post_urls(self, category_url, max_pages=1, last_url=None):
-        start_time = time.time()
-        self.logger.info(f"URL 수집 시작 (최대 {max_pages}페이지)")
-        
-        self.driver.get(category_url)
-        time.sleep(2)
-        if not self.switch_to_iframe():
-            return []
-            
-        post_urls = []
-        found_last_url = False if last_url else True
-        
-        for page in range(1, max_pages + 1):
+    def wait_for_article(self, driver=None):
+        """상세 페이지(iframe 안)의 제목이 나타날 때까지 대기"""
+        driver = driver or self.driver
+        return wait_for_selector(driver, "h3.title_text", self.wait_timeout, stats=self.wait_stats) is not None
+
+    def get_page_post_urls(self, category_url, page, driver=None, retries=2):
+        """목록 URL로 해당 페이지에 바로 접속해 게시글 URL 수집 (실패 시 재시도, 끝내 실패하면 None)"""
+        driver = driver or self.driver
+        page_url = build_list_page_url(category_url, page)
+        for attempt in range(retries + 1):
             page_start_time = time.time()
             try:
                 self.logger.info(f"페이지 {page} 처리 시작")
-                
-                # 페이지 로딩 대기
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "tr:not(.board-notice) a.article"))
+                driver.get(page_url)
+                # 카페 프레임 안에서 열리면 iframe으로 전환, 목록 페이지 단독으로 열리면 그대로 진행
+                # (get() 직후에는 둘 다 없을 수 있어 먼저 나타나는 쪽을 기다림)
+                first = wait_for_selector(
+                    driver, f"iframe#cafe_main, {ARTICLE_SELECTOR}", self.wait_timeout, baseline=2, stats=self.wait_stats
                 )
-                time.sleep(2)
+                if first is None:
+                    raise TimeoutError(f"{self.wait_timeout}초 안에 iframe도 게시글 목록도 나타나지 않음")
+                if first.get_attribute("id") == "cafe_main":
+                    if not self.switch_to_iframe(driver):
+                        raise TimeoutError("iframe 전환 실패")
+                
+                # 페이지 로딩 대기 (게시글 목록이 나타나는 즉시 진행)
+                if wait_for_selector(driver, ARTICLE_SELECTOR, self.wait_timeout, baseline=2, stats=self.wait_stats) is None:
+                    raise TimeoutError(f"{self.wait_timeout}초 안에 게시글 목록이 나타나지 않음")
                 
                 # 공지 제외
-                articles = self.driver.find_elements(By.CSS_SELECTOR, "tr:not(.board-notice) a.article")
+                articles = driver.find_elements(By.CSS_SELECTOR, ARTICLE_SELECTOR)
+                urls = [url for url in (article.get_attribute('href') for article in articles) if url]
                 self.logger.info(f"페이지 {page} 게시글 수: {len(articles)}")
-                
-                for article in articles:
-                    url = article.get_attribute('href')
-                    if url:
-                        if not found_last_url:
-                            if url == last_url:
-                                found_last_url = True
-                                continue
-                            continue
-                        post_urls.append(url)
-                
-                if not found_last_url:
-                    self.logger.info(f"페이지 {page}에서 마지막 URL을 찾지 못했습니다.")
-                
-                # 다음 페이지로 이동
-                if page < max_pages:
-                    try:
-                        # 10의 배수 페이지에서는 다음 버튼 클릭
-                        if page % 10 == 0:
-                            next_btn = self.driver.find_element(By.CSS_SELECTOR, "a.pgR")
-                            next_btn.click()
-                            time.sleep(3)
-                            # 다음 페이지 그룹의 첫 페이지(11, 21, 31...)로 이동
-                            page_btn = self.driver.find_element(By.XPATH, f"//a[text()='{page + 1}']")
-                            page_btn.click()
-                        else:
-                            # 그 외에는 숫자 버튼 직접 클릭
-                            page_btn = self.driver.find_element(By.XPATH, f"//a[text()='{page + 1}']")
-                            page_btn.click()
-                            
-                        # 페이지 로딩 대기
-                        time.sleep(3)
-                        
-                    except Exception as e:
-                        self.logger.error(f"페이지 {page}에서 {page + 1}로 이동 실패: {e}")
-                        break
-                    
                 self.logger.info(f"페이지 {page} 처리 완료 (소요시간: {time.time() - page_start_time:.2f}초)")
-                    
+                return urls
             except Exception as e:
-                self.logger.error(f"페이지 {page} 처리 중 오류: {e}")
-                break
+                self.logger.error(f"페이지 {page} 처리 중 오류 ({attempt + 1}/{retries + 1}회): {e}")
+        return None
+
+    def get_post_urls(self, category_url, max_pages=1, last_url=None, pages=None, parallel=False):
+        """
+        목록 페이지를 URL로 직접 열어 게시글 URL 수집.
+        pages를 주면 원하는 페이지만 원하는 순서로 수집하고 (중단 지점부터 재개 가능),
+        parallel=True면 드라이버 풀로 여러 페이지를 동시에 연다. 실패한 페이지는 건너뛰고 self.failed_pages에 기록.
+        """
+        start_time = time.time()
+        pages = list(pages) if pages is not None else list(range(1, max_pages + 1))
+        self.logger.info(f"URL 수집 시작 ({len(pages)}페이지)")
+        
+        if parallel:
+            def fetch(page):
+                with self.driver_pool.lease() as driver:
+                    return self.get_page_post_urls(category_url, page, driver)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.driver_pool.size) as executor:
+                page_results = list(executor.map(fetch, pages))
+        else:
+            page_results = [self.get_page_post_urls(category_url, page) for page in pages]
+        
+        self.failed_pages = [page for page, urls in zip(pages, page_results) if urls is None]
+        if self.failed_pages:
+            self.logger.error(f"수집 실패 페이지: {self.failed_pages}")
+            
+        post_urls = []
+        found_last_url = False if last_url else True
+        
+        for page, urls in zip(pages, page_results):
+            for url in urls or []:
+                if not found_last_url:
+                    if url == last_url:
+                        found_last_url = True
+                    continue
+                post_urls.append(url)
+            
+            if not found_last_url:
+                self.logger.info(f"페이지 {page}에서 마지막 URL을 찾지 못했습니다.")
                 
         self.logger.info(f"URL 수집 완료 (총 {len(post_urls)}개 URL, 소요시간: {time.time() - start_time:.2f}초)")
         return post_urls
 
-    def extract_post_data(self, url):
+    def extract_post_data(self, url, driver=None):
         start_time = time.time()
+        driver = driver or self.driver
         try:
-            self.driver.get(url)
-            time.sleep(2)
-            if not self.switch_to_iframe():
+            driver.get(url)
+            if not self.switch_to_iframe(driver, baseline=2):
                 return None
                 
             # 제목
-            title = self.wait.until(
+            title = WebDriverWait(driver, self.wait_timeout).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "h3.title_text"))
             ).text
             # 가격
             try:
-                price = self.driver.find_element(By.CSS_SELECTOR, "div.ProductPrice strong.cost").text
+                price = driver.find_element(By.CSS_SELECTOR, "div.ProductPrice strong.cost").text
             except:
                 price = "가격 정보 없음"
             # 판매여부
             try:
-                status = self.driver.find_element(By.CSS_SELECTOR, "em.SaleLabel").text
+                status = driver.find_element(By.CSS_SELECTOR, "em.SaleLabel").text
             except:
                 status = "판매중"
             # 닉네임
             try:
-                nickname = self.driver.find_element(By.CSS_SELECTOR, "div.nick_box button.nickname").text
+                nickname = driver.find_element(By.CSS_SELECTOR, "div.nick_box button.nickname").text
             except:
                 nickname = "닉네임 없음"
             # 날짜
             try:
-                date = self.driver.find_element(By.CSS_SELECTOR, "div.article_info span.date").text
+                date = driver.find_element(By.CSS_SELECTOR, "div.article_info span.date").text
             except:
                 date = "날짜 정보 없음"
             category = "여성패션"
             
+            if self.lean is not None:
+                self.lean.record_page(driver)
             self.logger.info(f"상품 데이터 추출 완료: {title} (소요시간: {time.time() - start_time:.2f}초)")
             
             return {
@@ -209,61 +244,69 @@ class JoonggoCrawler:
             self.logger.error(f"게시글 데이터 추출 실패 ({url}): {e} (소요시간: {time.time() - start_time:.2f}초)")
             return None
 
-    def save_batch_to_csv(self, output_file, batch_data):
-        """배치 데이터를 CSV 파일에 저장"""
-        with self.save_lock:
-            df = pd.DataFrame(batch_data)
-            df.to_csv(output_file, mode='a', header=False, index=False, encoding='utf-8-sig')
-
-    def process_url_batch(self, urls, output_file):
-        """URL 배치를 처리하고 결과를 저장"""
+    def process_url_batch(self, urls, sink):
+        """URL 배치를 처리하고 결과를 저장 (URL마다 풀에서 드라이버를 빌려 사용), 저장한 행 목록 반환"""
+        saved = []
         batch_data = []
         for url in urls:
-            post_data = self.extract_post_data(url)
+            with self.driver_pool.lease() as driver:
+                post_data = self.extract_post_data(url, driver)
             if post_data:
                 batch_data.append(post_data)
                 if len(batch_data) >= self.batch_size:
-                    self.save_batch_to_csv(output_file, batch_data)
+                    sink.write_rows(batch_data)
+                    saved.extend(batch_data)
                     batch_data = []
         
         # 남은 데이터 저장
         if batch_data:
-            self.save_batch_to_csv(output_file, batch_data)
+            sink.write_rows(batch_data)
+            saved.extend(batch_data)
+        return saved
 
-    def crawl_category(self, category_url, max_pages=1, last_url=None):
+    def crawl_category(self, category_url, max_pages=1, last_url=None, pages=None):
         start_time = time.time()
         self.logger.info(f"카테고리 크롤링 시작: {category_url}")
         if last_url:
             self.logger.info(f"마지막 크롤링 URL 이후부터 시작: {last_url}")
             
-        post_urls = self.get_post_urls(category_url, max_pages, last_url)
+        # 목록을 모으는 동안 상세 페이지용 드라이버들을 미리 띄워 둠
+        warmup = threading.Thread(target=self.driver_pool.start, daemon=True)
+        warmup.start()
+        post_urls = self.get_post_urls(category_url, max_pages, last_url, pages=pages)
         self.logger.info(f"수집된 게시글 URL 수: {len(post_urls)}")
         
-        # CSV 파일 초기 생성
+        # CSV 파일 초기 생성 (크롤링 동안 파일 핸들 하나로 이어쓰기)
         output_file = f"joonggo_data_{int(time.time())}.csv"
-        df = pd.DataFrame(columns=['category', 'title', 'price', 'status', 'date', 'nickname', 'url'])
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        sink = CsvSink(output_file, POST_COLUMNS, flush_rows=self.batch_size)
         self.logger.info(f"CSV 파일 생성됨: {output_file}")
         
         # URL을 워커 수에 맞게 분배
-        urls_per_worker = len(post_urls) // self.max_workers
+        urls_per_worker = max(1, -(-len(post_urls) // self.max_workers))
         url_batches = [post_urls[i:i + urls_per_worker] for i in range(0, len(post_urls), urls_per_worker)]
         
         # 병렬 처리 시작
-        self.logger.info(f"병렬 처리 시작 (워커 수: {self.max_workers})")
+        self.logger.info(f"병렬 처리 시작 (워커 수: {self.max_workers}, 드라이버 풀 크기: {self.driver_pool.size})")
+        warmup.join()
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(self.process_url_batch, batch, output_file) for batch in url_batches]
+            futures = [executor.submit(self.process_url_batch, batch, sink) for batch in url_batches]
             concurrent.futures.wait(futures)
+        sink.close()
+        # 결과는 파일을 다시 읽지 않고 배치별로 저장한 행을 URL 순서대로 모음
+        results = [row for future in futures for row in future.result()]
         
-        # 수집된 데이터 수 계산
-        df = pd.read_csv(output_file, encoding='utf-8-sig')
-        total_posts = len(df)
+        # 수집된 데이터 수 (파일을 다시 읽지 않고 저장소가 센 값 사용)
+        total_posts = sink.rows_written
         
+        self.logger.info(f"대기 통계: {self.wait_stats.report()}")
+        if self.lean is not None:
+            self.logger.info(f"네트워크 절약: {self.lean.report()}")
         self.logger.info(f"크롤링 완료! 총 {total_posts}개의 상품이 수집되었습니다. (총 소요시간: {time.time() - start_time:.2f}초)")
         if total_posts > 0:
             self.logger.info(f"마지막으로 크롤링한 URL: {post_urls[-1]}")
-        return df.to_dict('records')
+        return results
 
     def close(self):
         self.logger.info("WebDriver 종료")
+        self.driver_pool.close()
         self.driver.quit() 
\ No newline at end of file
@@ -1,25 +1,155 @@
 import pandas as pd
 import glob
 import os
+import math
+import shutil
+import argparse
+import tempfile
+from sinks import CsvSink
 
 # 결과 파일 패턴 (필요시 수정)
 file_pattern = "results/여성패션_의류_*.csv"
 output_file = "results/여성패션_의류_통합.csv"
 
+CHUNK_SIZE = 50000
+# 입력 합계가 이 크기를 넘으면 article_id 해시로 나눈 임시 파일에서 파티션별로 중복 제거
+PARTITION_BYTES = 512 * 1024 * 1024
+
+
+def read_chunks(path, chunksize):
+    """CSV를 청크 단위로 읽고 article_id를 정수(없으면 <NA>)로 맞춤"""
+    for chunk in pd.read_csv(path, chunksize=chunksize, encoding="utf-8-sig", dtype=str, keep_default_na=False):
+        chunk["article_id"] = pd.to_numeric(chunk["article_id"], errors="coerce").astype("Int64")
+        yield chunk
+
+
+def to_rows(chunk, columns):
+    chunk = chunk.reindex(columns=columns).astype(object)
+    return chunk.where(chunk.notna(), None).to_dict("records")
+
+
+class DedupStats:
+    """파일별로 읽은 행 / 처음 본 글 / 중복 / 마지막으로 본 글 수 집계"""
+
+    def __init__(self, files):
+        self.files = files
+        self.rows = [0] * len(files)
+        self.first_seen = [0] * len(files)
+        self.duplicates = [0] * len(files)
+        self.last_seen = [0] * len(files)
+        self.missing_id = 0
+
+    def add_last_seen(self, seen):
+        for file_idx in seen.values():
+            self.last_seen[file_idx] += 1
+
+    def report(self):
+        for i, path in enumerate(self.files):
+            print(f"  {os.path.basename(path)}: {self.rows[i]}행, 처음 본 글 {self.first_seen[i]}건, "
+                  f"중복 {self.duplicates[i]}건, 마지막으로 본 글 {self.last_seen[i]}건")
+        if self.missing_id:
+            print(f"  article_id가 없어 제외한 행: {self.missing_id}건")
+
+
+def dedup_chunk(chunk, file_idx, seen, stats):
+    """seen(article_id → 마지막으로 본 파일 번호)을 갱신하고 처음 본 행만 반환"""
+    keep = []
+    for i, article_id in enumerate(chunk["article_id"]):
+        if article_id is pd.NA:
+            stats.missing_id += 1
+            continue
+        article_id = int(article_id)
+        if article_id in seen:
+            stats.duplicates[file_idx] += 1
+        else:
+            stats.first_seen[file_idx] += 1
+            keep.append(i)
+        seen[article_id] = file_idx
+    return chunk.iloc[keep]
+
+
+def dedup_in_memory(files, sink, columns, stats, chunksize):
+    seen = {}
+    for file_idx, path in enumerate(files):
+        for chunk in read_chunks(path, chunksize):
+            stats.rows[file_idx] += len(chunk)
+            sink.write_rows(to_rows(dedup_chunk(chunk, file_idx, seen, stats), columns))
+    stats.add_last_seen(seen)
+
+
+def dedup_partitioned(files, sink, columns, stats, chunksize, partitions):
+    """article_id % partitions로 임시 파일에 나눠 쓴 뒤 파티션마다 따로 중복 제거 (출력은 파티션 순서)"""
+    tmp_dir = tempfile.mkdtemp(prefix="dedup_", dir=os.path.dirname(sink.path) or ".")
+    try:
+        parts = [
+            CsvSink(os.path.join(tmp_dir, f"part_{p:04d}.csv"), columns + ["_file_idx"], flush_rows=chunksize)
+            for p in range(partitions)
+        ]
+        for file_idx, path in enumerate(files):
+            for chunk in read_chunks(path, chunksize):
+                stats.rows[file_idx] += len(chunk)
+                missing = chunk["article_id"].isna()
+                stats.missing_id += int(missing.sum())
+                chunk = chunk[~missing].assign(_file_idx=file_idx)
+                for p, group in chunk.groupby(chunk["article_id"] % partitions):
+                    parts[p].write_rows(to_rows(group, columns + ["_file_idx"]))
+        for part in parts:
+            part.close()
+
+        # 파일 번호 순으로 나눠 썼으므로 파티션 안에서도 먼저 읽힌 행이 가장 이른 파일의 행
+        for part in parts:
+            seen = {}
+            for chunk in read_chunks(part.path, chunksize):
+                for file_idx, group in chunk.groupby(chunk["_file_idx"].astype(int), sort=False):
+                    sink.write_rows(to_rows(dedup_chunk(group, file_idx, seen, stats), columns))
+            stats.add_last_seen(seen)
+            os.remove(part.path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def deduplicate(files, output_path, chunksize=CHUNK_SIZE, partitions=None):
+    """파일들을 청크 단위로 읽어 article_id 기준 첫 행만 output_path에 이어씀 (메모리는 article_id 집합 크기만큼)"""
+    columns = pd.read_csv(files[0], nrows=0, encoding="utf-8-sig").columns.tolist()
+    auto = partitions is None
+    if auto:
+        total_bytes = sum(os.path.getsize(path) for path in files)
+        partitions = max(1, math.ceil(total_bytes / PARTITION_BYTES))
+    stats = DedupStats(files)
+    sink = CsvSink(output_path, columns, flush_rows=chunksize)
+    try:
+        if partitions > 1:
+            reason = "입력이 커서 " if auto else ""
+            print(f"{reason}article_id 기준 {partitions}개 파티션으로 나눠 처리합니다.")
+            dedup_partitioned(files, sink, columns, stats, chunksize, partitions)
+        else:
+            dedup_in_memory(files, sink, columns, stats, chunksize)
+    finally:
+        sink.close()
+    return sink.rows_written, stats
+
+
 def main():
-    files = glob.glob(file_pattern)
+    parser = argparse.ArgumentParser(description="결과 CSV들을 article_id 기준으로 통합/중복 제거")
+    parser.add_argument("--pattern", default=file_pattern)
+    parser.add_argument("--output", default=output_file)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--partitions", type=int, default=None,
+                        help="해시 파티션 수 (기본: 입력 크기로 자동 결정, 1이면 메모리에서 한 번에)")
+    args = parser.parse_args()
+
+    # 통합 결과 파일 자신은 입력에서 제외, 오래된 파일부터 읽어 처음 수집된 행을 남김
+    files = sorted((f for f in glob.glob(args.pattern) if os.path.abspath(f) != os.path.abspath(args.output)),
+                   key=os.path.getmtime)
     if not files:
         print("통합할 파일이 없습니다.")
         return
     print(f"통합 대상 파일: {files}")
-    dfs = [pd.read_csv(f) for f in files]
-    df_all = pd.concat(dfs, ignore_index=True)
-    before = len(df_all)
-    # article_id 기준 중복 제거
-    df_all = df_all.drop_duplicates(subset=["article_id"])
-    after = len(df_all)
-    df_all.to_csv(output_file, index=False, encoding="utf-8-sig")
-    print(f"✅ 통합 및 중복제거 완료: {output_file} ({after}건, 중복 {before-after}건 제거)")
+    after, stats = deduplicate(files, args.output, args.chunk_size, args.partitions)
+    stats.report()
+    # 읽은 행 - 저장한 행에는 article_id가 없는 행도 섞이므로 따로 집계한 값으로 보고
+    missing = f", article_id 없는 행 {stats.missing_id}건 제외" if stats.missing_id else ""
+    print(f"✅ 통합 및 중복제거 완료: {args.output} ({after}건, 중복 {sum(stats.duplicates)}건 제거{missing})")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,83 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+import threading
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service
+
+# ChromeDriverManager().install() 결과를 재사용하는 기간 (크롬이 자동 업데이트되면 세션 생성 실패 시 다시 확인)
+DRIVER_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "joonggo", "chromedriver.json")
+DRIVER_CACHE_TTL = 24 * 3600
+
+_driver_path = None
+_driver_lock = threading.Lock()
+
+
+def _read_cached_path():
+    try:
+        with open(DRIVER_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - cached.get("resolved_at", 0) > DRIVER_CACHE_TTL or not os.path.exists(cached.get("path", "")):
+        return None
+    return cached["path"]
+
+
+def chromedriver_path(refresh=False):
+    """
+    chromedriver 경로를 한 번만 확인해서 재사용 (프로세스 안에서는 메모리, 프로세스 간에는 파일 캐시).
+    CHROMEDRIVER_PATH 환경 변수가 있으면 그 경로 사용.
+    """
+    global _driver_path
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        return os.environ["CHROMEDRIVER_PATH"]
+    with _driver_lock:
+        if _driver_path and not refresh:
+            return _driver_path
+        path = None if refresh else _read_cached_path()
+        if path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+            os.makedirs(os.path.dirname(DRIVER_CACHE_PATH), exist_ok=True)
+            tmp_path = DRIVER_CACHE_PATH + f".{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"path": path, "resolved_at": time.time()}, f)
+            os.replace(tmp_path, DRIVER_CACHE_PATH)
+        _driver_path = path
+        return path
+
+
+def create_chrome(options, isolated_profile=True):
+    """
+    캐시된 chromedriver로 Chrome 실행. isolated_profile이면 인스턴스마다 임시 프로필 디렉터리를 만들고
+    quit() 때 삭제 (여러 브라우저를 동시에 띄워도 프로필이 겹치지 않음)
+    """
+    profile_dir = None
+    if isolated_profile:
+        profile_dir = tempfile.mkdtemp(prefix="chrome_profile_")
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    try:
+        try:
+            driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+        except SessionNotCreatedException:
+            # 크롬이 업데이트되어 캐시된 드라이버 버전이 맞지 않는 경우 한 번만 다시 확인
+            driver = webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=options)
+    except Exception:
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+
+    if profile_dir:
+        quit_driver = driver.quit
+
+        def quit():
+            try:
+                quit_driver()
+            finally:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+        driver.quit = quit
+    return driver
@@ -0,0 +1,142 @@
+import time
+import logging
+import threading
+import concurrent.futures
+from queue import Queue, Empty
+from contextlib import contextmanager
+
+
+class DriverPool:
+    """워커별로 독립된 WebDriver 세션을 빌려주고 돌려받는 풀"""
+
+    def __init__(self, factory, size=4, logger=None, checkout_timeout=300, warm_url=None):
+        self.factory = factory
+        self.warm_url = warm_url  # 미리 띄운 드라이버가 한 번 열어둘 주소 (DNS/TLS/캐시 예열)
+        self.size = max(1, size)
+        self.logger = logger or logging.getLogger('JoonggoCrawler')
+        self.checkout_timeout = checkout_timeout
+        self._idle = Queue()
+        self._all = []
+        self._count = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self):
+        """풀 크기만큼 드라이버를 동시에 미리 생성 (브라우저 기동 시간이 크기만큼 쌓이지 않도록)"""
+        start_time = time.time()
+        with self._lock:
+            missing = self.size - self._count
+        if missing <= 0:
+            return self
+        with concurrent.futures.ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._create_warm) for _ in range(missing)]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    driver = future.result()
+                except Exception as e:
+                    self.logger.error(f"드라이버 미리 생성 실패: {e}")
+                    continue
+                if driver is not None:
+                    self._idle.put(driver)
+        self.logger.info(f"드라이버 풀 준비 완료 (크기: {self.size}, 소요시간: {time.time() - start_time:.2f}초)")
+        return self
+
+    def _create_warm(self):
+        driver = self._create()
+        if driver is not None and self.warm_url:
+            try:
+                driver.get(self.warm_url)
+            except Exception as e:
+                self.logger.warning(f"드라이버 예열 실패 ({self.warm_url}): {e}")
+        return driver
+
+    def _create(self):
+        """풀 크기 안에서 새 세션 생성 (가득 찼으면 None)"""
+        with self._lock:
+            if self._count >= self.size:
+                return None
+            self._count += 1
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._count -= 1
+            raise
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+                self._count -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def is_healthy(self, driver):
+        """세션이 살아있는지 가벼운 스크립트 호출로 확인"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def checkout(self):
+        if self._closed:
+            raise RuntimeError("이미 종료된 드라이버 풀입니다")
+        deadline = time.time() + self.checkout_timeout
+        driver = None
+        while driver is None:
+            try:
+                driver = self._idle.get_nowait()
+            except Empty:
+                driver = self._create()
+            if driver is None:
+                if time.time() > deadline:
+                    raise TimeoutError(f"{self.checkout_timeout}초 동안 사용 가능한 드라이버가 없습니다")
+                try:
+                    driver = self._idle.get(timeout=0.5)
+                except Empty:
+                    pass
+
+        if not self.is_healthy(driver):
+            self.logger.warning("비정상 드라이버 감지, 새 세션으로 교체")
+            self._discard(driver)
+            return self.checkout()
+        return driver
+
+    def checkin(self, driver, healthy=True):
+        if self._closed or not healthy:
+            # 빈 자리는 다음 checkout 때 새 세션으로 채워짐
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def lease(self):
+        """with 블록 동안 드라이버 하나를 독점 사용"""
+        driver = self.checkout()
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = self.is_healthy(driver)
+            raise
+        finally:
+            self.checkin(driver, healthy)
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+            self._count = 0
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.logger.info(f"드라이버 풀 종료 ({len(drivers)}개 세션)")
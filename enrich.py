@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import sqlite3
+import argparse
+import concurrent.futures
+import pandas as pd
+from normalize import Status, status_codes
+from sinks import CsvSink
+
+DEFAULT_CACHE_PATH = "results/article_cache.db"
+ARTICLE_URL = "https://cafe.naver.com/f-e/cafes/10050146/articles/{article_id}"
+DETAIL_FIELDS = ["article_id", "title", "price", "status", "nickname", "date", "location", "image_count", "body", "url"]
+
+# 상태별로 다시 확인할 때까지의 시간(초), None이면 다시 가져오지 않음 (판매완료 글은 바뀌지 않음)
+DEFAULT_TTL = {
+    Status.SOLD: None,
+    Status.RESERVED: 12 * 3600,
+    Status.SELLING: 24 * 3600,
+    Status.UNKNOWN: 24 * 3600,
+}
+# 가져오기에 실패(삭제/권한 없음 등)한 글을 다시 시도하기까지의 시간(초)
+FAILED_TTL = 6 * 3600
+
+# 상세 페이지(iframe 안)의 필드를 한 번의 스크립트 호출로 추출
+DETAIL_SCRIPT = """
+function text(selector) {
+    var el = document.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+}
+var body = document.querySelector("div.se-main-container, div.ContentRenderer");
+return {
+    title: text("h3.title_text"),
+    price: text("div.ProductPrice strong.cost"),
+    status: text("em.SaleLabel"),
+    nickname: text("div.nick_box button.nickname"),
+    date: text("div.article_info span.date"),
+    location: text("div.ProductDetailInfo .location, div.trade_region, span.region"),
+    image_count: body ? body.querySelectorAll("img.se-image-resource, img").length : 0,
+    body: body ? body.innerText.trim() : null
+};
+"""
+
+
+class ArticleCache:
+    """상세 페이지 추출 결과를 article_id별로 저장하고, 다시 가져올 때가 된 글을 골라냄"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=None, failed_ttl=FAILED_TTL):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.ttl = dict(DEFAULT_TTL, **(ttl or {}))
+        self.failed_ttl = failed_ttl
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " article_id INTEGER PRIMARY KEY,"
+            " data TEXT,"  # 실패한 경우 NULL
+            " status_code INTEGER,"
+            " fetched_at REAL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    def _select(self, columns, article_ids):
+        ids = [int(i) for i in article_ids]
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            yield from self.conn.execute(
+                f"SELECT article_id, {columns} FROM articles WHERE article_id IN ({placeholders})", chunk
+            )
+
+    def due(self, article_ids, now=None):
+        """캐시에 없거나 신선도 기준이 지난 article_id 목록 (입력 순서 유지)"""
+        now = now or time.time()
+        fresh = set()
+        for article_id, has_data, status_code, fetched_at in self._select("data IS NOT NULL, status_code, fetched_at", article_ids):
+            ttl = self.ttl.get(Status(status_code or 0)) if has_data else self.failed_ttl
+            if ttl is None or now - fetched_at < ttl:
+                fresh.add(article_id)
+        return [int(i) for i in article_ids if int(i) not in fresh]
+
+    def get_many(self, article_ids):
+        return {
+            article_id: json.loads(data)
+            for article_id, data in self._select("data", article_ids) if data is not None
+        }
+
+    def put_many(self, items):
+        """items: (article_id, 상세 dict 또는 실패 시 None) 목록을 한 트랜잭션으로 저장"""
+        now = time.time()
+        params = []
+        for article_id, data in items:
+            status_code = None
+            if data is not None:
+                status_code = int(status_codes(pd.Series([data.get("status")])).iloc[0])
+            params.append((int(article_id), None if data is None else json.dumps(data, ensure_ascii=False), status_code, now))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO articles (article_id, data, status_code, fetched_at) VALUES (?, ?, ?, ?)",
+                params,
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+class DetailEnricher:
+    """앨범 목록에서 얻은 article_id의 상세 페이지를 드라이버 풀로 병렬 수집하고 캐시에 저장"""
+
+    def __init__(self, crawler, cache, workers=None):
+        self.crawler = crawler
+        self.cache = cache
+        self.workers = workers or crawler.max_workers
+        self.logger = crawler.logger
+
+    def fetch_detail(self, article_id, url=None):
+        url = url or ARTICLE_URL.format(article_id=article_id)
+        start_time = time.time()
+        with self.crawler.driver_pool.lease() as driver:
+            try:
+                driver.get(url)
+                if not self.crawler.switch_to_iframe(driver, baseline=2):
+                    return None
+                if not self.crawler.wait_for_article(driver):
+                    return None
+                detail = driver.execute_script(DETAIL_SCRIPT)
+            except Exception as e:
+                self.logger.error(f"상세 페이지 추출 실패 ({url}): {e} (소요시간: {time.time() - start_time:.2f}초)")
+                return None
+        detail.update({"article_id": int(article_id), "url": url})
+        self.logger.info(f"상세 페이지 추출 완료: {detail.get('title')} (소요시간: {time.time() - start_time:.2f}초)")
+        return detail
+
+    def fetch_many(self, article_ids, urls=None, batch_size=50):
+        """캐시 신선도와 상관없이 상세 페이지를 병렬로 가져와 캐시에 저장 → {article_id: 상세 dict 또는 None}"""
+        urls = urls or {}
+        results = {}
+        self.crawler.driver_pool.start()
+        done = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.fetch_detail, i, urls.get(i)): i for i in article_ids}
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+                done.append((futures[future], results[futures[future]]))
+                # SQLite 연결은 이 스레드에서만 사용
+                if len(done) >= batch_size:
+                    self.cache.put_many(done)
+                    done = []
+        self.cache.put_many(done)
+        return results
+
+    def enrich(self, article_ids, urls=None, batch_size=50):
+        """다시 가져올 때가 된 글만 수집하고, 요청한 모든 글의 상세 정보를 캐시에서 반환"""
+        article_ids = list(dict.fromkeys(int(i) for i in article_ids))
+        urls = urls or {}
+        due = self.cache.due(article_ids)
+        self.logger.info(f"상세 수집 대상: {len(due)}건 (캐시 사용: {len(article_ids) - len(due)}건)")
+        if due:
+            self.fetch_many(due, urls, batch_size)
+        details = self.cache.get_many(article_ids)
+        return [details[i] for i in article_ids if i in details]
+
+
+def load_article_ids(paths, chunksize=100000):
+    """
+    결과 CSV들에서 article_id와 url을 읽음 (url이 없으면 article_id로 만든 주소 사용).
+    article_id 컬럼이 없는 파일(main_mobile/main_luxury 결과 등)은 경고하고 건너뜀
+    """
+    urls = {}
+    for path in paths:
+        header = pd.read_csv(path, nrows=0, encoding="utf-8-sig").columns
+        if "article_id" not in header:
+            print(f"⚠️ article_id 컬럼이 없어 건너뜀: {path}")
+            continue
+        for chunk in pd.read_csv(path, usecols=lambda c: c in ("article_id", "url"), chunksize=chunksize,
+                                 encoding="utf-8-sig", dtype=str, keep_default_na=False):
+            ids = pd.to_numeric(chunk["article_id"], errors="coerce")
+            chunk_urls = chunk["url"] if "url" in chunk.columns else pd.Series("", index=chunk.index)
+            for article_id, url in zip(ids, chunk_urls):
+                if pd.notna(article_id):
+                    urls.setdefault(int(article_id), url or None)
+    return urls
+
+
+if __name__ == "__main__":
+    from crawler import JoonggoCrawler
+    from session_store import SessionStore, login_with_session, apply_to_driver, LOGIN_URL, DEFAULT_SESSION_PATH
+
+    parser = argparse.ArgumentParser(description="앨범 목록 결과의 article_id로 상세 페이지 정보(본문, 지역, 이미지 수) 수집")
+    parser.add_argument("files", nargs="+", help="article_id 컬럼이 있는 결과 CSV")
+    parser.add_argument("--output", required=True, help="상세 정보를 저장할 CSV")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--session", nargs="?", const=DEFAULT_SESSION_PATH, default=None,
+                        help="저장된 로그인 세션 사용 (python session_store.py login으로 먼저 저장, 없으면 수동 로그인)")
+    args = parser.parse_args()
+
+    urls = load_article_ids(args.files)
+    if not urls:
+        raise SystemExit("❌ 수집할 article_id가 없습니다. article_id 컬럼이 있는 결과 CSV를 지정하세요.")
+    crawler = JoonggoCrawler(headless=args.headless, max_workers=args.workers)
+    cache = ArticleCache(args.cache)
+    try:
+        # 상세 페이지는 회원 공개 글이 많아 로그인한 세션의 쿠키를 풀의 모든 드라이버에 주입
+        if args.session:
+            login_with_session(crawler.driver, SessionStore(args.session))
+        else:
+            crawler.driver.get(LOGIN_URL)
+            input("네이버 로그인을 완료하고 엔터를 누르세요...")
+        cookies = crawler.driver.get_cookies()
+        create_driver = crawler.driver_pool.factory
+
+        def create_logged_in_driver():
+            driver = create_driver()
+            apply_to_driver(driver, cookies)
+            return driver
+
+        crawler.driver_pool.factory = create_logged_in_driver
+        details = DetailEnricher(crawler, cache).enrich(list(urls), urls)
+    finally:
+        cache.close()
+        crawler.close()
+    sink = CsvSink(args.output, DETAIL_FIELDS)
+    sink.write_rows(details)
+    sink.close()
+    print(f"✅ 상세 정보 저장 완료: {args.output} ({sink.rows_written}건)")
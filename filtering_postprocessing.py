@@ -1,22 +1,140 @@
+import re
+import os
+import json
+import argparse
+import warnings
 import pandas as pd
+from sinks import CsvSink
 
-# CSV 파일 경로
+# CSV 파일 경로 (인자를 주지 않았을 때 기본값)
 input_file = "results/중고폰_모바일_중고폰_추천_1-313.csv"
 output_file = "results/중고폰_모바일_중고폰_추천_0531.csv"
+RULES_PATH = "filter_rules.json"
+CHUNK_SIZE = 50000
 
-# CSV 로드 (utf-8-sig 인코딩)
-df = pd.read_csv(input_file, encoding="utf-8-sig")
 
-# "매입" 단어가 포함된 행 찾기
-mask = df.applymap(lambda x: "매입" in str(x)).any(axis=1)
+def compile_patterns(keywords, regexes):
+    """키워드(그대로 일치)와 정규식을 하나의 정규식으로 묶음 (행마다 한 번만 훑음)"""
+    parts = [re.escape(k) for k in sorted(set(keywords), key=len, reverse=True)]
+    parts += [f"(?:{r})" for r in regexes]
+    return re.compile("|".join(parts)) if parts else None
 
-# "매입"이 포함된 행 삭제
-filtered_df = df[~mask].reset_index(drop=True)
 
-# 필터링된 데이터프레임 저장
-filtered_df.to_csv(output_file, index=False, encoding="utf-8-sig")
+class RuleSet:
+    """한 카테고리에 적용할 포함/제외 규칙"""
 
-# 결과 출력
-print(f"원본 데이터: {len(df)}행")
-print(f"필터링 후 데이터: {len(filtered_df)}행")
-print(f"제거된 '매입' 관련 게시글: {len(df) - len(filtered_df)}행")
+    def __init__(self, rule):
+        self.columns = rule.get("columns", ["title"])
+        self.exclude = compile_patterns(rule.get("exclude_keywords", []), rule.get("exclude_regex", []))
+        self.include = compile_patterns(rule.get("include_keywords", []), rule.get("include_regex", []))
+
+    def text(self, df):
+        columns = [c for c in self.columns if c in df.columns]
+        if not columns:
+            return pd.Series("", index=df.index)
+        text = df[columns[0]].fillna("").astype(str)
+        for column in columns[1:]:
+            text = text + "\n" + df[column].fillna("").astype(str)
+        return text
+
+    def keep_mask(self, df):
+        text = self.text(df)
+        keep = pd.Series(True, index=df.index)
+        with warnings.catch_warnings():
+            # 규칙의 정규식에 그룹이 있어도 일치 여부만 보므로 str.contains 경고는 여기서만 무시
+            warnings.filterwarnings("ignore", "This pattern is interpreted as a regular expression", UserWarning)
+            if self.exclude is not None:
+                keep &= ~text.str.contains(self.exclude, regex=True)
+            if self.include is not None:
+                keep &= text.str.contains(self.include, regex=True)
+        return keep
+
+
+class KeywordFilter:
+    """
+    filter_rules.json의 규칙으로 게시글을 거름.
+    "default" 규칙에 카테고리 이름이 가장 길게 일치하는 접두어 규칙의 목록을 더해서 사용.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.rule_sets = {}
+
+    @classmethod
+    def load(cls, path=RULES_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def rule_set(self, category):
+        category = category or ""
+        if category not in self.rule_sets:
+            rule = dict(self.rules.get("default", {}))
+            prefixes = [k for k in self.rules if k != "default" and category.startswith(k)]
+            if prefixes:
+                extra = self.rules[max(prefixes, key=len)]
+                for key, value in extra.items():
+                    rule[key] = value if key == "columns" else rule.get(key, []) + value
+            self.rule_sets[category] = RuleSet(rule)
+        return self.rule_sets[category]
+
+    def keep_mask(self, df, category=None):
+        """남길 행이면 True인 마스크 (category가 없으면 행의 category 컬럼별로 규칙 적용)"""
+        if category is not None or "category" not in df.columns:
+            return self.rule_set(category).keep_mask(df)
+        keep = pd.Series(True, index=df.index)
+        for name, group in df.groupby(df["category"].fillna(""), sort=False):
+            keep.loc[group.index] = self.rule_set(name).keep_mask(group)
+        return keep
+
+    def filter_rows(self, rows, category=None):
+        """크롤링 중 한 페이지 결과(dict 목록)를 거름 → (남길 행, 제외된 행)"""
+        if not rows:
+            return rows, []
+        keep = self.keep_mask(pd.DataFrame(rows), category).tolist()
+        return [r for r, k in zip(rows, keep) if k], [r for r, k in zip(rows, keep) if not k]
+
+
+def filter_file(keyword_filter, input_path, output_path, category=None, chunksize=CHUNK_SIZE):
+    """CSV를 청크 단위로 읽어 걸러진 행만 이어씀 → (원본 행 수, 남은 행 수)"""
+    sink = None
+    total = 0
+    for chunk in pd.read_csv(input_path, chunksize=chunksize, encoding="utf-8-sig", dtype=str, keep_default_na=False):
+        if sink is None:
+            sink = CsvSink(output_path, chunk.columns.tolist(), flush_rows=chunksize)
+        total += len(chunk)
+        sink.write_rows(chunk[keyword_filter.keep_mask(chunk, category)].to_dict("records"))
+    if sink is None:
+        return 0, 0
+    sink.close()
+    return total, sink.rows_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="filter_rules.json 규칙으로 매입/스팸/업자 게시글 제거")
+    parser.add_argument("files", nargs="*", help="거를 CSV 파일들 (없으면 기본 파일 하나)")
+    parser.add_argument("--rules", default=RULES_PATH)
+    parser.add_argument("--category", default=None, help="모든 행에 이 카테고리 규칙 적용 (기본: 행의 category 값)")
+    parser.add_argument("--output", default=None, help="파일이 하나일 때 저장 경로")
+    parser.add_argument("--suffix", default="_filtered", help="여러 파일일 때 저장 파일 이름에 붙일 접미사")
+    args = parser.parse_args()
+
+    keyword_filter = KeywordFilter.load(args.rules)
+    files = args.files or [input_file]
+    for path in files:
+        if args.output and len(files) == 1:
+            output_path = args.output
+        elif not args.files:
+            output_path = output_file
+        else:
+            base, ext = os.path.splitext(path)
+            output_path = f"{base}{args.suffix}{ext}"
+        total, kept = filter_file(keyword_filter, path, output_path, args.category)
+
+        # 결과 출력
+        print(f"[{path}] → {output_path}")
+        print(f"원본 데이터: {total}행")
+        print(f"필터링 후 데이터: {kept}행")
+        print(f"제거된 게시글: {total - kept}행")
+
+if __name__ == "__main__":
+    main()
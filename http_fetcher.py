@@ -0,0 +1,89 @@
+import time
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from album import build_album_page_url, make_album_row, ALBUM_ITEM_SELECTOR
+
+# 미리 컴파일한 CSS 선택자 (페이지마다 다시 파싱하지 않음)
+ITEM_SELECTOR = CSSSelector(ALBUM_ITEM_SELECTOR)
+TITLE_SELECTOR = CSSSelector("dl > dt.tit_area > a.tit > span.tit_txt")
+PRICE_SELECTOR = CSSSelector("dl > dd.price > em")
+NICKNAME_SELECTOR = CSSSelector("dl > dd.nick_area span.nickname")
+DATE_SELECTOR = CSSSelector("dl > dd.date_num > span.date")
+STATUS_SELECTOR = CSSSelector("svg[aria-label]")
+LINK_SELECTOR = CSSSelector("dl > dt.tit_area > a.tit")
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+
+def _first_text(item, selector):
+    found = selector(item)
+    if not found:
+        return None
+    # innerText처럼 연속 공백을 하나로 정리
+    return " ".join(found[0].text_content().split())
+
+
+def parse_album_html(page_html, category_name, base_url=""):
+    """앨범형 목록 HTML을 extract_album_list_data와 같은 행 형식으로 변환"""
+    if not page_html or not page_html.strip():
+        return []
+    doc = lxml_html.fromstring(page_html)
+    rows = []
+    for item in ITEM_SELECTOR(doc):
+        status = STATUS_SELECTOR(item)
+        link = LINK_SELECTOR(item)
+        href = link[0].get("href") if link else None
+        rows.append(make_album_row({
+            "title": _first_text(item, TITLE_SELECTOR),
+            "price": _first_text(item, PRICE_SELECTOR),
+            "nickname": _first_text(item, NICKNAME_SELECTOR),
+            "date": _first_text(item, DATE_SELECTOR),
+            "status": status[0].get("aria-label") if status else None,
+            "url": urljoin(base_url, href) if href else None,
+        }, category_name))
+    return rows
+
+
+class AlbumHttpFetcher:
+    """브라우저 없이 keep-alive HTTP 세션으로 앨범형 목록 페이지를 가져오는 백엔드"""
+
+    def __init__(self, session=None, pool_size=10, timeout=10, retries=3, headers=None):
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch_html(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def fetch_page(self, category_url, page, category_name, size=20):
+        """한 페이지를 받아 행 목록으로 반환"""
+        start_time = time.time()
+        url = build_album_page_url(category_url, page, size)
+        rows = parse_album_html(self.fetch_html(url), category_name, base_url=url)
+        print(f"[HTTP] 페이지 {page}: {len(rows)}건 (소요시간: {time.time() - start_time:.2f}초)")
+        return rows
+
+    def close(self):
+        self.session.close()
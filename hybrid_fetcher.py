@@ -0,0 +1,89 @@
+import time
+import threading
+from http_fetcher import AlbumHttpFetcher, DEFAULT_HEADERS
+from session_store import apply_to_session
+
+# HTTP로 연속해서 이만큼 파싱에 실패하면 그 카테고리는 처음부터 브라우저로 수집
+MAX_HTTP_MISSES = 5
+
+
+class HybridFetcher:
+    """
+    로그인한 브라우저의 쿠키/user-agent를 keep-alive HTTP 세션으로 넘겨받아 목록 페이지를 HTTP로 수집하고,
+    HTTP로 가져오거나 파싱하지 못한 페이지만 브라우저로 다시 수집 (브라우저는 필요할 때 한 개만 띄움)
+    """
+
+    def __init__(self, cookies, user_agent=None, pool_size=10, wait_timeout=10, lean=False, lean_allowlist=None):
+        self.cookies = cookies
+        headers = None
+        if user_agent:
+            headers = dict(DEFAULT_HEADERS, **{"User-Agent": user_agent})
+        self.http = AlbumHttpFetcher(pool_size=pool_size, headers=headers)
+        apply_to_session(self.http.session, cookies)
+        self.session = self.http.session
+        self.wait_timeout = wait_timeout
+        self.lean = lean
+        self.lean_allowlist = lean_allowlist
+        self.stats = {"http": 0, "browser": 0}
+        self._misses = {}  # 카테고리별 연속 HTTP 실패 수
+        self._browser = None
+        self._lock = threading.Lock()  # 동시 수집 시 브라우저는 한 번에 한 페이지만
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        """로그인한 브라우저의 쿠키와 user-agent로 생성 (이후 브라우저는 닫아도 됨)"""
+        return cls(driver.get_cookies(), driver.execute_script("return navigator.userAgent"), **kwargs)
+
+    def _fetch_http(self, category_url, page, category_name):
+        try:
+            rows = self.http.fetch_page(category_url, page, category_name)
+        except Exception as e:
+            print(f"[HTTP] 페이지 {page} 요청 실패, 브라우저로 전환: {e}")
+            return None
+        # 항목이 없거나 article_id를 하나도 못 읽으면 HTML 구조가 달라진 것으로 보고 브라우저로 확인
+        if not rows or all(row.get("article_id") is None for row in rows):
+            return None
+        return rows
+
+    def _fetch_browser(self, category_url, page, category_name):
+        with self._lock:
+            if self._browser is None:
+                from sharded_crawl import open_page_fetcher
+                print("HTTP로 수집하지 못한 페이지가 있어 브라우저를 엽니다.")
+                self._browser = open_page_fetcher("browser", self.cookies, self.wait_timeout, self.lean,
+                                                  lean_allowlist=self.lean_allowlist)
+            start_time = time.time()
+            rows = self._browser[0](category_url, page, category_name)
+        print(f"[브라우저] 페이지 {page}: {len(rows)}건 (소요시간: {time.time() - start_time:.2f}초)")
+        return rows
+
+    def fetch_page(self, category_url, page, category_name):
+        """HTTP로 먼저 시도하고, 실패하면 브라우저로 같은 페이지 수집 (빈 페이지는 브라우저로 확인해야 게시판 끝으로 판단)"""
+        rows = None
+        if self._misses.get(category_url, 0) < MAX_HTTP_MISSES:
+            rows = self._fetch_http(category_url, page, category_name)
+        if rows is not None:
+            self._misses[category_url] = 0
+            self.stats["http"] += 1
+            return rows
+        rows = self._fetch_browser(category_url, page, category_name)
+        # 브라우저에서도 빈 페이지면 게시판 끝이라 HTTP 실패로 세지 않음
+        if rows:
+            self._misses[category_url] = self._misses.get(category_url, 0) + 1
+            if self._misses[category_url] == MAX_HTTP_MISSES:
+                print(f"[{category_name}] HTTP 파싱이 {MAX_HTTP_MISSES}번 연속 실패해 이 카테고리는 브라우저로만 수집합니다.")
+        self.stats["browser"] += 1
+        return rows
+
+    def report(self):
+        total = self.stats["http"] + self.stats["browser"]
+        if not total:
+            return "수집한 페이지 없음"
+        return f"{total}페이지 중 HTTP {self.stats['http']}페이지, 브라우저 대체 {self.stats['browser']}페이지"
+
+    def close(self):
+        print(f"하이브리드 수집: {self.report()}")
+        self.http.close()
+        if self._browser is not None:
+            self._browser[1]()
+            self._browser = None
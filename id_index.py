@@ -0,0 +1,134 @@
+import os
+import glob
+import time
+import sqlite3
+import pandas as pd
+
+DEFAULT_INDEX_PATH = "results/article_ids.db"
+
+
+class ArticleIdIndex:
+    """수집한 article_id를 SQLite에 누적 저장하고 빠르게 조회하는 인덱스"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS article_ids ("
+            " article_id INTEGER PRIMARY KEY,"
+            " category TEXT,"
+            " first_seen TEXT"
+            ") WITHOUT ROWID"
+        )
+        # 이미 반영한 CSV 파일 (크기/수정시각이 같으면 다시 읽지 않음)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS imported_files ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER,"
+            " mtime REAL"
+            ")"
+        )
+        # 카테고리(메뉴)별로 지금까지 본 가장 큰 article_id (증분 수집 기준)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS high_water_marks ("
+            " category TEXT PRIMARY KEY,"
+            " article_id INTEGER,"
+            " updated TEXT"
+            ")"
+        )
+        self.conn.commit()
+
+    def __contains__(self, article_id):
+        if article_id is None:
+            return False
+        row = self.conn.execute(
+            "SELECT 1 FROM article_ids WHERE article_id = ?", (int(article_id),)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM article_ids").fetchone()[0]
+
+    def known(self, article_ids):
+        """주어진 ID 중 이미 인덱스에 있는 것들의 집합"""
+        ids = [int(i) for i in article_ids if i is not None]
+        found = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(row[0] for row in self.conn.execute(
+                f"SELECT article_id FROM article_ids WHERE article_id IN ({placeholders})", chunk
+            ))
+        return found
+
+    def add_many(self, article_ids, category=None):
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO article_ids (article_id, category, first_seen) VALUES (?, ?, ?)",
+                ((int(i), category, now) for i in article_ids if i is not None),
+            )
+
+    def add_rows(self, rows):
+        """크롤링 결과 행들의 article_id를 카테고리와 함께 기록"""
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO article_ids (article_id, category, first_seen) VALUES (?, ?, ?)",
+                ((int(row["article_id"]), row.get("category"), now)
+                 for row in rows if row.get("article_id") is not None),
+            )
+
+    def get_high_water(self, category):
+        row = self.conn.execute(
+            "SELECT article_id FROM high_water_marks WHERE category = ?", (category,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_high_water(self, category, article_id):
+        """기준값은 커지는 방향으로만 갱신"""
+        if article_id is None:
+            return
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO high_water_marks (category, article_id, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(category) DO UPDATE SET "
+                " article_id = MAX(article_id, excluded.article_id), updated = excluded.updated",
+                (category, int(article_id), now),
+            )
+
+    def import_csv_files(self, pattern, chunksize=100000):
+        """패턴에 맞는 CSV 중 새로 생기거나 바뀐 파일의 article_id만 인덱스에 반영"""
+        for file in sorted(glob.glob(pattern)):
+            stat = os.stat(file)
+            row = self.conn.execute(
+                "SELECT size, mtime FROM imported_files WHERE path = ?", (file,)
+            ).fetchone()
+            if row == (stat.st_size, stat.st_mtime):
+                continue
+            try:
+                count = 0
+                reader = pd.read_csv(
+                    file, usecols=lambda c: c == "article_id", chunksize=chunksize, encoding="utf-8-sig"
+                )
+                for chunk in reader:
+                    if "article_id" not in chunk.columns:
+                        break
+                    ids = pd.to_numeric(chunk["article_id"], errors="coerce").dropna().astype("int64").tolist()
+                    self.add_many(ids)
+                    count += len(ids)
+                with self.conn:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO imported_files (path, size, mtime) VALUES (?, ?, ?)",
+                        (file, stat.st_size, stat.st_mtime),
+                    )
+                print(f"파일 {file}에서 {count}개의 ID 반영")
+            except Exception as e:
+                print(f"파일 {file} 로드 중 오류: {e}")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,133 @@
+import json
+import fnmatch
+import threading
+from urllib.parse import urlsplit
+
+# 이미지/미디어/폰트 확장자 (CDP Network.setBlockedURLs 패턴)
+BLOCKED_EXTENSIONS = {
+    "Image": ["jpg", "jpeg", "png", "gif", "webp", "svg", "ico", "bmp", "avif"],
+    "Media": ["mp4", "webm", "m3u8", "ts", "mp3", "m4a"],
+    "Font": ["woff", "woff2", "ttf", "otf", "eot"],
+}
+# 광고/통계 등 목록 텍스트와 무관한 외부 도메인
+THIRD_PARTY_DOMAINS = [
+    "*.doubleclick.net", "*.googlesyndication.com", "*.google-analytics.com", "*.googletagmanager.com",
+    "*.googletagservices.com", "*.facebook.net", "*.facebook.com", "*.criteo.com", "*.criteo.net",
+    "siape.veta.naver.com", "*.veta.naver.com", "nam.veta.naver.com", "lcs.naver.com", "*.wcs.naver.net",
+    "ssl.pstatic.net/tveta/*", "*.adpost.naver.com",
+]
+# 실제 크기를 측정하지 못했을 때 쓰는 요청당 평균 바이트
+DEFAULT_BYTES = {"Image": 30000, "Media": 300000, "Font": 40000, "Script": 50000, "Other": 5000}
+
+
+def _type_of(url):
+    path = urlsplit(url).path.lower()
+    for resource_type, extensions in BLOCKED_EXTENSIONS.items():
+        if any(path.endswith("." + ext) for ext in extensions):
+            return resource_type
+    return "Script" if path.endswith(".js") else "Other"
+
+
+class LeanProfile:
+    """
+    크롤러 브라우저에서 이미지/미디어/폰트/외부 광고·통계 요청을 DevTools 프로토콜로 차단하는 프로필.
+    카테고리별 허용 목록에 있는 종류/도메인은 차단하지 않음. 페이지마다 차단한 요청 수와 아낀 바이트(추정)를 집계.
+    """
+
+    def __init__(self, block_types=("Image", "Media", "Font"), block_third_party=True, allowlist=None):
+        self.block_types = list(block_types)
+        self.block_third_party = block_third_party
+        self.allowlist = allowlist or {}  # {카테고리 이름: ["Image", "*.criteo.net", ...]}
+        self.avg_bytes = dict(DEFAULT_BYTES)
+        self.pages = 0
+        self.totals = {"loaded_requests": 0, "loaded_bytes": 0, "blocked_requests": 0, "saved_bytes": 0}
+        self._lock = threading.Lock()  # 드라이버 풀의 여러 스레드가 같은 프로필로 집계
+
+    def configure_options(self, options):
+        """드라이버 생성 전에 성능 로그(차단/로드된 요청 이벤트 수집) 설정 추가"""
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        return options
+
+    def patterns(self, category=None):
+        """
+        차단할 URL 패턴 목록. 카테고리 허용 목록에는 리소스 종류("Image" 등)나
+        외부 도메인 패턴("*.criteo.net" 등)을 적으면 그 카테고리에서는 차단하지 않음.
+        """
+        allowed = self.allowlist.get(category, [])
+        patterns = []
+        for resource_type in self.block_types:
+            if resource_type in allowed:
+                continue
+            for ext in BLOCKED_EXTENSIONS.get(resource_type, []):
+                patterns += [f"*.{ext}", f"*.{ext}?*"]
+        if self.block_third_party:
+            for domain in THIRD_PARTY_DOMAINS:
+                if any(fnmatch.fnmatch(domain, a) for a in allowed):
+                    continue
+                patterns.append(f"*://{domain}" if "/" in domain else f"*://{domain}/*")
+        return patterns
+
+    def attach(self, driver, category=None):
+        """드라이버에 차단 목록 적용 (카테고리가 바뀔 때마다 다시 호출)"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns(category)})
+        # 이전 페이지의 로그는 통계에서 제외
+        self._read_events(driver)
+
+    def detach(self, driver):
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+
+    def _read_events(self, driver):
+        try:
+            return [json.loads(entry["message"])["message"] for entry in driver.get_log("performance")]
+        except Exception:
+            return []
+
+    def calibrate(self, driver, url):
+        """차단 없이 한 번 열어 리소스 종류별 평균 크기를 측정 (아낀 바이트 추정에 사용)"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        self._read_events(driver)
+        driver.get(url)
+        urls = {}
+        sizes = {}
+        for event in self._read_events(driver):
+            params = event.get("params", {})
+            if event.get("method") == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif event.get("method") == "Network.loadingFinished" and params.get("requestId") in urls:
+                sizes.setdefault(_type_of(urls[params["requestId"]]), []).append(params.get("encodedDataLength", 0))
+        for resource_type, values in sizes.items():
+            self.avg_bytes[resource_type] = sum(values) / len(values)
+        return {k: round(v) for k, v in self.avg_bytes.items()}
+
+    def record_page(self, driver):
+        """마지막으로 읽은 뒤의 네트워크 이벤트로 이번 페이지의 요청/차단 통계 계산"""
+        urls = {}
+        stats = {"loaded_requests": 0, "loaded_bytes": 0, "blocked_requests": 0, "saved_bytes": 0}
+        for event in self._read_events(driver):
+            method = event.get("method")
+            params = event.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.loadingFinished":
+                stats["loaded_requests"] += 1
+                stats["loaded_bytes"] += int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and (
+                params.get("blockedReason") or "ERR_BLOCKED_BY_CLIENT" in params.get("errorText", "")
+            ):
+                stats["blocked_requests"] += 1
+                stats["saved_bytes"] += int(self.avg_bytes.get(_type_of(urls.get(params["requestId"], "")), 0))
+        with self._lock:
+            self.pages += 1
+            for key, value in stats.items():
+                self.totals[key] += value
+        return stats
+
+    def report(self):
+        if not self.pages:
+            return "측정한 페이지 없음"
+        t = self.totals
+        return (f"{self.pages}페이지, 페이지당 요청 {t['loaded_requests'] / self.pages:.1f}건 "
+                f"({t['loaded_bytes'] / self.pages / 1024:.0f}KB), "
+                f"차단 {t['blocked_requests'] / self.pages:.1f}건 (약 {t['saved_bytes'] / self.pages / 1024:.0f}KB 절약)")
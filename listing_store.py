@@ -0,0 +1,118 @@
+import os
+import time
+import sqlite3
+import argparse
+from sinks import CsvSink, ROW_FIELDS, to_int
+
+DEFAULT_STORE_PATH = "results/listings.db"
+
+
+class ListingStore:
+    """게시글을 article_id 기준으로 SQLite에 저장 (다시 수집되면 상태/가격/last_seen만 갱신)"""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            " article_id INTEGER PRIMARY KEY,"
+            " category TEXT,"
+            " status TEXT,"
+            " title TEXT,"
+            " price INTEGER,"
+            " nickname TEXT,"
+            " date TEXT,"
+            " url TEXT,"
+            " posted_at TEXT,"
+            " status_code INTEGER,"
+            " first_seen TEXT,"
+            " last_seen TEXT"
+            ")"
+        )
+        # 정규화 컬럼이 없던 이전 DB에 컬럼 추가
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(listings)")}
+        for column, column_type in (("posted_at", "TEXT"), ("status_code", "INTEGER")):
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE listings ADD COLUMN {column} {column_type}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS listings_category ON listings (category)")
+        # 기존 CSV와 같은 컬럼 순서의 내보내기용 뷰
+        self.conn.execute(
+            f"CREATE VIEW IF NOT EXISTS listings_csv AS SELECT {', '.join(ROW_FIELDS)} FROM listings"
+        )
+        self.conn.commit()
+
+    def upsert_rows(self, rows):
+        """행들을 한 트랜잭션으로 저장하고 저장한 행 수 반환"""
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        params = [
+            (int(row["article_id"]), row.get("category"), row.get("status"), row.get("title"),
+             to_int(row.get("price")), row.get("nickname"), row.get("date"), row.get("url"),
+             row["posted_at"].strftime("%Y-%m-%d %H:%M:%S") if row.get("posted_at") else None,
+             row.get("status_code"), now, now)
+            for row in rows if row.get("article_id") is not None
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO listings (article_id, category, status, title, price, nickname, date, url,"
+                " posted_at, status_code, first_seen, last_seen)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(article_id) DO UPDATE SET"
+                " status = excluded.status, status_code = excluded.status_code,"
+                " price = excluded.price, last_seen = excluded.last_seen",
+                params,
+            )
+        return len(params)
+
+    def refresh_rows(self, rows):
+        """이미 저장된 글만 상태/가격/last_seen 갱신 (없는 글은 추가하지 않음), 갱신한 행 수 반환"""
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        params = [
+            (row.get("status"), row.get("status_code"), to_int(row.get("price")), now, int(row["article_id"]))
+            for row in rows if row.get("article_id") is not None
+        ]
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE listings SET status = ?, status_code = ?, price = ?, last_seen = ? WHERE article_id = ?",
+                params,
+            )
+        return cursor.rowcount
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    def export_csv(self, output_path, category=None, columns=None):
+        """listings_csv 뷰를 기존 CSV 형식으로 내보내기"""
+        columns = columns or ROW_FIELDS
+        query = f"SELECT {', '.join(columns)} FROM listings_csv"
+        params = ()
+        if category:
+            query += " WHERE category = ?"
+            params = (category,)
+        cursor = self.conn.execute(query + " ORDER BY article_id DESC", params)
+        sink = CsvSink(output_path, columns, flush_rows=5000)
+        while True:
+            batch = cursor.fetchmany(5000)
+            if not batch:
+                break
+            sink.write_rows([dict(zip(columns, row)) for row in batch])
+        sink.close()
+        print(f"✅ CSV 내보내기 완료: {output_path} ({sink.rows_written}건)")
+        return sink.rows_written
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite 저장소를 CSV로 내보내기")
+    parser.add_argument("output", help="저장할 CSV 경로")
+    parser.add_argument("--db", default=DEFAULT_STORE_PATH)
+    parser.add_argument("--category", default=None, help="이 카테고리만 내보내기")
+    args = parser.parse_args()
+
+    store = ListingStore(args.db)
+    store.export_csv(args.output, category=args.category)
+    store.close()
@@ -1,8 +1,7 @@
 # main.py
 
 import json
-import os
-from crawler import crawl_category
+from main_parallel import run_parallel
 
 
 def load_categories(path="categories.json"):
@@ -14,41 +13,10 @@ def main():
     categories = load_categories()
     output_dir = "output"
 
-    for cat in categories:
-        name = cat["name"]
-        url = cat["url"]
-        output_path = os.path.join(output_dir, f"{name}.csv")
-
-        print(f"\n====== {name} 카테고리 시작 ======")
-        crawl_category(
-            name, url, output_path, max_pages=5
-        )  # ← 페이지 수는 테스트용으로 5부터 시작해봐
-
-
-if __name__ == "__main__":
-    main()
-# main.py
-
-import json
-import os
-from crawler import crawl_category
-
-
-def load_categories(path="categories.json"):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def main():
-    categories = load_categories()
-    output_dir = "output"
-
-    for cat in categories:
-        name = cat["name"]
-        url = cat["url"]
-        output_path = os.path.join(output_dir, f"{name}.csv")
-
-        crawl_category(name, url, output_path)
+    # 카테고리별로 output/{name}.csv 저장 (프로세스 1개 = 순차 실행)
+    run_parallel(
+        categories, max_pages=5, processes=1, output_dir=output_dir
+    )  # ← 페이지 수는 테스트용으로 5부터 시작해봐
 
 
 if __name__ == "__main__":
@@ -1,174 +1,34 @@
-import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-import time
 import os
-import pandas as pd
-from webdriver_manager.chrome import ChromeDriverManager
-import glob
-import json
-
-def setup_driver():
-    options = Options()
-    # options.add_argument('--headless')  # 창 안 띄우려면
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920x1080')
-    options.add_argument('user-agent=Mozilla/5.0')
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
-
-def extract_article_id(url):
-    match = re.search(r'articles/(\d+)', url)
-    return int(match.group(1)) if match else None
-
-def load_existing_article_ids():
-    """기존 CSV 파일들에서 article_id를 로드하고 별도 파일로 저장"""
-    article_ids = set()
-    
-    # CSV 파일들에서 ID 로드
-    for file in glob.glob("results/여성패션_의류_*.csv"):
-        try:
-            df = pd.read_csv(file)
-            if 'article_id' in df.columns:
-                ids = df['article_id'].dropna().astype(int).tolist()
-                article_ids.update(ids)
-                print(f"파일 {file}에서 {len(ids)}개의 ID 로드")
-        except Exception as e:
-            print(f"파일 {file} 로드 중 오류: {e}")
-    
-    # ID 목록을 별도 파일로 저장
-    os.makedirs("results", exist_ok=True)
-    with open("results/article_ids.json", "w") as f:
-        json.dump(list(article_ids), f)
-    
-    print(f"총 {len(article_ids)}개의 고유 ID 로드 완료")
-    return article_ids
-
-def extract_album_list_data(driver, category_name="여성패션"):
-    items = driver.find_elements(By.CSS_SELECTOR, "ul.article-album-view > li.item")
-    print(f"상품 li 개수: {len(items)}")  # 디버깅용
-    results = []
-    for item in items:
-        try:
-            title = item.find_element(By.CSS_SELECTOR, "dl > dt.tit_area > a.tit > span.tit_txt").text.strip()
-        except:
-            title = ""
-        try:
-            price = item.find_element(By.CSS_SELECTOR, "dl > dd.price > em").text.strip()
-        except:
-            price = ""
-        try:
-            nickname = item.find_element(By.CSS_SELECTOR, "dl > dd.nick_area span.nickname").text.strip()
-        except:
-            nickname = ""
-        try:
-            date = item.find_element(By.CSS_SELECTOR, "dl > dd.date_num > span.date").text.strip()
-        except:
-            date = ""
-        try:
-            status = item.find_element(By.CSS_SELECTOR, "svg[aria-label]").get_attribute("aria-label")
-        except:
-            status = ""
-        try:
-            url = item.find_element(By.CSS_SELECTOR, "dl > dt.tit_area > a.tit").get_attribute("href")
-            article_id = extract_article_id(url)
-        except:
-            url = ""
-            article_id = None
-        results.append({
-            "category": category_name,
-            "status": status,
-            "title": title,
-            "price": price,
-            "nickname": nickname,
-            "date": date,
-            "url": url,
-            "article_id": article_id
-        })
-    return results
-
-def is_date_format(s):
-    return bool(re.match(r"^\d{4}\.\d{2}\.\d{2}$", s))
-
-def crawl_category_album(driver, category_url, start_page, end_page, category_name, existing_ids, filename):
-    all_results = []
-    header_written = False
-    stop_date = "2025.05.31"
-    stop_flag = False
-    for page in range(start_page, end_page + 1):
-        if stop_flag:
-            break
-        url = f"{category_url}?page={page}&viewType=I&size=20"
-        driver.get(url)
-        time.sleep(2)
-        results = extract_album_list_data(driver, category_name)
-        new_results = []
-        for row in results:
-            article_id = row.get("article_id")
-            if article_id is None:
-                continue
-            post_date = row.get("date", "")
-            if is_date_format(post_date) and post_date == stop_date:
-                stop_flag = True
-                print(f"중단 기준 날짜({stop_date}) 게시글 발견: {post_date} (page {page})")
-                break
-            new_results.append(row)
-        all_results.extend(new_results)
-        print(f"페이지 {page} 수집 완료: {len(results)}건 (저장: {len(new_results)}건, 중복 제외: {len(results) - len(new_results)}건)")
-        save_csv(new_results, filename, header=not header_written)
-        header_written = True
-    print(f"이번 크롤링에서 {len(all_results)}개의 게시글을 수집했습니다.")
-    return all_results
-
-def save_csv(data, filename, header=True):
-    os.makedirs("results", exist_ok=True)
-    path = f"results/{filename}"
-    df = pd.DataFrame(data)
-    if header:
-        df.to_csv(path, index=False, encoding="utf-8-sig", header=True)
-    else:
-        df.to_csv(path, index=False, encoding="utf-8-sig", header=False)
-    print(f"✅ 저장 완료: {path} ({len(data)}건)")
+from crawl_common import run
+from sinks import ROW_FIELDS
+
+# 결과 CSV 컬럼 (Parquet/SQLite에는 항상 ROW_FIELDS 전체 저장)
+OUTPUT_COLUMNS = ROW_FIELDS
+# 기존 결과 파일 (article_id 인덱스에 반영)
+INDEX_PATTERN = "results/여성패션_의류_*.csv"
+# 중단 기준 날짜 당일 게시글부터 저장하지 않음
+STOP_INCLUSIVE = True
+# 행의 category 값에서 '/'를 '_'로 바꿀지
+REPLACE_SLASH = False
+# --lean 사용 시 카테고리별로 차단하지 않을 리소스 종류/도메인 (예: {"카테고리": ["Image"]})
+LEAN_ALLOWLIST = {}
+CHECKPOINT_PATH = f"results/checkpoint_{os.path.splitext(os.path.basename(__file__))[0]}.json"
+
+# 크롤링할 카테고리 목록
+CATEGORIES = [
+    {
+        "url": "https://cafe.naver.com/f-e/cafes/10050146/menus/364",
+        "name": "여성패션_가방/잡화"
+    },
+    {
+        "url": "https://cafe.naver.com/f-e/cafes/10050146/menus/360",
+        "name": "여성패션_기타"
+    }
+]
 
 def main():
-    driver = setup_driver()
-    driver.get("https://nid.naver.com/nidlogin.login")
-    input("네이버 로그인을 완료하고 엔터를 누르세요...")
-
-    # 크롤링할 카테고리 목록
-    categories = [
-        {
-            "url": "https://cafe.naver.com/f-e/cafes/10050146/menus/364",
-            "name": "여성패션_가방/잡화"
-        },
-        {
-            "url": "https://cafe.naver.com/f-e/cafes/10050146/menus/360",
-            "name": "여성패션_기타"
-        }
-    ]
-    
-    # 기존 article_id 로드
-    existing_ids = load_existing_article_ids()
-    print(f"기존 article_id 수: {len(existing_ids)}")
-    
-    # 각 카테고리별로 크롤링
-    for category in categories:
-        print(f"\n=== {category['name']} 카테고리 크롤링 시작 ===")
-        start_page = 1
-        end_page = 300
-        # 슬래시를 밑줄로 변환
-        safe_name = category['name'].replace('/', '_')
-        filename = f"{safe_name}_{start_page}-{end_page}.csv"
-        path = f"results/{filename}"
-        if os.path.exists(path):
-            os.remove(path)
-        results = crawl_category_album(driver, category['url'], start_page, end_page, category['name'], existing_ids, filename)
-        print(f"=== {category['name']} 카테고리 크롤링 완료 ===\n")
-    
-    driver.quit()
+    run(CATEGORIES, INDEX_PATTERN, CHECKPOINT_PATH, output_columns=OUTPUT_COLUMNS, stop_inclusive=STOP_INCLUSIVE,
+        replace_slash=REPLACE_SLASH, lean_allowlist=LEAN_ALLOWLIST)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,23 +1,190 @@
-from multiprocessing import Pool, cpu_count
-from crawler import crawl_category
+from multiprocessing import get_context, cpu_count
+from queue import Empty
+import argparse
 import json
+import os
+import time
+from sharded_crawl import open_page_fetcher
+from sinks import open_sink, partition_dir, OUTPUT_FORMATS
+from session_store import SessionStore, SessionError, DEFAULT_SESSION_PATH
 
+DEFAULT_END_PAGE = 20
+# --lean일 때 카테고리별로 차단하지 않을 리소스 종류/도메인 (예: {"명품_가방": ["Image"]})
+LEAN_ALLOWLIST = {}
+# 페이지 하나를 다시 시도하는 횟수 (1, 2, 4...초 간격)
+PAGE_RETRIES = 2
 
-def run_parallel(categories, max_pages=20):
+
+def schedule_longest_first(categories, max_pages=None):
+    """end_page가 큰(오래 걸리는) 카테고리부터 배정되도록 정렬"""
     tasks = []
     for cat in categories:
-        name = cat["name"]
-        url = cat["url"]
-        tasks.append((name, url, max_pages))
+        end_page = cat.get("end_page", max_pages or DEFAULT_END_PAGE)
+        if max_pages:
+            end_page = min(end_page, max_pages)
+        tasks.append({"name": cat["name"], "url": cat["url"], "end_page": end_page})
+    return sorted(tasks, key=lambda t: t["end_page"], reverse=True)
+
+
+def fetch_with_retry(fetch, task, page, retries=PAGE_RETRIES, worker_id=None):
+    """실패하면 간격을 두 배씩 늘려 다시 시도, 끝까지 실패하면 마지막 예외를 그대로 던짐"""
+    for attempt in range(retries + 1):
+        try:
+            return fetch(task["url"], page, task["name"])
+        except Exception as e:
+            if attempt == retries:
+                raise
+            print(f"[워커 {worker_id}] {task['name']} 페이지 {page} 재시도 {attempt + 1}/{retries}: {e}")
+            time.sleep(2 ** attempt)
+
+
+def crawl_worker(worker_id, task_queue, result_queue, backend, wait_timeout, lean=False, cookies=None, api_base=None, page_size=20,
+                 lean_allowlist=None):
+    """
+    프로세스당 브라우저(또는 HTTP 세션) 하나로 카테고리를 하나씩 가져가 수집, 결과는 큐로만 전달.
+    재시도해도 실패한 페이지는 ("failed", 카테고리, 페이지)로 알리고 그 카테고리는 거기서 멈춤 (빈 구간을 남기지 않도록)
+    """
+    fetch, close = open_page_fetcher(backend, cookies, wait_timeout, lean, api_base, page_size, lean_allowlist)
+    try:
+        while True:
+            try:
+                task = task_queue.get(timeout=1)
+            except Empty:
+                break
+            start_time = time.time()
+            print(f"[워커 {worker_id}] {task['name']} 시작 ({task['end_page']}페이지)")
+            total = 0
+            for page in range(1, task["end_page"] + 1):
+                try:
+                    rows = fetch_with_retry(fetch, task, page, worker_id=worker_id)
+                except Exception as e:
+                    print(f"[워커 {worker_id}] {task['name']} 페이지 {page} 수집 실패: {e}")
+                    result_queue.put(("failed", task["name"], page))
+                    break
+                if not rows:
+                    # 빈 페이지 = 게시판 끝
+                    break
+                result_queue.put(("rows", task["name"], rows))
+                total += len(rows)
+            result_queue.put(("done", task["name"], total))
+            print(f"[워커 {worker_id}] {task['name']} 완료: {total}건 (소요시간: {time.time() - start_time:.2f}초)")
+    finally:
+        close()
+
+
+def writer_process(result_queue, output_dir, output_format="csv"):
+    """
+    CSV 파일은 이 프로세스만 씀 (카테고리별 파일 핸들 유지, article_id 기준 중복 제거).
+    실패한 페이지가 있으면 끝에 카테고리별로 출력하고 종료 코드 1로 끝냄
+    """
+    sinks = {}
+    seen = {}
+    failed = {}
+    while True:
+        message = result_queue.get()
+        if message is None:
+            break
+        kind, name, payload = message
+        if kind == "rows":
+            if name not in sinks:
+                if output_format == "sqlite":
+                    path = os.path.join(output_dir, "listings.db")
+                elif output_format == "parquet":
+                    path = partition_dir(os.path.join(output_dir, "parquet"), name)
+                else:
+                    path = os.path.join(output_dir, f"{name.replace('/', '_')}.csv")
+                sinks[name] = open_sink(output_format, path)
+                seen[name] = set()
+            new_rows = [
+                row for row in payload
+                if row.get("article_id") is not None and row["article_id"] not in seen[name]
+            ]
+            seen[name].update(row.get("article_id") for row in new_rows)
+            sinks[name].write_rows(new_rows)
+        elif kind == "failed":
+            failed.setdefault(name, []).append(payload)
+        elif kind == "done":
+            rows_written = 0
+            if name in sinks:
+                sink = sinks.pop(name)
+                sink.close()
+                rows_written = sink.rows_written
+            seen.pop(name, None)
+            print(f"✅ 저장 완료: {name} ({rows_written}건)")
+    for sink in sinks.values():
+        sink.close()
+    if failed:
+        for name, pages in failed.items():
+            print(f"❌ 수집 실패: {name} 페이지 {', '.join(map(str, pages))} (이후 페이지는 수집하지 않음)")
+        raise SystemExit(1)
 
-    with Pool(processes=min(4, cpu_count())) as pool:
-        pool.starmap(crawl_category, tasks)
+
+def run_parallel(categories, max_pages=None, processes=None, backend="browser", output_dir="results", wait_timeout=10,
+                 output_format="csv", lean=False, cookies=None, api_base=None, page_size=20, lean_allowlist=None):
+    start_time = time.time()
+    tasks = schedule_longest_first(categories, max_pages)
+    processes = min(processes or min(4, cpu_count()), len(tasks)) or 1
+    print(f"병렬 크롤링 시작: 카테고리 {len(tasks)}개, 프로세스 {processes}개 ({backend})")
+
+    ctx = get_context("spawn")
+    task_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    for task in tasks:
+        task_queue.put(task)
+
+    writer = ctx.Process(target=writer_process, args=(result_queue, output_dir, output_format))
+    writer.start()
+    workers = [
+        ctx.Process(target=crawl_worker, args=(i, task_queue, result_queue, backend, wait_timeout, lean, cookies, api_base, page_size,
+                                                 lean_allowlist))
+        for i in range(processes)
+    ]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    result_queue.put(None)
+    writer.join()
+    crashed = [p for p in workers if p.exitcode != 0]
+    if crashed:
+        print(f"❌ 비정상 종료한 워커 {len(crashed)}개 (종료 코드: {', '.join(str(p.exitcode) for p in crashed)})")
+    print(f"병렬 크롤링 완료 (총 소요시간: {time.time() - start_time:.2f}초)")
+    return writer.exitcode == 0 and not crashed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="categories.json의 카테고리를 여러 프로세스로 나눠 수집")
+    parser.add_argument("--categories", default="categories.json")
+    parser.add_argument("--max-pages", type=int, default=None, help="카테고리별 최대 페이지 (기본: end_page)")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--backend", choices=["browser", "http", "hybrid", "api"], default="browser",
+                        help="hybrid: --session의 쿠키로 HTTP 수집, 파싱하지 못한 페이지만 워커의 브라우저로")
+    parser.add_argument("--output-dir", default="results")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="csv")
+    parser.add_argument("--lean", action="store_true", help="이미지/폰트/광고 요청을 차단하는 브라우저 프로필 사용")
+    parser.add_argument("--session", nargs="?", const=DEFAULT_SESSION_PATH, default=None,
+                        help="저장된 로그인 세션을 모든 워커에 주입 (python session_store.py login으로 먼저 저장)")
+    parser.add_argument("--api-base", default=None,
+                        help="api 백엔드의 API 주소 (기본: JOONGGO_API_BASE 환경 변수 또는 네이버 API)")
+    parser.add_argument("--page-size", type=int, default=20, help="api 백엔드에서 한 번에 받을 게시글 수")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    with open("categories.json", "r", encoding="utf-8") as f:
+    args = parse_args()
+    with open(args.categories, "r", encoding="utf-8") as f:
         categories = json.load(f)
 
-    # ✅ 상위 3개 카테고리만 실행 (예시)
-    selected = categories[:3]
-    run_parallel(selected, max_pages=20)
+    cookies = None
+    if args.session:
+        # 워커마다 로그인하지 않고 한 번 저장한 세션을 나눠 씀
+        try:
+            cookies = SessionStore(args.session).cookies()
+        except SessionError as e:
+            raise SystemExit(f"❌ {e}")
+
+    complete = run_parallel(categories, max_pages=args.max_pages, processes=args.processes,
+                            backend=args.backend, output_dir=args.output_dir, output_format=args.output_format, lean=args.lean, cookies=cookies,
+                            api_base=args.api_base, page_size=args.page_size, lean_allowlist=LEAN_ALLOWLIST)
+    if not complete:
+        raise SystemExit(1)
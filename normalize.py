@@ -0,0 +1,113 @@
+import re
+from datetime import datetime
+from enum import IntEnum
+import pandas as pd
+
+
+class Status(IntEnum):
+    """게시글 거래 상태 코드 (aria-label 텍스트를 정수로)"""
+    UNKNOWN = 0
+    SELLING = 1
+    RESERVED = 2
+    SOLD = 3
+
+
+# 먼저 일치하는 것을 사용 ("판매완료"가 "판매"보다 먼저)
+STATUS_PATTERNS = [
+    (Status.SOLD, r"완료|판매\s*종료|거래\s*완료"),
+    (Status.RESERVED, r"예약"),
+    (Status.SELLING, r"판매|거래\s*가능"),
+]
+
+# 정규화 결과의 컬럼과 dtype (category는 pandas category, 상태 코드는 int8)
+TYPED_DTYPES = {
+    "article_id": "Int64",
+    "category": "category",
+    "status_code": "int8",
+    "price_won": "Int64",
+    "posted_at": "datetime64[ns]",
+    "title": "string",
+    "nickname": "string",
+    "url": "string",
+}
+NORMALIZED_FIELDS = ["price_won", "posted_at", "status_code"]
+
+
+def parse_prices(prices):
+    """"17,000" / "17,000원" → 17000, 숫자가 없으면(무료나눔 등) <NA>"""
+    digits = prices.fillna("").astype(str).str.replace(r"[^\d]", "", regex=True)
+    return pd.to_numeric(digits.where(digits != ""), errors="coerce").astype("Int64")
+
+
+def status_codes(statuses):
+    text = statuses.fillna("").astype(str)
+    codes = pd.Series(int(Status.UNKNOWN), index=statuses.index, dtype="int8")
+    assigned = pd.Series(False, index=statuses.index)
+    for code, pattern in STATUS_PATTERNS:
+        match = text.str.contains(pattern, regex=True) & ~assigned
+        codes[match] = int(code)
+        assigned |= match
+    return codes
+
+
+def parse_posted_at(dates, crawl_time=None):
+    """
+    목록의 날짜 텍스트를 수집 시각 기준 절대 시각으로.
+    "2025.05.31" → 그날 0시, "14:14" → 수집일의 그 시각(수집 시각보다 뒤면 전날), "N분 전"/"N시간 전"/"방금"도 처리.
+    """
+    crawl_time = pd.Timestamp(crawl_time or datetime.now())
+    text = dates.fillna("").astype(str).str.strip()
+
+    day = text.str.extract(r"^(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})")
+    posted = pd.to_datetime(
+        {"year": day[0], "month": day[1], "day": day[2]}, errors="coerce"
+    ) if len(text) else pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+
+    clock = text.str.extract(r"^(\d{1,2}):(\d{2})$").astype(float)
+    today = crawl_time.normalize() + pd.to_timedelta(clock[0] * 3600 + clock[1] * 60, unit="s")
+    today = today.where(today <= crawl_time + pd.Timedelta(minutes=5), today - pd.Timedelta(days=1))
+    posted = posted.fillna(today)
+
+    ago = text.str.extract(r"^(\d+)\s*(분|시간|일)\s*전$")
+    seconds = ago[0].astype(float) * ago[1].map({"분": 60, "시간": 3600, "일": 86400})
+    posted = posted.fillna(crawl_time - pd.to_timedelta(seconds, unit="s"))
+    posted = posted.mask(text.str.startswith("방금"), crawl_time)
+    return posted.astype("datetime64[ns]")
+
+
+def normalize_frame(df, crawl_time=None):
+    """문자열 컬럼들을 정수 원 / 절대 시각 / 상태 코드로 바꾼 압축된 typed DataFrame"""
+    empty = pd.Series(None, index=df.index, dtype=object)
+    out = pd.DataFrame({
+        "article_id": pd.to_numeric(df.get("article_id", empty), errors="coerce"),
+        "category": df.get("category", empty),
+        "status_code": status_codes(df.get("status", empty)),
+        "price_won": parse_prices(df.get("price", empty)),
+        "posted_at": parse_posted_at(df.get("date", empty), crawl_time),
+        "title": df.get("title", empty),
+        "nickname": df.get("nickname", empty),
+        "url": df.get("url", empty),
+    }, index=df.index)
+    return out.astype(TYPED_DTYPES)
+
+
+def normalize_rows(rows, crawl_time=None):
+    """크롤링 중 한 페이지 행(dict)에 price_won / posted_at / status_code를 채워 넣음"""
+    if not rows:
+        return rows
+    typed = normalize_frame(pd.DataFrame(rows), crawl_time)
+    for row, price, posted_at, status in zip(rows, typed["price_won"], typed["posted_at"], typed["status_code"]):
+        row["price_won"] = None if price is pd.NA else int(price)
+        row["posted_at"] = None if pd.isna(posted_at) else posted_at.to_pydatetime()
+        row["status_code"] = int(status)
+    return rows
+
+
+def parse_stop_date(stop_date):
+    """--stop-date 값("2025.05.31")을 datetime으로 (비어 있으면 None)"""
+    if not stop_date:
+        return None
+    match = re.match(r"^(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})$", stop_date.strip())
+    if not match:
+        raise ValueError(f"날짜 형식이 아닙니다 (YYYY.MM.DD): {stop_date}")
+    return datetime(*map(int, match.groups()))
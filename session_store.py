@@ -0,0 +1,243 @@
+import os
+import sys
+import json
+import time
+import argparse
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+
+DEFAULT_SESSION_PATH = "results/naver_session.enc"
+# .env 또는 환경 변수에 둘 Fernet 키 이름 (python session_store.py keygen으로 생성)
+KEY_ENV = "JOONGGO_SESSION_KEY"
+LOGIN_URL = "https://nid.naver.com/nidlogin.login"
+# 로그인 여부를 판단하는 네이버 인증 쿠키 (서버가 세션을 끊으면 이 쿠키를 지움)
+AUTH_COOKIES = ("NID_AUT", "NID_SES")
+CHECK_URL = "https://www.naver.com/"
+# 쿠키를 주입할 때 열어두는 페이지 (이 호스트에서 보이는 쿠키만 add_cookie로 넣을 수 있음)
+COOKIE_URL = "https://cafe.naver.com/"
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "expiry")
+
+
+class SessionError(Exception):
+    """저장된 로그인 세션이 없거나, 복호화할 수 없거나, 만료된 경우"""
+
+
+def _fernet(key=None):
+    from cryptography.fernet import Fernet
+    load_dotenv()
+    key = key or os.environ.get(KEY_ENV)
+    if not key:
+        raise SessionError(f"암호화 키가 없습니다. `python session_store.py keygen` 결과를 .env의 {KEY_ENV}에 넣으세요.")
+    return Fernet(key.encode() if isinstance(key, str) else key)
+
+
+def has_auth_cookies(cookies):
+    names = {cookie.get("name") for cookie in cookies or []}
+    return all(name in names for name in AUTH_COOKIES)
+
+
+def cookie_matches_host(cookie, host):
+    """쿠키 도메인이 host에서 보이는지 (.naver.com은 하위 도메인 전체, nid.naver.com 같은 호스트 전용 쿠키는 그 호스트만)"""
+    domain = (cookie.get("domain") or host).lstrip(".").lower()
+    host = host.lower()
+    return host == domain or host.endswith("." + domain)
+
+
+def apply_to_driver(driver, cookies):
+    """
+    브라우저에 쿠키 주입 (쿠키 도메인의 페이지를 먼저 열어야 add_cookie가 허용됨).
+    cafe.naver.com에서 보이지 않는 쿠키(nid.naver.com 호스트 전용 등)는 건너뛰고 주입한 개수를 반환
+    """
+    from selenium.common.exceptions import InvalidCookieDomainException
+    driver.get(COOKIE_URL)
+    host = urlparse(COOKIE_URL).hostname
+    applied = 0
+    for cookie in cookies:
+        if not cookie_matches_host(cookie, host):
+            continue
+        try:
+            driver.add_cookie({k: cookie[k] for k in COOKIE_FIELDS if k in cookie})
+        except InvalidCookieDomainException:
+            continue
+        applied += 1
+    return applied
+
+
+def apply_to_session(session, cookies):
+    """requests 세션에 쿠키 주입"""
+    for cookie in cookies:
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+
+class SessionStore:
+    """
+    한 번 수동으로 로그인한 브라우저의 쿠키(와 user-agent)를 암호화해 파일로 저장하고,
+    새 브라우저/HTTP 세션 여러 개에 그대로 주입. 쿠키 만료 시각과 실제 접속으로 세션 만료를 확인.
+    """
+
+    def __init__(self, path=DEFAULT_SESSION_PATH, key=None):
+        self.path = path
+        self.key = key
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def check_key(self):
+        """암호화 키가 설정돼 있는지 확인 (없으면 SessionError)"""
+        _fernet(self.key)
+
+    def save(self, cookies, user_agent=None):
+        data = {"cookies": cookies, "user_agent": user_agent, "saved_at": time.time()}
+        token = _fernet(self.key).encrypt(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        # 본인만 읽을 수 있게 저장
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp_path, self.path)
+        return data
+
+    def save_driver(self, driver):
+        """로그인한 브라우저의 쿠키와 user-agent 저장"""
+        cookies = driver.get_cookies()
+        if not has_auth_cookies(cookies):
+            raise SessionError("로그인 쿠키(NID_AUT, NID_SES)가 없습니다. 로그인이 완료됐는지 확인하세요.")
+        return self.save(cookies, driver.execute_script("return navigator.userAgent"))
+
+    def load(self):
+        """복호화한 {"cookies", "user_agent", "saved_at"} 반환 (만료 여부는 확인하지 않음)"""
+        from cryptography.fernet import InvalidToken
+        if not self.exists():
+            raise SessionError(f"저장된 세션이 없습니다: {self.path} (`python session_store.py login`으로 먼저 로그인하세요)")
+        with open(self.path, "rb") as f:
+            token = f.read()
+        try:
+            return json.loads(_fernet(self.key).decrypt(token))
+        except InvalidToken:
+            raise SessionError(f"세션 파일을 복호화할 수 없습니다: {self.path} ({KEY_ENV} 키가 바뀌었는지 확인하세요)")
+
+    def expires_at(self, data=None):
+        """인증 쿠키 중 가장 먼저 만료되는 시각 (브라우저 세션 쿠키만 있으면 None)"""
+        data = data or self.load()
+        expiries = [c["expiry"] for c in data["cookies"] if c.get("name") in AUTH_COOKIES and c.get("expiry")]
+        return min(expiries) if expiries else None
+
+    def valid_session(self, now=None):
+        """만료되지 않은 세션 데이터를 반환, 아니면 이유와 함께 SessionError"""
+        now = now or time.time()
+        data = self.load()
+        if not has_auth_cookies(data["cookies"]):
+            raise SessionError("저장된 세션에 로그인 쿠키가 없습니다. 다시 로그인하세요.")
+        expires_at = self.expires_at(data)
+        if expires_at is not None and expires_at <= now:
+            raise SessionError(
+                f"저장된 세션이 만료됐습니다 (만료: {time.strftime('%Y-%m-%d %H:%M', time.localtime(expires_at))}). "
+                "`python session_store.py login`으로 다시 로그인하세요."
+            )
+        return data
+
+    def cookies(self):
+        return self.valid_session()["cookies"]
+
+    def restore_driver(self, driver, verify=True):
+        """브라우저에 저장된 세션을 주입하고, verify면 실제로 로그인 상태인지 확인"""
+        apply_to_driver(driver, self.cookies())
+        if verify and not self.verify_driver(driver):
+            raise SessionError("저장된 세션이 서버에서 만료됐습니다. `python session_store.py login`으로 다시 로그인하세요.")
+
+    def restore_session(self, session, verify=True):
+        """requests 세션에 저장된 쿠키/user-agent를 주입하고, verify면 실제로 로그인 상태인지 확인"""
+        data = self.valid_session()
+        apply_to_session(session, data["cookies"])
+        if data.get("user_agent"):
+            session.headers["User-Agent"] = data["user_agent"]
+        if verify and not self.verify_session(session):
+            raise SessionError("저장된 세션이 서버에서 만료됐습니다. `python session_store.py login`으로 다시 로그인하세요.")
+
+    def verify_driver(self, driver):
+        """페이지를 한 번 열고도 인증 쿠키가 남아 있으면 로그인 상태"""
+        driver.get(CHECK_URL)
+        return has_auth_cookies(driver.get_cookies())
+
+    def verify_session(self, session, timeout=10):
+        session.get(CHECK_URL, timeout=timeout)
+        return all(name in session.cookies for name in AUTH_COOKIES)
+
+    def login(self, driver, prompt="네이버 로그인을 완료하고 엔터를 누르세요..."):
+        """사람이 브라우저에서 로그인하고 엔터를 누르면 세션을 저장"""
+        driver.get(LOGIN_URL)
+        input(prompt)
+        data = self.save_driver(driver)
+        print(f"세션 저장 완료: {self.path} (쿠키 {len(data['cookies'])}개)")
+        return data
+
+    def clear(self):
+        if self.exists():
+            os.remove(self.path)
+
+
+def login_with_session(driver, store):
+    """
+    저장된 세션으로 로그인. 세션이 없거나 만료됐으면 터미널에서는 수동 로그인 후 다시 저장하고,
+    무인 실행(입력 불가)이면 이유를 출력하고 종료. 세션을 저장하지 못해도 로그인한 브라우저로 수집은 계속함
+    """
+    try:
+        store.restore_driver(driver)
+        print(f"저장된 세션으로 로그인: {store.path}")
+        return
+    except SessionError as e:
+        if not sys.stdin.isatty():
+            raise SystemExit(f"❌ {e}")
+        print(e)
+    try:
+        store.check_key()
+    except SessionError as e:
+        # 키가 없으면 로그인만 하고 저장은 건너뜀 (로그인한 뒤에 실패해서 실행이 끝나지 않도록 미리 확인)
+        print(f"⚠️ {e}\n이번 로그인은 세션으로 저장하지 않습니다.")
+        driver.get(LOGIN_URL)
+        input("네이버 로그인을 완료하고 엔터를 누르세요...")
+        return
+    print("수동 로그인 후 세션을 다시 저장합니다.")
+    try:
+        store.login(driver)
+    except SessionError as e:
+        print(f"⚠️ 세션 저장 실패, 저장하지 않고 계속 수집합니다: {e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 로그인 세션을 암호화해 저장/확인")
+    parser.add_argument("command", choices=["keygen", "login", "check", "clear"],
+                        help="keygen: 암호화 키 생성, login: 브라우저로 로그인 후 저장, check: 만료 확인, clear: 삭제")
+    parser.add_argument("--session", default=DEFAULT_SESSION_PATH)
+    parser.add_argument("--live", action="store_true", help="check 시 실제로 접속해 서버 쪽 만료까지 확인")
+    args = parser.parse_args()
+
+    store = SessionStore(args.session)
+    if args.command == "keygen":
+        from cryptography.fernet import Fernet
+        print(f"{KEY_ENV}={Fernet.generate_key().decode()}")
+    elif args.command == "login":
+        from crawl_common import setup_driver
+        driver = setup_driver()
+        try:
+            store.login(driver)
+        finally:
+            driver.quit()
+    elif args.command == "check":
+        try:
+            data = store.valid_session()
+            if args.live:
+                import requests
+                with requests.Session() as session:
+                    store.restore_session(session)
+        except SessionError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        expires_at = store.expires_at(data)
+        saved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(data["saved_at"]))
+        until = time.strftime("%Y-%m-%d %H:%M", time.localtime(expires_at)) if expires_at else "브라우저 세션 (서버가 끊을 때까지)"
+        print(f"✅ 세션 유효: 저장 {saved_at}, 만료 {until}")
+    else:
+        store.clear()
+        print(f"세션 삭제: {args.session}")
@@ -0,0 +1,197 @@
+import os
+import csv
+import glob
+import shutil
+import time
+import multiprocessing as mp
+from queue import Empty
+from sinks import ROW_FIELDS
+
+
+def split_page_ranges(start_page, end_page, chunk_size=10):
+    """[start_page, end_page]를 chunk_size 페이지씩 나눔 (작게 나눌수록 먼저 끝난 워커가 더 가져감)"""
+    return [(page, min(page + chunk_size - 1, end_page)) for page in range(start_page, end_page + 1, chunk_size)]
+
+
+def shard_path(shard_dir, chunk):
+    return os.path.join(shard_dir, f"pages_{chunk[0]:05d}-{chunk[1]:05d}.csv")
+
+
+def open_page_fetcher(backend, cookies, wait_timeout, lean=False, api_base=None, page_size=20, lean_allowlist=None):
+    """
+    워커 프로세스마다 자기 브라우저(또는 HTTP 세션, hybrid면 HTTP 세션 + 필요할 때만 브라우저)를 열고 (fetch, close) 반환.
+    lean이면 카테고리가 바뀔 때마다 lean_allowlist의 그 카테고리 허용 목록으로 차단 목록을 다시 적용
+    """
+    if backend == "http":
+        from http_fetcher import AlbumHttpFetcher
+        from session_store import apply_to_session
+        fetcher = AlbumHttpFetcher()
+        apply_to_session(fetcher.session, cookies or [])
+        return fetcher.fetch_page, fetcher.close
+    if backend == "api":
+        from session_store import apply_to_session
+        from article_api import ArticleApiClient
+        fetcher = ArticleApiClient(api_base, page_size=page_size)
+        apply_to_session(fetcher.session, cookies or [])
+        return fetcher.fetch_page, fetcher.close
+    if backend == "hybrid":
+        from hybrid_fetcher import HybridFetcher
+        fetcher = HybridFetcher(cookies or [], wait_timeout=wait_timeout, lean=lean, lean_allowlist=lean_allowlist)
+        return fetcher.fetch_page, fetcher.close
+
+    from crawl_common import setup_driver
+    from album import extract_album_items, build_album_page_url, ALBUM_ITEM_SELECTOR
+    from waits import wait_for_selector
+    profile = None
+    if lean:
+        from lean_profile import LeanProfile
+        profile = LeanProfile(allowlist=lean_allowlist)
+    driver = setup_driver(profile)
+    if cookies:
+        # 로그인한 브라우저(또는 저장된 세션)의 쿠키를 넘겨받아 같은 세션으로 접속
+        from session_store import apply_to_driver
+        apply_to_driver(driver, cookies)
+    # 차단 목록을 적용한 카테고리 (main_parallel 워커는 여러 카테고리를 이어서 수집)
+    attached = {"category": None}
+
+    def fetch(category_url, page, category_name):
+        if profile is not None and attached["category"] != category_name:
+            profile.attach(driver, category_name)
+            attached["category"] = category_name
+        driver.get(build_album_page_url(category_url, page))
+        wait_for_selector(driver, ALBUM_ITEM_SELECTOR, wait_timeout)
+        rows = extract_album_items(driver, category_name)
+        if profile is not None:
+            profile.record_page(driver)
+        return rows
+
+    def close():
+        if profile is not None:
+            print(f"네트워크 절약: {profile.report()}")
+        driver.quit()
+    return fetch, close
+
+
+def _shard_worker(worker_id, task_queue, done_queue, backend, category_url, category_name, shard_dir, cookies, wait_timeout, lean=False,
+                  api_base=None, page_size=20, lean_allowlist=None):
+    fetch, close = open_page_fetcher(backend, cookies, wait_timeout, lean, api_base, page_size, lean_allowlist)
+    try:
+        while True:
+            try:
+                chunk = task_queue.get(timeout=1)
+            except Empty:
+                break
+            start_time = time.time()
+            rows = []
+            for page in range(chunk[0], chunk[1] + 1):
+                for attempt in range(2):
+                    try:
+                        page_rows = fetch(category_url, page, category_name)
+                        break
+                    except Exception as e:
+                        print(f"[워커 {worker_id}] 페이지 {page} 수집 실패 ({attempt + 1}회): {e}")
+                        page_rows = None
+                if page_rows is None:
+                    # 실패한 페이지가 있는 구간은 파일을 남기지 않아 다음 라운드에서 다시 수집
+                    rows = None
+                    break
+                rows.extend(dict(row, page=page, position=i) for i, row in enumerate(page_rows))
+            if rows is not None:
+                path = shard_path(shard_dir, chunk)
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=ROW_FIELDS + ["page", "position"])
+                    writer.writeheader()
+                    writer.writerows(rows)
+                os.replace(tmp_path, path)
+            done_queue.put((worker_id, chunk, None if rows is None else len(rows), time.time() - start_time))
+    finally:
+        close()
+
+
+def iter_shard_pages(shard_dir, chunks, start_page=1):
+    """
+    구간 파일들의 start_page부터를 페이지 순서대로 (page, rows)로 돌려줌. 앞 구간에서 이미 나온 article_id는 제외하고,
+    수집하지 못한 구간을 만나면 그 앞 페이지까지만 (이후 페이지를 넘기면 체크포인트의 마지막 페이지가 어긋남)
+    """
+    seen = set()
+    for chunk in chunks:
+        path = shard_path(shard_dir, chunk)
+        if not os.path.exists(path):
+            return
+        with open(path, newline="", encoding="utf-8") as f:
+            shard_rows = list(csv.DictReader(f))
+        pages = {}
+        for row in sorted(shard_rows, key=lambda r: (int(r["page"]), int(r["position"]))):
+            article_id = int(row["article_id"]) if row["article_id"] else None
+            if article_id is None or article_id in seen:
+                continue
+            seen.add(article_id)
+            pages.setdefault(int(row["page"]), []).append(dict({k: row[k] for k in ROW_FIELDS}, article_id=article_id))
+        for page in sorted(pages):
+            if page >= start_page:
+                yield page, pages[page]
+
+
+def crawl_sharded(category_url, category_name, start_page, end_page, on_page, shards=None,
+                  chunk_size=10, backend="browser", cookies=None, wait_timeout=10, max_rounds=3,
+                  resume=False, lean=False, api_base=None, page_size=20, first_page=1, lean_allowlist=None):
+    """
+    한 카테고리의 페이지 범위를 여러 프로세스(각자 브라우저)에 나눠 수집한 뒤 페이지 순서대로 on_page(page, rows)에 넘김
+    (on_page가 False를 반환하면 중단). 수집하지 못한 구간 없이 끝났으면 구간 파일을 지우고 True.
+    구간 디렉터리와 경계는 카테고리 전체 범위(first_page~end_page) 기준이라 --resume으로 start_page가 바뀌어도
+    이미 받은 구간 파일을 그대로 사용
+    """
+    start_time = time.time()
+    shards = shards or os.cpu_count() or 1
+    safe_name = category_name.replace('/', '_')
+    shard_dir = os.path.join("results", "shards", f"{safe_name}_{first_page}-{end_page}")
+    os.makedirs(shard_dir, exist_ok=True)
+    if not resume:
+        for path in glob.glob(os.path.join(shard_dir, "pages_*.csv*")):
+            os.remove(path)
+    chunks = [chunk for chunk in split_page_ranges(first_page, end_page, chunk_size) if chunk[1] >= start_page]
+
+    for round_no in range(1, max_rounds + 1):
+        # 이미 파일이 있는 구간은 건너뜀 (이전 실행/라운드에서 완료)
+        pending = [chunk for chunk in chunks if not os.path.exists(shard_path(shard_dir, chunk))]
+        if not pending:
+            break
+        workers = min(shards, len(pending))
+        print(f"[{category_name}] 라운드 {round_no}: {len(pending)}개 구간을 {workers}개 프로세스로 수집")
+        ctx = mp.get_context("spawn")
+        task_queue = ctx.Queue()
+        done_queue = ctx.Queue()
+        for chunk in pending:
+            task_queue.put(chunk)
+        processes = [
+            ctx.Process(target=_shard_worker, args=(
+                i, task_queue, done_queue, backend, category_url, category_name, shard_dir, cookies, wait_timeout, lean,
+                api_base, page_size, lean_allowlist,
+            ))
+            for i in range(workers)
+        ]
+        for p in processes:
+            p.start()
+        finished = 0
+        while finished < len(pending) and any(p.is_alive() for p in processes):
+            try:
+                worker_id, chunk, count, elapsed = done_queue.get(timeout=1)
+            except Empty:
+                continue
+            finished += 1
+            status = f"{count}건" if count is not None else "실패"
+            print(f"[워커 {worker_id}] 페이지 {chunk[0]}-{chunk[1]} 완료: {status} ({elapsed:.2f}초, 진행 {finished}/{len(pending)})")
+        for p in processes:
+            p.join()
+
+    missing = [chunk for chunk in chunks if not os.path.exists(shard_path(shard_dir, chunk))]
+    if missing:
+        print(f"[{category_name}] 수집하지 못한 구간: {missing} (--resume으로 다시 실행하면 이 구간부터 수집)")
+    for page, rows in iter_shard_pages(shard_dir, chunks, start_page):
+        if not on_page(page, rows):
+            break
+    if not missing:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+    print(f"[{category_name}] 분할 수집 완료 (총 소요시간: {time.time() - start_time:.2f}초)")
+    return not missing
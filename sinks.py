@@ -0,0 +1,252 @@
+import os
+import re
+import csv
+import time
+import threading
+from urllib.parse import quote
+
+ROW_FIELDS = ["category", "status", "title", "price", "nickname", "date", "url", "article_id"]
+OUTPUT_FORMATS = ["csv", "parquet", "sqlite"]
+PARQUET_ROOT = "results/parquet"
+# part 파일 하나(row group)의 최소 행 수 (너무 작은 row group은 압축/읽기 효율이 나쁨)
+PARQUET_MIN_ROWS = 1000
+# Parquet에서 정수로 저장하는 컬럼 (나머지는 문자열)
+INT_FIELDS = {"price", "article_id"}
+
+
+class CsvSink:
+    """
+    파일 핸들 하나를 계속 열어두고 csv.writer로 이어쓰는 저장소.
+    flush_rows/flush_seconds마다 flush하고, fsync 정책은 "never" | "flush" | "close".
+    """
+
+    def __init__(self, path, columns=None, append=False, flush_rows=200, flush_seconds=5.0, fsync="close"):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.columns = columns or ROW_FIELDS
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        is_new = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+        # utf-8-sig로 이어쓰기하면 중간에 BOM이 다시 들어가므로 BOM은 새 파일에만 직접 기록
+        self.file = open(path, "w" if not append else "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        if is_new:
+            self.file.write("\ufeff")
+            self.writer.writerow(self.columns)
+        self.rows_written = 0
+        self.pending = 0
+        self.last_flush = time.time()
+
+    def write_rows(self, rows):
+        """행을 쓰고, 이번 호출에서 flush가 일어났으면 True"""
+        with self._lock:
+            for row in rows:
+                self.writer.writerow(["" if row.get(c) is None else row.get(c) for c in self.columns])
+            self.rows_written += len(rows)
+            self.pending += len(rows)
+            if self.pending >= self.flush_rows or time.time() - self.last_flush >= self.flush_seconds:
+                self._flush()
+                return True
+            return False
+
+    def _flush(self):
+        self.file.flush()
+        if self.fsync == "flush":
+            os.fsync(self.file.fileno())
+        self.pending = 0
+        self.last_flush = time.time()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if self.file.closed:
+                return
+            self._flush()
+            if self.fsync in ("flush", "close"):
+                os.fsync(self.file.fileno())
+            self.file.close()
+
+
+def to_int(value):
+    """"17,000원" 같은 문자열에서 숫자만 뽑아 정수로 (숫자가 없으면 None)"""
+    if value is None or isinstance(value, int):
+        return value
+    digits = re.sub(r"[^\d]", "", str(value))
+    return int(digits) if digits else None
+
+
+def partition_dir(root, category, crawl_date=None):
+    """category=<이름>/crawl_date=<YYYY-MM-DD> 형식의 파티션 디렉터리 (이름은 URL 인코딩)"""
+    crawl_date = crawl_date or time.strftime("%Y-%m-%d")
+    return os.path.join(root, f"category={quote(category, safe='')}", f"crawl_date={crawl_date}")
+
+
+class ParquetSink:
+    """
+    카테고리/수집일 파티션 디렉터리에 flush 단위로 part 파일(= row group 하나)을 추가하는 저장소.
+    category는 파티션 경로에 들어가므로 파일에는 저장하지 않음. pyarrow 필요.
+    시간 기준 flush는 min_rows 이상 쌓였을 때만 하므로, min_rows보다 작은 part는
+    명시적인 flush()/close()(카테고리 끝, 실행 끝)에서만 생김.
+    """
+
+    def __init__(self, path, columns=None, flush_rows=5000, flush_seconds=60.0, fsync="close", compression="zstd",
+                 min_rows=PARQUET_MIN_ROWS):
+        import pyarrow as pa
+        self.pa = pa
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.columns = [c for c in (columns or ROW_FIELDS) if c != "category"]
+        # 정규화 단계(normalize.normalize_rows)가 채운 시각/상태 코드도 typed 컬럼으로 함께 저장
+        self.schema = pa.schema(
+            [(c, pa.int64() if c in INT_FIELDS else pa.string()) for c in self.columns]
+            + [("posted_at", pa.timestamp("s")), ("status_code", pa.int8())]
+        )
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.min_rows = min_rows
+        self.fsync = fsync
+        self.compression = compression
+        self.run_id = time.strftime("%Y%m%d_%H%M%S")
+        self._lock = threading.Lock()
+        self.buffer = []
+        self.parts = 0
+        self.rows_written = 0
+        self.last_flush = time.time()
+
+    def write_rows(self, rows):
+        """행을 버퍼에 쌓고, 이번 호출에서 part 파일을 썼으면 True"""
+        with self._lock:
+            self.buffer.extend(rows)
+            self.rows_written += len(rows)
+            if len(self.buffer) >= self.flush_rows or (
+                len(self.buffer) >= self.min_rows and time.time() - self.last_flush >= self.flush_seconds
+            ):
+                self._flush()
+                return True
+            return False
+
+    def _flush(self):
+        self.last_flush = time.time()
+        if not self.buffer:
+            return
+        import pyarrow.parquet as pq
+        data = {
+            c: [to_int(row.get(c)) if c in INT_FIELDS else (None if row.get(c) is None else str(row.get(c)))
+                for row in self.buffer]
+            for c in self.columns
+        }
+        data["posted_at"] = [row.get("posted_at") for row in self.buffer]
+        data["status_code"] = [row.get("status_code") for row in self.buffer]
+        table = self.pa.Table.from_pydict(data, schema=self.schema)
+        path = os.path.join(self.path, f"part-{self.run_id}-{self.parts:05d}.parquet")
+        # 다 쓴 part 파일만 보이도록 임시 파일에 쓰고 교체 (쓰다 죽으면 이 배치는 체크포인트에도 없음)
+        tmp_path = path + ".tmp"
+        pq.write_table(table, tmp_path, compression=self.compression, row_group_size=len(self.buffer))
+        if self.fsync != "never":
+            with open(tmp_path, "rb") as f:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self.parts += 1
+        self.buffer = []
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+
+
+class SqliteSink:
+    """
+    flush 단위로 한 트랜잭션씩 ListingStore에 upsert하는 저장소.
+    모든 카테고리가 같은 DB 파일을 쓰고, 컬럼은 항상 ROW_FIELDS 전체를 저장.
+    """
+
+    # 이미 수집한 글을 다시 만나면 버리지 않고 refresh_rows로 넘겨받아 상태/가격 갱신
+    upsert = True
+
+    def __init__(self, path, flush_rows=200, flush_seconds=5.0):
+        from listing_store import ListingStore
+        self.store = ListingStore(path)
+        self.path = path
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self.buffer = []
+        self.refresh_buffer = []
+        self.rows_written = 0
+        self.last_flush = time.time()
+
+    def refresh_rows(self, rows):
+        """이미 수집한 글의 행을 쌓아 두었다가 다음 flush에서 DB에 있는 글만 갱신 (새로 추가하지 않음)"""
+        with self._lock:
+            self.refresh_buffer.extend(rows)
+
+    def write_rows(self, rows):
+        """행을 버퍼에 쌓고, 이번 호출에서 DB에 반영했으면 True"""
+        with self._lock:
+            self.buffer.extend(rows)
+            if len(self.buffer) >= self.flush_rows or time.time() - self.last_flush >= self.flush_seconds:
+                self._flush()
+                return True
+            return False
+
+    def _flush(self):
+        if self.buffer:
+            self.rows_written += self.store.upsert_rows(self.buffer)
+            self.buffer = []
+        if self.refresh_buffer:
+            self.store.refresh_rows(self.refresh_buffer)
+            self.refresh_buffer = []
+        self.last_flush = time.time()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if self.store.conn is None:
+                return
+            self._flush()
+            self.store.close()
+            self.store.conn = None
+
+
+def open_sink(output_format, path, columns=None, append=False, flush_rows=200, fsync="close"):
+    """
+    output_format("csv" | "parquet" | "sqlite")에 맞는 저장소 생성.
+    parquet이면 path는 파티션 디렉터리, sqlite면 DB 파일 (sqlite는 트랜잭션 단위라 fsync 설정 무시).
+    columns는 CSV에만 적용 (Parquet/SQLite는 article_id, url을 포함한 ROW_FIELDS 전체를 저장)
+    """
+    if output_format == "sqlite":
+        return SqliteSink(path, flush_rows=flush_rows)
+    if output_format == "parquet":
+        return ParquetSink(path, ROW_FIELDS, flush_rows=max(flush_rows, PARQUET_MIN_ROWS), fsync=fsync)
+    return CsvSink(path, columns, append=append, flush_rows=flush_rows, fsync=fsync)
+
+
+def read_parquet(root=PARQUET_ROOT, columns=None, categories=None, start_date=None, end_date=None):
+    """필요한 컬럼/파티션만 읽어 DataFrame으로 (날짜는 YYYY-MM-DD 문자열)"""
+    import pyarrow.dataset as ds
+    import pyarrow as pa
+    partitioning = ds.partitioning(pa.schema([("category", pa.string()), ("crawl_date", pa.string())]), flavor="hive")
+    dataset = ds.dataset(root, format="parquet", partitioning=partitioning)
+    conditions = []
+    if categories:
+        conditions.append(ds.field("category").isin(list(categories)))
+    if start_date:
+        conditions.append(ds.field("crawl_date") >= start_date)
+    if end_date:
+        conditions.append(ds.field("crawl_date") <= end_date)
+    flt = None
+    for condition in conditions:
+        flt = condition if flt is None else flt & condition
+    return dataset.to_table(columns=columns, filter=flt).to_pandas()
@@ -0,0 +1,276 @@
+import os
+import math
+import time
+import sqlite3
+import argparse
+import pandas as pd
+from normalize import Status, status_codes, parse_posted_at
+from sinks import CsvSink
+
+DEFAULT_TRACKER_PATH = "results/status_tracker.db"
+EVENTS_CSV = "results/status_events.csv"
+EVENT_FIELDS = ["article_id", "category", "old_status", "new_status", "observed_at", "age_hours"]
+
+# 카테고리별 판매 속도를 추정할 때 쓰는 사전값: 관측이 없으면 "평균 7일에 한 번 판매완료"로 가정
+PRIOR_SOLD = 1.0
+PRIOR_HOURS = 7 * 24.0
+# 등록 후 이 일수가 지날 때마다 재확인 우선순위를 절반으로 (오래된 글일수록 상태가 덜 바뀜)
+AGE_HALF_LIFE_DAYS = 7.0
+# 이보다 오래된 글은 다시 확인하지 않음
+MAX_AGE_DAYS = 60
+# 상세 페이지를 연속으로 이만큼 가져오지 못한 글(삭제/비공개 등)은 다시 확인하지 않음
+MAX_FAILED_CHECKS = 3
+
+
+class StatusTracker:
+    """
+    글별 상태(처음 본 시각, 마지막 상태, 마지막 확인 시각)를 SQLite에 유지하면서
+    상태가 바뀌면 이벤트를 기록하고, 카테고리별 판매 속도로 다시 확인할 글을 고름.
+    """
+
+    def __init__(self, path=DEFAULT_TRACKER_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS article_state ("
+            " article_id INTEGER PRIMARY KEY,"
+            " category TEXT,"
+            " url TEXT,"
+            " posted_at REAL,"
+            " first_seen REAL,"
+            " last_status INTEGER,"
+            " last_checked REAL,"
+            " checks INTEGER,"
+            " failures INTEGER DEFAULT 0"
+            ") WITHOUT ROWID"
+        )
+        # failures 컬럼이 없던 이전 DB
+        if "failures" not in {row[1] for row in self.conn.execute("PRAGMA table_info(article_state)")}:
+            self.conn.execute("ALTER TABLE article_state ADD COLUMN failures INTEGER DEFAULT 0")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS status_events ("
+            " article_id INTEGER,"
+            " category TEXT,"
+            " old_status TEXT,"
+            " new_status TEXT,"
+            " observed_at REAL,"
+            " age_hours REAL"
+            ")"
+        )
+        # 카테고리별로 판매중 상태를 지켜본 누적 시간과 그동안의 판매완료 전환 수
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS category_rates ("
+            " category TEXT PRIMARY KEY,"
+            " active_hours REAL,"
+            " sold_events INTEGER"
+            ")"
+        )
+        self.conn.commit()
+
+    def observe(self, rows, now=None):
+        """
+        목록/상세 페이지에서 본 행들(article_id, category, status 또는 status_code, posted_at)을 반영하고
+        이번에 생긴 상태 전환 이벤트 목록을 반환
+        """
+        now = now or time.time()
+        rows = [row for row in rows if row.get("article_id") is not None]
+        if not rows:
+            return []
+        frame = pd.DataFrame(rows)
+        if "status_code" not in frame.columns:
+            frame["status_code"] = status_codes(frame.get("status", pd.Series(None, index=frame.index)))
+        if "posted_at" not in frame.columns:
+            frame["posted_at"] = parse_posted_at(frame.get("date", pd.Series(None, index=frame.index)),
+                                                 pd.Timestamp.fromtimestamp(now))
+        ids = [int(i) for i in frame["article_id"]]
+        previous = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for article_id, category, last_status, last_checked, posted_at in self.conn.execute(
+                "SELECT article_id, category, last_status, last_checked, posted_at FROM article_state"
+                f" WHERE article_id IN ({placeholders})", chunk
+            ):
+                previous[article_id] = (category, last_status, last_checked, posted_at)
+
+        events = []
+        rate_updates = {}
+        states = []
+        for article_id, row in zip(ids, frame.to_dict("records")):
+            status = int(row["status_code"])
+            posted_at = row.get("posted_at")
+            posted_ts = None if posted_at is None or pd.isna(posted_at) else pd.Timestamp(posted_at).to_pydatetime().timestamp()
+            category = row.get("category")
+            if article_id in previous:
+                old_category, old_status, last_checked, old_posted = previous[article_id]
+                category = category or old_category
+                posted_ts = old_posted or posted_ts
+                if old_status != Status.SOLD:
+                    # 판매중으로 지켜본 시간을 카테고리 판매 속도 추정에 누적
+                    hours, sold = rate_updates.get(category, (0.0, 0))
+                    rate_updates[category] = (
+                        hours + max(0.0, now - last_checked) / 3600, sold + (status == Status.SOLD)
+                    )
+                if status != Status.UNKNOWN and status != old_status:
+                    age_hours = (now - posted_ts) / 3600 if posted_ts else None
+                    events.append({
+                        "article_id": article_id, "category": category, "old_status": Status(old_status).name,
+                        "new_status": Status(status).name, "observed_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+                        "age_hours": None if age_hours is None else round(age_hours, 1),
+                    })
+                if status == Status.UNKNOWN:
+                    status = old_status
+            states.append((article_id, category, row.get("url"), posted_ts, now, status, now))
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO article_state (article_id, category, url, posted_at, first_seen, last_status, last_checked, checks, failures)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, 1, 0)"
+                " ON CONFLICT(article_id) DO UPDATE SET"
+                " last_status = excluded.last_status, last_checked = excluded.last_checked,"
+                " url = COALESCE(excluded.url, url), posted_at = COALESCE(posted_at, excluded.posted_at),"
+                " checks = checks + 1, failures = 0",
+                states,
+            )
+            self.conn.executemany(
+                "INSERT INTO status_events (article_id, category, old_status, new_status, observed_at, age_hours)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(e["article_id"], e["category"], e["old_status"], e["new_status"], now, e["age_hours"]) for e in events],
+            )
+            self._add_rates(rate_updates)
+        return events
+
+    def _add_rates(self, rate_updates):
+        self.conn.executemany(
+            "INSERT INTO category_rates (category, active_hours, sold_events) VALUES (?, ?, ?)"
+            " ON CONFLICT(category) DO UPDATE SET"
+            " active_hours = active_hours + excluded.active_hours, sold_events = sold_events + excluded.sold_events",
+            [(category, hours, sold) for category, (hours, sold) in rate_updates.items()],
+        )
+
+    def record_failures(self, article_ids, now=None):
+        """
+        상세 페이지를 가져오지 못한 글도 확인한 것으로 기록 (last_checked를 옮겨 바로 다시 뽑히지 않게 함).
+        그동안 지켜본 시간은 판매 속도 추정에 그대로 누적하고, 연속 실패가 MAX_FAILED_CHECKS번이면 더 이상 고르지 않음.
+        이번에 제외된 글 수를 반환
+        """
+        now = now or time.time()
+        ids = [int(i) for i in article_ids]
+        rate_updates = {}
+        dropped = 0
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for category, last_status, last_checked, failures in self.conn.execute(
+                "SELECT category, last_status, last_checked, failures FROM article_state"
+                f" WHERE article_id IN ({placeholders})", chunk
+            ):
+                if last_status != Status.SOLD:
+                    hours, sold = rate_updates.get(category, (0.0, 0))
+                    rate_updates[category] = (hours + max(0.0, now - last_checked) / 3600, sold)
+                dropped += (failures or 0) + 1 == MAX_FAILED_CHECKS
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE article_state SET last_checked = ?, checks = checks + 1, failures = COALESCE(failures, 0) + 1"
+                " WHERE article_id = ?",
+                [(now, article_id) for article_id in ids],
+            )
+            self._add_rates(rate_updates)
+        return dropped
+
+    def sold_rates(self):
+        """카테고리별 시간당 판매완료 전환율 (사전값으로 보정)"""
+        return {
+            category: (sold + PRIOR_SOLD) / (hours + PRIOR_HOURS)
+            for category, hours, sold in self.conn.execute("SELECT category, active_hours, sold_events FROM category_rates")
+        }
+
+    def pick_articles(self, budget, now=None, category=None):
+        """
+        마지막 확인 이후 상태가 바뀌었을 확률(1 - exp(-판매율 × 경과 시간))에 등록 후 경과일 가중치를 곱해
+        우선순위가 높은 판매완료 전 글부터 budget개 반환 → [(article_id, url, 우선순위)]
+        """
+        now = now or time.time()
+        rates = self.sold_rates()
+        default_rate = PRIOR_SOLD / PRIOR_HOURS
+        query = ("SELECT article_id, category, url, posted_at, first_seen, last_checked FROM article_state"
+                 " WHERE last_status != ? AND COALESCE(failures, 0) < ?")
+        params = [int(Status.SOLD), MAX_FAILED_CHECKS]
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        candidates = []
+        for article_id, cat, url, posted_at, first_seen, last_checked in self.conn.execute(query, params):
+            age_days = (now - (posted_at or first_seen)) / 86400
+            if age_days > MAX_AGE_DAYS:
+                continue
+            elapsed_hours = max(0.0, now - last_checked) / 3600
+            changed = 1 - math.exp(-rates.get(cat, default_rate) * elapsed_hours)
+            weight = 0.5 ** (max(0.0, age_days) / AGE_HALF_LIFE_DAYS)
+            candidates.append((article_id, url, changed * weight))
+        candidates.sort(key=lambda c: c[2], reverse=True)
+        return candidates[:budget]
+
+    def sell_through(self):
+        """카테고리별 추적 글 수, 판매완료 비율, 판매완료까지 걸린 시간 중앙값(시간)"""
+        states = pd.read_sql_query("SELECT category, last_status FROM article_state", self.conn)
+        events = pd.read_sql_query(
+            "SELECT category, age_hours FROM status_events WHERE new_status = ?", self.conn, params=(Status.SOLD.name,)
+        )
+        report = states.groupby("category").agg(
+            tracked=("last_status", "size"), sold=("last_status", lambda s: int((s == Status.SOLD).sum()))
+        )
+        report["sell_through"] = (report["sold"] / report["tracked"]).round(3)
+        report["median_hours_to_sold"] = events.groupby("category")["age_hours"].median()
+        return report
+
+    def close(self):
+        self.conn.close()
+
+
+def append_events(events, path=EVENTS_CSV):
+    """상태 전환 이벤트를 CSV에 이어씀"""
+    if not events:
+        return
+    sink = CsvSink(path, EVENT_FIELDS, append=True)
+    sink.write_rows(events)
+    sink.close()
+
+
+if __name__ == "__main__":
+    from crawler import JoonggoCrawler
+    from enrich import ArticleCache, DetailEnricher
+
+    parser = argparse.ArgumentParser(description="상태가 바뀌었을 가능성이 큰 글부터 상세 페이지를 다시 확인")
+    parser.add_argument("--budget", type=int, default=200, help="이번 실행에서 확인할 최대 글 수")
+    parser.add_argument("--category", default=None)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--report", action="store_true", help="재확인 없이 카테고리별 판매완료 비율만 출력")
+    args = parser.parse_args()
+
+    tracker = StatusTracker()
+    if args.report:
+        print(tracker.sell_through())
+    else:
+        picked = tracker.pick_articles(args.budget, category=args.category)
+        print(f"재확인 대상: {len(picked)}건")
+        if picked:
+            crawler = JoonggoCrawler(headless=args.headless, max_workers=args.workers)
+            cache = ArticleCache()
+            try:
+                details = DetailEnricher(crawler, cache).fetch_many([i for i, _, _ in picked], {i: u for i, u, _ in picked})
+            finally:
+                cache.close()
+                crawler.close()
+            events = tracker.observe([d for d in details.values() if d is not None])
+            append_events(events)
+            print(f"상태 전환 {len(events)}건 기록: {EVENTS_CSV}")
+            failed = [i for i, d in details.items() if d is None]
+            if failed:
+                dropped = tracker.record_failures(failed)
+                print(f"상세 페이지 실패 {len(failed)}건 (연속 {MAX_FAILED_CHECKS}번 실패로 재확인 제외: {dropped}건)")
+    tracker.close()
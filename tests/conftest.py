@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 모듈이 저장소 루트에 바로 있으므로 어디서 pytest를 실행해도 import되게 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,63 @@
+import os
+import threading
+from datetime import datetime
+import pytest
+from article_api import ArticleApiClient, serve_recorded, map_article, parse_article_list
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "api")
+CATEGORY_URL = "https://cafe.naver.com/f-e/cafes/10050146/menus/364"
+ARTICLE = "https://cafe.naver.com/f-e/cafes/10050146/articles/{}?menuid=364"
+
+
+def list_date(timestamp_ms):
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime("%Y.%m.%d.")
+
+
+@pytest.fixture
+def api_base():
+    server = serve_recorded(FIXTURES, 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_page_against_recorded_responses(api_base):
+    client = ArticleApiClient(api_base)
+    try:
+        first = client.fetch_page(CATEGORY_URL, 1, "여성패션_의류")
+        second = client.fetch_page(CATEGORY_URL, 2, "여성패션_의류")
+        end = client.fetch_page(CATEGORY_URL, 3, "여성패션_의류")
+    finally:
+        client.close()
+
+    # 광고 항목은 빠지고 목록 화면과 같은 행 형식
+    assert first == [
+        {"category": "여성패션_의류", "status": "판매중", "title": "자라 트위드 자켓 S사이즈 팝니다", "price": "35,000원",
+         "nickname": "옷장정리중", "date": list_date(1748689200000), "url": ARTICLE.format(1087654321),
+         "article_id": 1087654321},
+        {"category": "여성패션_의류", "status": "예약중", "title": "마르헨제이 숄더백 블랙", "price": "17,000원",
+         "nickname": "가방부자", "date": list_date(1748653200000), "url": ARTICLE.format(1087654300),
+         "article_id": 1087654300},
+        {"category": "여성패션_의류", "status": "", "title": "아이 옷 무료나눔해요", "price": "",
+         "nickname": "나눔천사", "date": list_date(1748566800000), "url": ARTICLE.format(1087654288),
+         "article_id": 1087654288},
+    ]
+    # message로 한 번 감싼 응답도 같은 형식
+    assert [(row["article_id"], row["status"], row["price"]) for row in second] == [(1087654201, "판매완료", "20,000원")]
+    # 저장된 응답이 없는 페이지는 게시판 끝
+    assert end == []
+
+
+def test_map_article_today_uses_clock_time():
+    now = datetime(2025, 5, 31, 20, 0)
+    entry = {"item": {"articleId": 1, "subject": "글", "writeDateTimestamp": datetime(2025, 5, 31, 14, 14).timestamp() * 1000}}
+    row = map_article(entry, "의류", "10050146", "364", now)
+    assert row["date"] == "14:14"
+    assert row["status"] == "" and row["price"] == ""
+    assert map_article({"item": {}}, "의류", "10050146", "364", now) is None
+
+
+def test_error_response_is_an_empty_page():
+    assert parse_article_list({"message": "Unauthorized"}, "의류", "10050146", "364") == []
+    assert parse_article_list({}, "의류", "10050146", "364") == []
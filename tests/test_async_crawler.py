@@ -0,0 +1,53 @@
+import time
+import random
+import threading
+from async_crawler import AsyncPageCrawler
+
+
+def jobs(*pages):
+    return [{"url": f"https://cafe.naver.com/f-e/cafes/1/menus/{i}", "name": f"cat{i}", "start_page": 1, "end_page": n}
+            for i, n in enumerate(pages)]
+
+
+def test_pages_are_delivered_in_order_per_category():
+    def fetch_page(url, page, name):
+        time.sleep(random.uniform(0, 0.01))
+        return [{"page": page}]
+
+    delivered = {}
+    states = AsyncPageCrawler(fetch_page, concurrency=8, rate=0).run(
+        jobs(12, 7), lambda job, page, rows: delivered.setdefault(job["name"], []).append(page)
+    )
+    assert delivered == {"cat0": list(range(1, 13)), "cat1": list(range(1, 8))}
+    assert [state["failed_page"] for state in states] == [None, None]
+
+
+def test_on_page_false_stops_the_category():
+    delivered = []
+    AsyncPageCrawler(lambda url, page, name: [page], concurrency=4, rate=0).run(
+        jobs(10), lambda job, page, rows: delivered.append(page) or page < 3
+    )
+    assert delivered == [1, 2, 3]
+
+
+def test_failed_page_stops_delivery_before_it():
+    attempts = {}
+    lock = threading.Lock()
+
+    def fetch_page(url, page, name):
+        with lock:
+            attempts[page] = attempts.get(page, 0) + 1
+        if page == 3:
+            raise ConnectionError("reset")
+        return [page]
+
+    delivered = []
+    start_time = time.time()
+    states = AsyncPageCrawler(fetch_page, concurrency=4, rate=0, retries=1).run(
+        jobs(8), lambda job, page, rows: delivered.append(page)
+    )
+    assert delivered == [1, 2]
+    assert states[0]["failed_page"] == 3
+    assert attempts[3] == 2
+    # 마지막 시도 뒤에는 기다리지 않음 (재시도 전 1초만)
+    assert time.time() - start_time < 1.9
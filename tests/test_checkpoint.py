@@ -0,0 +1,81 @@
+import os
+from checkpoint import CrawlCheckpoint
+from sinks import CsvSink, ROW_FIELDS
+
+
+def rows(ids):
+    return [{"category": "의류", "title": f"글 {i}", "article_id": i} for i in ids]
+
+
+def test_record_and_reload(tmp_path):
+    output = str(tmp_path / "의류.csv")
+    sink = CsvSink(output, ROW_FIELDS)
+    sink.write_rows(rows([10, 9]))
+    sink.flush()
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.record_page("menu:364", 1, output, [10, 9], max_id=10)
+    sink.close()
+
+    reloaded = CrawlCheckpoint(checkpoint.path)
+    assert reloaded.load()
+    entry = reloaded.get("menu:364")
+    assert entry["last_page"] == 1
+    assert entry["pending_ids"] == [9, 10]
+    assert entry["rows"] == 2
+    assert entry["max_id"] == 10
+    assert entry["offset"] == os.path.getsize(output)
+    assert not entry["done"]
+
+    reloaded.mark_done("menu:364")
+    assert CrawlCheckpoint(checkpoint.path).load()
+    assert reloaded.get("menu:364")["done"]
+
+
+def test_record_page_keeps_only_latest_batch(tmp_path):
+    output = str(tmp_path / "의류.csv")
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.record_page("menu:364", 1, output, [10, 9], max_id=10)
+    checkpoint.record_page("menu:364", 2, output, [8, 7, 6], max_id=10)
+
+    entry = CrawlCheckpoint(checkpoint.path)
+    assert entry.load()
+    # 앞 묶음은 이미 인덱스에 들어갔으므로 체크포인트가 실행 내내 커지지 않음
+    assert entry.pending_ids("menu:364") == [6, 7, 8]
+    assert entry.get("menu:364")["rows"] == 5
+    assert entry.get("menu:364")["last_page"] == 2
+
+
+def test_pending_ids_reads_old_seen_ids(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.data["categories"]["menu:364"] = {"seen_ids": [1, 2], "last_page": 3}
+    assert checkpoint.pending_ids("menu:364") == [1, 2]
+    assert checkpoint.pending_ids("menu:999") == []
+
+
+def test_restore_output_truncates_rows_after_checkpoint(tmp_path):
+    output = str(tmp_path / "의류.csv")
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    sink = CsvSink(output, ROW_FIELDS)
+    sink.write_rows(rows([10, 9]))
+    sink.flush()
+    checkpoint.record_page("menu:364", 1, output, [10, 9])
+    saved = open(output, "rb").read()
+
+    # 체크포인트 기록 전에 중단된 다음 페이지 (마지막 행은 절반만 쓰임)
+    sink.write_rows(rows([8, 7]))
+    sink.flush()
+    sink.file.write("의류,,반쯤")
+    sink.close()
+
+    assert checkpoint.restore_output("menu:364") == output
+    assert open(output, "rb").read() == saved
+    assert checkpoint.restore_output("menu:999") is None
+
+
+def test_clear_removes_file(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.mark_done("menu:364")
+    assert os.path.exists(checkpoint.path)
+    checkpoint.clear()
+    assert not os.path.exists(checkpoint.path)
+    assert checkpoint.get("menu:364") is None
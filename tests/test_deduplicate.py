@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+from sinks import CsvSink, ROW_FIELDS
+from deduplicate_results import deduplicate
+
+
+def write_csv(path, article_ids):
+    sink = CsvSink(str(path), ROW_FIELDS)
+    sink.write_rows([
+        {"category": "의류", "title": f"{path.stem}-{article_id}", "article_id": article_id}
+        for article_id in article_ids
+    ])
+    sink.close()
+    return str(path)
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    return [
+        write_csv(tmp_path / "a.csv", [1, 2, 3, None]),
+        write_csv(tmp_path / "b.csv", [3, 4, 2]),
+        write_csv(tmp_path / "c.csv", [5, 1, None]),
+    ]
+
+
+@pytest.mark.parametrize("partitions", [1, 3])
+def test_keeps_first_row_per_article(tmp_path, inputs, partitions):
+    output = str(tmp_path / "out.csv")
+    written, stats = deduplicate(inputs, output, chunksize=2, partitions=partitions)
+
+    out = pd.read_csv(output, encoding="utf-8-sig")
+    assert written == 5
+    assert sorted(out["article_id"]) == [1, 2, 3, 4, 5]
+    # 중복이면 가장 앞 파일의 행이 남음
+    assert dict(zip(out["article_id"], out["title"])) == {1: "a-1", 2: "a-2", 3: "a-3", 4: "b-4", 5: "c-5"}
+    assert stats.rows == [4, 3, 3]
+    assert stats.first_seen == [3, 1, 1]
+    assert stats.duplicates == [0, 2, 1]
+    assert stats.missing_id == 2
+    assert stats.last_seen == [0, 3, 2]
@@ -0,0 +1,69 @@
+import pytest
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise ConnectionError("세션 종료")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Factory:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        driver = FakeDriver(len(self.created))
+        self.created.append(driver)
+        return driver
+
+
+def test_unhealthy_idle_driver_is_replaced():
+    factory = Factory()
+    pool = DriverPool(factory, size=2).start()
+    assert len(factory.created) == 2
+    for driver in factory.created:
+        driver.alive = False
+
+    with pool.lease() as driver:
+        assert driver.alive
+        assert driver.number == 2
+    assert all(d.quit_called for d in factory.created[:2])
+    pool.close()
+    assert factory.created[2].quit_called
+
+
+def test_driver_broken_during_lease_is_not_reused():
+    factory = Factory()
+    pool = DriverPool(factory, size=1)
+    with pytest.raises(RuntimeError):
+        with pool.lease() as driver:
+            driver.alive = False
+            raise RuntimeError("페이지 로드 실패")
+    assert driver.quit_called
+
+    with pool.lease() as replacement:
+        assert replacement is not driver and replacement.alive
+    # 정상 반납한 드라이버는 다시 빌려줌
+    with pool.lease() as again:
+        assert again is replacement
+    pool.close()
+
+
+def test_checkout_times_out_when_pool_is_busy():
+    pool = DriverPool(Factory(), size=1, checkout_timeout=0.2)
+    with pool.lease():
+        with pytest.raises(TimeoutError):
+            pool.checkout()
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.checkout()
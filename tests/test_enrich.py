@@ -0,0 +1,13 @@
+from enrich import load_article_ids
+
+
+def test_load_article_ids_skips_files_without_article_id(tmp_path, capsys):
+    album = tmp_path / "album.csv"
+    album.write_text("article_id,url\n101,https://cafe.naver.com/a/101\n102,\nabc,\n", encoding="utf-8-sig")
+    mobile = tmp_path / "mobile.csv"
+    mobile.write_text("title,url\n아이폰,https://cafe.naver.com/a/9\n", encoding="utf-8-sig")
+
+    urls = load_article_ids([str(mobile), str(album)])
+
+    assert urls == {101: "https://cafe.naver.com/a/101", 102: None}
+    assert str(mobile) in capsys.readouterr().out
@@ -0,0 +1,82 @@
+import os
+import warnings
+from filtering_postprocessing import KeywordFilter
+
+RULES = {
+    "default": {"columns": ["title", "nickname"], "exclude_keywords": ["매입"]},
+    "중고폰": {"exclude_keywords": ["삽니다"], "exclude_regex": [r"\d{2,3}-\d{3,4}-\d{4}"]},
+    "중고폰_모바일": {"exclude_keywords": ["삽니다", "최고가"]},
+    "명품": {"columns": ["title"], "include_keywords": ["정품"]},
+}
+
+
+def titles(rows):
+    return [row["title"] for row in rows]
+
+
+def test_default_rule_checks_title_and_nickname():
+    keep, dropped = KeywordFilter(RULES).filter_rows([
+        {"category": "의류", "title": "자켓 팝니다", "nickname": "정리중"},
+        {"category": "의류", "title": "옷 팝니다", "nickname": "의류매입"},
+        {"category": "의류", "title": "명품 매입합니다", "nickname": "업자"},
+    ])
+    assert titles(keep) == ["자켓 팝니다"]
+    assert titles(dropped) == ["옷 팝니다", "명품 매입합니다"]
+
+
+def test_longest_prefix_rule_adds_to_default():
+    keyword_filter = KeywordFilter(RULES)
+    keep, dropped = keyword_filter.filter_rows([
+        {"title": "아이폰 15 팝니다", "nickname": "a"},
+        {"title": "아이폰 삽니다", "nickname": "b"},
+        {"title": "최고가 매입", "nickname": "c"},
+        {"title": "최고가 보장", "nickname": "d"},
+    ], category="중고폰_모바일_추천")
+    assert titles(keep) == ["아이폰 15 팝니다"]
+    assert len(dropped) == 3
+    # 가장 긴 접두어 규칙 하나만 더하므로 "중고폰"의 전화번호 규칙은 적용되지 않음
+    keep, _ = keyword_filter.filter_rows([{"title": "연락 010-1234-5678", "nickname": "e"}], category="중고폰_모바일")
+    assert len(keep) == 1
+    # "중고폰" 규칙만 적용되는 카테고리에서는 "최고가"를 거르지 않음
+    keep, _ = keyword_filter.filter_rows([{"title": "최고가 보장", "nickname": "d"}], category="중고폰_태블릿")
+    assert titles(keep) == ["최고가 보장"]
+
+
+def test_include_rule_and_column_override():
+    keep, _ = KeywordFilter(RULES).filter_rows([
+        {"title": "정품 가방", "nickname": "a"},
+        {"title": "가방", "nickname": "정품러"},
+    ], category="명품_가방")
+    assert titles(keep) == ["정품 가방"]
+
+
+def test_rows_use_their_own_category_when_not_given():
+    keep, _ = KeywordFilter(RULES).filter_rows([
+        {"category": "중고폰_모바일", "title": "폰 삽니다", "nickname": "a"},
+        {"category": "의류", "title": "폰 삽니다", "nickname": "a"},
+    ])
+    assert [row["category"] for row in keep] == ["의류"]
+
+
+def test_empty_rows():
+    assert KeywordFilter(RULES).filter_rows([]) == ([], [])
+
+
+def test_shipped_rules_load():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "filter_rules.json")
+    keyword_filter = KeywordFilter.load(path)
+    keep, _ = keyword_filter.filter_rows([{"title": "갤럭시 최고가 삽니다", "nickname": "x"}], category="중고폰_모바일")
+    assert keep == []
+
+
+def test_group_regex_does_not_warn_or_change_global_filters():
+    rules = KeywordFilter({"default": {"exclude_regex": [r"(카톡|카카오톡)\s*문의"]}})
+    rows = [{"category": "의류", "title": "카톡 문의 주세요"}, {"category": "의류", "title": "자켓 팝니다"}]
+    before = list(warnings.filters)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        kept, dropped = rules.filter_rows(rows)
+    assert [r["title"] for r in kept] == ["자켓 팝니다"]
+    assert [r["title"] for r in dropped] == ["카톡 문의 주세요"]
+    assert not [w for w in caught if "regular expression" in str(w.message)]
+    assert warnings.filters == before
@@ -0,0 +1,66 @@
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from album import make_album_row
+from http_fetcher import AlbumHttpFetcher, parse_album_html
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class AlbumPageHandler(BaseHTTPRequestHandler):
+    """경로/쿼리와 상관없이 저장해 둔 앨범형 목록 페이지를 돌려줌"""
+
+    def do_GET(self):
+        with open(os.path.join(FIXTURES, "album_page.html"), "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def album_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AlbumPageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def expected_rows(base, category_name):
+    """브라우저(ALBUM_ITEMS_SCRIPT)가 같은 페이지에서 돌려주는 값 (innerText, 절대 href)"""
+    link = base + "/f-e/cafes/10050146/articles/{}?menuid=364&referrerAllArticles=false"
+    raw_items = [
+        {"title": "자라 트위드 자켓 S사이즈 팝니다", "price": "35,000원", "nickname": "옷장정리중",
+         "date": "14:14", "status": "판매중", "url": link.format(1087654321)},
+        {"title": "마르헨제이 숄더백 블랙", "price": "17,000원", "nickname": "가방부자",
+         "date": "2025.05.31.", "status": "예약중", "url": link.format(1087654300)},
+        {"title": "아이 옷 무료나눔해요", "price": None, "nickname": "나눔천사",
+         "date": "2025.05.30.", "status": None, "url": link.format(1087654288)},
+        {"title": "나이키 바람막이 L", "price": "20,000원", "nickname": "운동러",
+         "date": "2025.05.29.", "status": "판매완료", "url": link.format(1087654201)},
+    ]
+    return [make_album_row(raw, category_name) for raw in raw_items]
+
+
+def test_fetch_page_matches_browser_rows(album_server):
+    fetcher = AlbumHttpFetcher(retries=0)
+    try:
+        rows = fetcher.fetch_page(album_server + "/f-e/cafes/10050146/menus/364", 1, "여성패션_의류")
+    finally:
+        fetcher.close()
+
+    assert rows == expected_rows(album_server, "여성패션_의류")
+    assert [row["article_id"] for row in rows] == [1087654321, 1087654300, 1087654288, 1087654201]
+
+
+def test_parse_empty_page():
+    assert parse_album_html("", "여성패션_의류") == []
+    assert parse_album_html("<html><body><ul class='article-album-view'></ul></body></html>", "여성패션_의류") == []
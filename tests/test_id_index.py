@@ -0,0 +1,57 @@
+import os
+from id_index import ArticleIdIndex
+from sinks import CsvSink, ROW_FIELDS
+
+
+def test_add_and_lookup(tmp_path):
+    index = ArticleIdIndex(str(tmp_path / "ids.db"))
+    index.add_many([3, 1, None])
+    index.add_rows([{"article_id": 2, "category": "의류"}, {"article_id": None}, {"article_id": 3}])
+    assert len(index) == 3
+    assert 2 in index and 4 not in index and None not in index
+    assert index.known([1, 4, 5, 3]) == {1, 3}
+    # 500개 단위로 나눠 조회해도 같은 결과
+    index.add_many(range(1000, 2200))
+    assert len(index.known(range(0, 3000))) == 1203
+    index.close()
+
+    reopened = ArticleIdIndex(index.path)
+    assert 2 in reopened
+    reopened.close()
+
+
+def test_import_csv_files_only_rereads_changed_files(tmp_path, capsys):
+    path = str(tmp_path / "의류_1-300.csv")
+    sink = CsvSink(path, ROW_FIELDS)
+    sink.write_rows([{"article_id": 10}, {"article_id": 11}, {"article_id": None}])
+    sink.close()
+    index = ArticleIdIndex(str(tmp_path / "ids.db"))
+
+    index.import_csv_files(str(tmp_path / "*.csv"))
+    assert index.known([10, 11]) == {10, 11}
+    assert "2개의 ID 반영" in capsys.readouterr().out
+
+    index.import_csv_files(str(tmp_path / "*.csv"))
+    assert capsys.readouterr().out == ""
+
+    sink = CsvSink(path, ROW_FIELDS, append=True)
+    sink.write_rows([{"article_id": 12}])
+    sink.close()
+    os.utime(path, (0, 0))
+    index.import_csv_files(str(tmp_path / "*.csv"))
+    assert 12 in index
+    index.close()
+
+
+def test_high_water_only_moves_up(tmp_path):
+    index = ArticleIdIndex(str(tmp_path / "ids.db"))
+    assert index.get_high_water("menu:339") is None
+    index.set_high_water("menu:339", 500)
+    index.set_high_water("menu:339", 400)
+    index.set_high_water("menu:339", None)
+    index.set_high_water("menu:424", 10)
+    assert index.get_high_water("menu:339") == 500
+    assert index.get_high_water("menu:424") == 10
+    index.set_high_water("menu:339", 501)
+    index.close()
+    assert ArticleIdIndex(index.path).get_high_water("menu:339") == 501
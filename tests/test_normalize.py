@@ -0,0 +1,52 @@
+from datetime import datetime
+import pandas as pd
+import pytest
+from normalize import Status, parse_prices, status_codes, parse_posted_at, normalize_rows, parse_stop_date
+
+CRAWL_TIME = datetime(2025, 6, 2, 12, 30)
+
+
+def test_parse_prices():
+    prices = parse_prices(pd.Series(["17,000원", "1,200,000", "무료나눔", "", None]))
+    assert prices.tolist()[:2] == [17000, 1200000]
+    assert prices[2:].isna().all()
+
+
+def test_status_codes_prefers_sold_over_selling():
+    codes = status_codes(pd.Series(["판매중", "예약중", "판매완료", "거래완료", "", None]))
+    assert codes.tolist() == [Status.SELLING, Status.RESERVED, Status.SOLD, Status.SOLD, Status.UNKNOWN, Status.UNKNOWN]
+
+
+def test_parse_posted_at_relative_to_crawl_time():
+    posted = parse_posted_at(pd.Series(["2025.05.31.", "11:05", "23:50", "10분 전", "2시간 전", "방금 전"]), CRAWL_TIME)
+    assert posted.tolist() == [
+        pd.Timestamp(2025, 5, 31),
+        pd.Timestamp(2025, 6, 2, 11, 5),
+        pd.Timestamp(2025, 6, 1, 23, 50),  # 수집 시각보다 뒤인 시각은 전날 글
+        pd.Timestamp(2025, 6, 2, 12, 20),
+        pd.Timestamp(2025, 6, 2, 10, 30),
+        pd.Timestamp(CRAWL_TIME),
+    ]
+
+
+def test_normalize_rows_fills_typed_fields():
+    rows = [
+        {"status": "판매중", "price": "35,000원", "date": "14:14", "article_id": 1},
+        {"status": "", "price": "", "date": "2025.05.30.", "article_id": 2},
+    ]
+    normalize_rows(rows, CRAWL_TIME)
+    assert rows[0]["price_won"] == 35000
+    assert rows[0]["status_code"] == Status.SELLING
+    assert rows[0]["posted_at"] == datetime(2025, 6, 1, 14, 14)
+    assert rows[1]["price_won"] is None
+    assert rows[1]["status_code"] == Status.UNKNOWN
+    assert rows[1]["posted_at"] == datetime(2025, 5, 30)
+    assert isinstance(rows[0]["price_won"], int)
+
+
+def test_parse_stop_date():
+    assert parse_stop_date("2025.05.31") == datetime(2025, 5, 31)
+    assert parse_stop_date("2025-5-1") == datetime(2025, 5, 1)
+    assert parse_stop_date("") is None
+    with pytest.raises(ValueError):
+        parse_stop_date("5월 31일")
@@ -0,0 +1,39 @@
+from selenium.common.exceptions import InvalidCookieDomainException
+from session_store import apply_to_driver, cookie_matches_host
+
+
+class CookieDriver:
+    """현재 호스트에서 보이지 않는 쿠키를 거부하는 브라우저 흉내"""
+
+    def __init__(self):
+        self.cookies = []
+
+    def get(self, url):
+        self.url = url
+
+    def add_cookie(self, cookie):
+        if cookie.get("name") == "rejected":
+            raise InvalidCookieDomainException("invalid cookie domain")
+        self.cookies.append(cookie)
+
+
+def test_cookie_matches_host():
+    assert cookie_matches_host({"domain": ".naver.com"}, "cafe.naver.com")
+    assert cookie_matches_host({"domain": "cafe.naver.com"}, "cafe.naver.com")
+    assert cookie_matches_host({}, "cafe.naver.com")
+    assert not cookie_matches_host({"domain": "nid.naver.com"}, "cafe.naver.com")
+    assert not cookie_matches_host({"domain": "evilnaver.com"}, "cafe.naver.com")
+
+
+def test_apply_to_driver_skips_cookies_for_other_hosts():
+    driver = CookieDriver()
+    cookies = [
+        {"name": "NID_AUT", "value": "a", "domain": ".naver.com", "path": "/", "sameSite": "Lax"},
+        {"name": "nid_inf", "value": "b", "domain": "nid.naver.com", "path": "/"},
+        {"name": "rejected", "value": "c", "domain": ".naver.com"},
+        {"name": "NID_SES", "value": "d", "domain": ".naver.com", "path": "/"},
+    ]
+
+    assert apply_to_driver(driver, cookies) == 2
+    assert [c["name"] for c in driver.cookies] == ["NID_AUT", "NID_SES"]
+    assert "sameSite" not in driver.cookies[0]
@@ -0,0 +1,100 @@
+import os
+import io
+import csv
+from listing_store import ListingStore
+from sinks import CsvSink, ParquetSink, SqliteSink, ROW_FIELDS, open_sink
+
+
+def listing(article_id, status="판매중", price="10,000원", title="글"):
+    return {"category": "의류", "status": status, "title": f"{title} {article_id}", "price": price,
+            "nickname": "n", "date": "2025.05.31.", "url": f"https://cafe.naver.com/f-e/cafes/1/articles/{article_id}",
+            "article_id": article_id}
+
+
+def test_csv_append_keeps_one_header(tmp_path):
+    path = str(tmp_path / "의류_1-300.csv")
+    sink = CsvSink(path, ROW_FIELDS, flush_rows=2)
+    assert sink.write_rows([listing(1)]) is False
+    assert sink.write_rows([listing(2)]) is True
+    sink.close()
+
+    sink = CsvSink(path, ROW_FIELDS, append=True)
+    sink.write_rows([dict(listing(3), price=None)])
+    sink.close()
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert text.count("\ufeff") == 1
+    header, *rows = csv.reader(io.StringIO(text.lstrip("\ufeff")))
+    assert header == ROW_FIELDS
+    assert [row[-1] for row in rows] == ["1", "2", "3"]
+    # None은 빈 칸으로
+    assert rows[2][ROW_FIELDS.index("price")] == ""
+
+
+def test_csv_without_append_starts_over(tmp_path):
+    path = str(tmp_path / "out.csv")
+    for article_id in (1, 2):
+        sink = CsvSink(path, ["article_id"])
+        sink.write_rows([{"article_id": article_id}])
+        sink.close()
+    with open(path, encoding="utf-8-sig") as f:
+        assert f.read().splitlines() == ["article_id", "2"]
+
+
+def test_parquet_parts_keep_full_rows_and_min_row_groups(tmp_path):
+    import pyarrow.parquet as pq
+    path = str(tmp_path / "category=의류" / "crawl_date=2025-06-02")
+    # CSV용으로 줄인 컬럼을 넘겨도 Parquet에는 url/article_id까지 전체 저장
+    sink = open_sink("parquet", path, ["category", "status", "title"], flush_rows=3)
+    assert isinstance(sink, ParquetSink)
+    # open_sink은 flush_rows를 PARQUET_MIN_ROWS 이상으로 올리므로 작은 값으로 직접 줄임
+    sink.flush_rows = 3
+    sink.min_rows = 2
+    sink.flush_seconds = 0
+    # 시간이 지났어도 min_rows보다 적으면 part를 쓰지 않음
+    assert sink.write_rows([listing(1)]) is False
+    assert sink.write_rows([listing(2)]) is True
+    sink.write_rows([listing(3)])
+    sink.close()
+
+    parts = sorted(name for name in os.listdir(path) if name.endswith(".parquet"))
+    assert len(parts) == 2
+    tables = [pq.read_table(os.path.join(path, name)) for name in parts]
+    assert [t.num_rows for t in tables] == [2, 1]
+    assert tables[0].column("article_id").to_pylist() == [1, 2]
+    assert tables[0].column("price").to_pylist() == [10000, 10000]
+    assert tables[0].column("url").to_pylist()[0] == listing(1)["url"]
+    assert "category" not in tables[0].column_names
+    assert sink.rows_written == 3
+
+
+def test_sqlite_upserts_on_article_id(tmp_path):
+    path = str(tmp_path / "listings.db")
+    sink = SqliteSink(path)
+    sink.write_rows([listing(1), listing(2)])
+    sink.close()
+
+    sink = SqliteSink(path)
+    sink.write_rows([listing(2, status="판매완료", price="8,000원", title="바뀐 제목"), listing(3)])
+    sink.close()
+
+    store = ListingStore(path)
+    rows = {r[0]: r[1:] for r in store.conn.execute("SELECT article_id, status, price, title FROM listings")}
+    store.close()
+    assert sorted(rows) == [1, 2, 3]
+    # 다시 수집하면 상태/가격만 갱신하고 제목은 처음 값 유지
+    assert rows[2] == ("판매완료", 8000, "글 2")
+
+
+def test_sqlite_refresh_never_inserts(tmp_path):
+    path = str(tmp_path / "listings.db")
+    sink = SqliteSink(path)
+    sink.write_rows([listing(1)])
+    sink.refresh_rows([listing(1, status="예약중"), listing(99, title="필터로 제외된 글")])
+    sink.close()
+
+    store = ListingStore(path)
+    assert store.conn.execute("SELECT article_id, status FROM listings").fetchall() == [(1, "예약중")]
+    assert sink.rows_written == 1
+    store.close()
@@ -0,0 +1,54 @@
+import sqlite3
+from status_tracker import StatusTracker, MAX_FAILED_CHECKS
+
+NOW = 1748800000.0
+HOUR = 3600
+
+
+def test_failed_checks_move_last_checked_and_drop_after_limit(tmp_path):
+    tracker = StatusTracker(str(tmp_path / "tracker.db"))
+    tracker.observe([
+        {"article_id": 1, "category": "의류", "status": "판매중", "date": "2025.06.01."},
+        {"article_id": 2, "category": "의류", "status": "판매중", "date": "2025.06.01."},
+    ], now=NOW)
+    later = NOW + 10 * HOUR
+
+    assert tracker.record_failures([1], now=later) == 0
+    # 실패해도 확인한 것으로 보므로 같은 시각에는 실패한 글의 우선순위가 가장 낮음
+    assert [article_id for article_id, _, _ in tracker.pick_articles(2, now=later)] == [2, 1]
+    # 지켜본 시간은 판매 속도 추정에 그대로 누적
+    assert tracker.conn.execute("SELECT active_hours FROM category_rates").fetchone()[0] == 10
+
+    for i in range(1, MAX_FAILED_CHECKS - 1):
+        assert tracker.record_failures([1], now=later + i * HOUR) == 0
+    assert tracker.record_failures([1], now=later + MAX_FAILED_CHECKS * HOUR) == 1
+    assert [article_id for article_id, _, _ in tracker.pick_articles(10, now=later + 100 * HOUR)] == [2]
+    tracker.close()
+
+
+def test_successful_check_resets_failures(tmp_path):
+    tracker = StatusTracker(str(tmp_path / "tracker.db"))
+    tracker.observe([{"article_id": 1, "category": "의류", "status": "판매중"}], now=NOW)
+    for i in range(MAX_FAILED_CHECKS - 1):
+        tracker.record_failures([1], now=NOW + i * HOUR)
+    tracker.observe([{"article_id": 1, "category": "의류", "status": "예약중"}], now=NOW + 5 * HOUR)
+    tracker.record_failures([1], now=NOW + 6 * HOUR)
+    assert [article_id for article_id, _, _ in tracker.pick_articles(10, now=NOW + 30 * HOUR)] == [1]
+    tracker.close()
+
+
+def test_adds_failures_column_to_old_database(tmp_path):
+    path = str(tmp_path / "tracker.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE article_state (article_id INTEGER PRIMARY KEY, category TEXT, url TEXT, posted_at REAL,"
+        " first_seen REAL, last_status INTEGER, last_checked REAL, checks INTEGER) WITHOUT ROWID"
+    )
+    conn.execute("INSERT INTO article_state VALUES (1, '의류', NULL, NULL, ?, 1, ?, 1)", (NOW, NOW))
+    conn.commit()
+    conn.close()
+
+    tracker = StatusTracker(path)
+    tracker.record_failures([1], now=NOW + HOUR)
+    assert tracker.conn.execute("SELECT failures, checks FROM article_state").fetchone() == (1, 2)
+    tracker.close()
@@ -0,0 +1,39 @@
+import os
+import csv
+from sinks import CsvSink
+from total import combine_csv_files
+
+COLUMNS = ["category", "title", "date", "article_id"]
+
+
+def write_results(name, rows, columns=COLUMNS):
+    sink = CsvSink(os.path.join("results", name), columns)
+    sink.write_rows(rows)
+    sink.close()
+
+
+def test_combine_writes_header_once_and_filters_dates(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_results("도서_1-100.csv", [
+        {"category": "도서", "title": "a", "date": "2025.05.31.", "article_id": 1},
+        {"category": "도서", "title": "b", "date": "2025.05.29.", "article_id": 2},
+    ])
+    write_results("도서_101-200.csv", [
+        {"category": "도서", "title": "c", "date": "2025.06.01.", "article_id": 3},
+    ])
+    # 컬럼 순서가 다르고 일부 컬럼이 없는 파일도 첫 파일 컬럼 순서로 맞춤
+    write_results("도서_delta_20250602.csv", [
+        {"article_id": 4, "title": "d, 쉼표", "category": "도서"},
+    ], columns=["article_id", "title", "category"])
+
+    combine_csv_files("도서", workers=2)
+
+    with open(os.path.join("result_total", "도서_전체.csv"), encoding="utf-8-sig", newline="") as f:
+        header, *rows = csv.reader(f)
+    assert header == COLUMNS
+    assert sorted(rows) == sorted([
+        ["도서", "a", "2025.05.31.", "1"],
+        ["도서", "c", "2025.06.01.", "3"],
+        ["도서", "d, 쉼표", "", "4"],
+    ])
+    assert os.listdir("result_total") == ["도서_전체.csv"]
@@ -1,58 +1,126 @@
-import pandas as pd
 import glob
 import os
+import csv
+import shutil
+import tempfile
+import concurrent.futures
 
-def combine_csv_files(category_name):
+# 제외할 날짜 접두어 리스트
+EXCLUDE_PREFIXES = ['2025.05.27', '2025.05.28', '2025.05.29', '2025.05.30']
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def read_header(file):
+    with open(file, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+
+def filter_file(file, columns, part_path, exclude_prefixes, categories=None):
+    """
+    파일을 블록 단위로 읽으면서 날짜/카테고리 조건으로 거른 행을 헤더 없이 part_path에 기록.
+    (읽은 행 수, 제외된 행 수, 제외된 날짜 예시) 반환
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+
+    header = read_header(file)
+    # 모든 컬럼을 문자열로 읽어 "17,000" 같은 값이나 빈 칸이 원본 그대로 유지되도록 함
+    reader = pa_csv.open_csv(
+        file,
+        read_options=pa_csv.ReadOptions(block_size=BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header}),
+    )
+    schema = pa.schema([(name, pa.string()) for name in columns])
+    total = removed = 0
+    examples = set()
+    with open(part_path, 'wb') as f:
+        writer = pa_csv.CSVWriter(f, schema, write_options=pa_csv.WriteOptions(include_header=False))
+        for batch in reader:
+            total += batch.num_rows
+            table = pa.Table.from_batches([batch])
+            keep = None
+            if exclude_prefixes and 'date' in header:
+                excluded = None
+                for prefix in exclude_prefixes:
+                    starts = pc.starts_with(table['date'], prefix)
+                    excluded = starts if excluded is None else pc.or_(excluded, starts)
+                excluded = pc.fill_null(excluded, False)
+                if len(examples) < 5:
+                    examples.update(pc.unique(table.filter(excluded)['date']).to_pylist()[:5 - len(examples)])
+                keep = pc.invert(excluded)
+            if categories and 'category' in header:
+                in_category = pc.is_in(table['category'], value_set=pa.array(categories, pa.string()))
+                keep = in_category if keep is None else pc.and_(keep, in_category)
+            if keep is not None:
+                filtered = table.filter(keep)
+                removed += table.num_rows - filtered.num_rows
+                table = filtered
+            # 파일마다 컬럼 순서가 달라도 첫 파일의 컬럼 순서로 맞추고, 없는 컬럼은 빈 값
+            table = pa.table({
+                name: table[name] if name in table.column_names else pa.nulls(table.num_rows, pa.string())
+                for name in columns
+            }, schema=schema)
+            writer.write_table(table)
+        writer.close()
+    return total, removed, sorted(examples)
+
+
+def combine_csv_files(category_name, exclude_prefixes=EXCLUDE_PREFIXES, categories=None, workers=None):
     # 결과를 저장할 디렉토리 생성
     output_dir = "result_total"
     os.makedirs(output_dir, exist_ok=True)
-    
+
     # 입력받은 카테고리로 시작하는 모든 CSV 파일 찾기
     pattern = f"results/{category_name}_*.csv"
-    csv_files = glob.glob(pattern)
-    
+    csv_files = sorted(glob.glob(pattern))
+
     if not csv_files:
         print(f"'{category_name}'으로 시작하는 CSV 파일을 찾을 수 없습니다.")
         return
-    
-    # 제외할 날짜 접두어 리스트
-    exclude_prefixes = ['2025.05.27', '2025.05.28', '2025.05.29', '2025.05.30']
-    
-    # 파일들을 데이터프레임으로 읽어서 리스트에 저장
-    dfs = []
-    for i, file in enumerate(csv_files):
-        try:
-            df = pd.read_csv(file, encoding='utf-8-sig')
-            if i > 0:  # 첫 번째 파일이 아닌 경우
-                df = df.iloc[1:]  # 헤더 제외
-            
-            # 제외할 날짜로 시작하는 행 마스킹
-            mask = df['date'].astype(str).str.startswith(tuple(exclude_prefixes))
-            removed = df[mask]
-            print(f"[{os.path.basename(file)}] 제외된 행: {len(removed)}개 (예시: {removed['date'].unique()[:5]})")
-            
-            # 제외
-            df = df[~mask]
-            
-            dfs.append(df)
-            print(f"파일 로드 완료: {file}")
-        except Exception as e:
-            print(f"파일 로드 중 오류 발생 ({file}): {e}")
-    
-    if not dfs:
-        print("데이터를 로드할 수 없습니다.")
-        return
-    
-    # 모든 데이터프레임 합치기
-    combined_df = pd.concat(dfs, ignore_index=True)
-    
-    # 결과 파일 저장
+
+    columns = read_header(csv_files[0])
     output_file = f"{output_dir}/{category_name}_전체.csv"
-    combined_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    tmp_dir = tempfile.mkdtemp(prefix="total_", dir=output_dir)
+    try:
+        # 파일들을 여러 스레드에서 동시에 읽어 각자 임시 파일로 거르고(pyarrow는 GIL을 놓고 읽음)
+        parts = {file: os.path.join(tmp_dir, f"part_{i:05d}.csv") for i, file in enumerate(csv_files)}
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(filter_file, file, columns, parts[file], exclude_prefixes, categories): file
+                for file in csv_files
+            }
+            for future in concurrent.futures.as_completed(futures):
+                file = futures[future]
+                try:
+                    results[file] = future.result()
+                    total, removed, examples = results[file]
+                    print(f"[{os.path.basename(file)}] 제외된 행: {removed}개 (예시: {examples})")
+                    print(f"파일 로드 완료: {file}")
+                except Exception as e:
+                    print(f"파일 로드 중 오류 발생 ({file}): {e}")
+
+        if not results:
+            print("데이터를 로드할 수 없습니다.")
+            return
+
+        # 헤더는 한 번만 쓰고 임시 파일들을 파일 순서대로 이어붙임 (메모리에 모으지 않음)
+        with open(output_file, 'w', newline='', encoding='utf-8-sig') as out:
+            csv.writer(out, lineterminator='\n').writerow(columns)
+        with open(output_file, 'ab') as out:
+            for file in csv_files:
+                if file in results:
+                    with open(parts[file], 'rb') as part:
+                        shutil.copyfileobj(part, out)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    total_rows = sum(total - removed for total, removed, _ in results.values())
     print(f"\n✅ 파일 병합 완료: {output_file}")
-    print(f"총 {len(combined_df)}개의 행이 저장되었습니다.")
-    print(f"총 병합된 파일 개수: {len(csv_files)}개")
+    print(f"총 {total_rows}개의 행이 저장되었습니다.")
+    print(f"총 병합된 파일 개수: {len(results)}개")
 
 if __name__ == "__main__":
     category_name = input("카테고리명을 입력하세요 (예: 도서, 중고폰, 스타굿즈 등): ").strip()
-    combine_csv_files(category_name) 
\ No newline at end of file
+    combine_csv_files(category_name)
@@ -0,0 +1,64 @@
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+
+class WaitStats:
+    """대기마다 실제로 걸린 시간과, 고정 sleep 대비 절약한 시간을 기록"""
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, label, elapsed, timed_out=False, baseline=None):
+        self.records.append({
+            "label": label,
+            "elapsed": elapsed,
+            "timed_out": timed_out,
+            "baseline": baseline,
+        })
+
+    def summary(self):
+        total = sum(r["elapsed"] for r in self.records)
+        saved = sum(r["baseline"] - r["elapsed"] for r in self.records if r["baseline"] is not None)
+        timeouts = sum(1 for r in self.records if r["timed_out"])
+        return {
+            "count": len(self.records),
+            "total_wait": total,
+            "avg_wait": total / len(self.records) if self.records else 0.0,
+            "saved": saved,
+            "timeouts": timeouts,
+        }
+
+    def report(self):
+        s = self.summary()
+        return (f"대기 {s['count']}회, 총 {s['total_wait']:.2f}초 (평균 {s['avg_wait']:.2f}초), "
+                f"고정 sleep 대비 절약 {s['saved']:.2f}초, 타임아웃 {s['timeouts']}회")
+
+
+# 기본 기록 객체 (스크립트 전체에서 공유)
+wait_stats = WaitStats()
+
+
+def _timed_wait(driver, condition, label, timeout, baseline, stats):
+    stats = stats if stats is not None else wait_stats
+    start_time = time.time()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+        stats.record(label, time.time() - start_time, baseline=baseline)
+        return result
+    except TimeoutException:
+        stats.record(label, time.time() - start_time, timed_out=True, baseline=baseline)
+        return None
+
+
+def wait_for_selector(driver, selector, timeout=DEFAULT_TIMEOUT, by=By.CSS_SELECTOR, baseline=None, stats=None):
+    """선택자가 나타나는 즉시 반환 (시간 초과 시 None)"""
+    return _timed_wait(
+        driver, EC.presence_of_element_located((by, selector)),
+        f"selector:{selector}", timeout, baseline, stats,
+    )
+